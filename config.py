@@ -39,6 +39,8 @@ class Settings(BaseSettings):
 
         DATAFORGE_BASE_URL: DataForge API base URL
         DATAFORGE_TIMEOUT: Request timeout in seconds
+        DATAFORGE_MAX_CONNECTIONS: DataForge connection pool size
+        DATAFORGE_PACKED_VECTORS: Send embedding vectors as one float32 buffer
 
         OPENAI_API_KEY: OpenAI API key for embeddings
         OPENAI_EMBEDDING_MODEL: Embedding model name
@@ -81,6 +83,16 @@ class Settings(BaseSettings):
     # DataForge Service
     DATAFORGE_BASE_URL: str = "http://localhost:8001"
     DATAFORGE_TIMEOUT: int = Field(default=30, ge=1, le=300)
+    DATAFORGE_MAX_CONNECTIONS: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="Max concurrent connections to DataForge, all kept alive between requests"
+    )
+    DATAFORGE_PACKED_VECTORS: bool = Field(
+        default=False,
+        description="Send each embedding batch's vectors as one base64 float32 buffer instead of JSON float lists"
+    )
     DATAFORGE_DB_PATH: str = Field(
         default="/home/charles/projects/Coding2025/Forge/DataForge/dataforge.db",
         description="Path to DataForge SQLite database for telemetry"
@@ -228,6 +240,66 @@ class Settings(BaseSettings):
     RETRY_ATTEMPTS: int = Field(default=3, ge=1, le=10)
     RETRY_DELAY: float = Field(default=1.0, ge=0.1, le=60.0)
     RETRY_BACKOFF: float = Field(default=2.0, ge=1.0, le=10.0)
+    RETRY_MAX_DELAY: float = Field(
+        default=30.0,
+        ge=0.1,
+        le=300.0,
+        description="Cap on the jittered backoff between source fetch retries (seconds)"
+    )
+    FETCH_MAX_CONCURRENCY: int = Field(
+        default=32,
+        ge=1,
+        le=1024,
+        description="Max concurrent source fetches per process"
+    )
+    EMBED_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=256,
+        description="Max concurrent embed stages per process (size to the provider's rate limit)"
+    )
+    HEALTHCHECK_TIMEOUT: float = Field(
+        default=5.0,
+        ge=0.1,
+        le=60.0,
+        description="Timeout for each source adapter health probe (seconds)"
+    )
+    HEALTHCHECK_TTL_SEC: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        description="How long a source adapter health result is reused (seconds, 0 disables)"
+    )
+    STORE_META_CONCURRENCY: int = Field(
+        default=16,
+        ge=1,
+        le=256,
+        description="Max concurrent per-document metadata writes when DataForge has no batch endpoint"
+    )
+    PIPELINE_QUEUE_SIZE: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Embedding batches buffered between the embed and store stages"
+    )
+    HTTP_POOL_MAX_CONNECTIONS: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Max open connections in the HTTP pool shared by source adapters"
+    )
+    HTTP_POOL_MAX_KEEPALIVE: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Max idle keep-alive connections in the shared HTTP pool"
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description="Seconds an idle connection stays in the shared HTTP pool"
+    )
 
     # Chunking Configuration
     CHUNK_SIZE: int = Field(default=500, ge=100, le=2000, description="Default chunk size in tokens")
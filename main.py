@@ -35,14 +35,15 @@ from fastapi.responses import JSONResponse
 import uvicorn
 
 from config import settings
+from pipeline.context import ContextFilter
 
-# Configure logging
+# Configure logging; records carry the current job's IDs (see pipeline.context)
+log_handler = logging.StreamHandler(sys.stdout)
+log_handler.addFilter(ContextFilter())
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[log_handler]
 )
 
 logger = logging.getLogger(__name__)
@@ -180,6 +181,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             except Exception as e:
                 logger.error(f"Error closing database: {str(e)}", extra={"correlation_id": correlation_id})
 
+            # Close the shared DataForge connection pool
+            try:
+                from services.dataforge_client import get_dataforge_client
+                await get_dataforge_client().close()
+            except Exception as e:
+                logger.error(f"Error closing DataForge client: {str(e)}", extra={"correlation_id": correlation_id})
+
+            # Write telemetry events still queued for the background writer
+            try:
+                from services.telemetry_db_client import telemetry
+                await telemetry.close()
+            except Exception as e:
+                logger.error(f"Error flushing telemetry: {str(e)}", extra={"correlation_id": correlation_id})
+
             # Shutdown scheduler gracefully (if implemented)
             # TODO: Shutdown scheduler gracefully
 
@@ -20,7 +20,7 @@ Example:
     ... )
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -28,6 +28,35 @@ from uuid import uuid4
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
+class FrozenMetadata(dict):
+    """Read-only metadata dict shared by many models.
+
+    Chunks of the same document carry identical metadata, so the chunker
+    builds one FrozenMetadata per document and every chunk references it.
+    Sharing is only safe if nobody mutates it, so mutating methods raise
+    TypeError. It is still a dict, so Pydantic serializes it normally and
+    ``{**metadata, ...}`` produces a regular, mutable dict.
+
+    Example:
+        >>> metadata = FrozenMetadata({"filename": "report.pdf"})
+        >>> metadata["filename"]
+        'report.pdf'
+        >>> metadata["filename"] = "other.pdf"
+        Traceback (most recent call last):
+        TypeError: FrozenMetadata is read-only
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("FrozenMetadata is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Rebuild from a plain dict so copy/pickle never call __setitem__
+        return (type(self), (dict(self),))
+
+
 class DocumentSource(str, Enum):
     """Source types for document ingestion.
 
@@ -206,6 +235,9 @@ class Chunk(BaseModel):
         ... )
     """
 
+    # Chunks are never modified after the CHUNK stage creates them
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(default_factory=lambda: f"chunk-{uuid4().hex[:12]}")
     document_id: str
     content: str = Field(..., min_length=1)
@@ -374,7 +406,10 @@ class PipelineJob(BaseModel):
         ... )
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    # The orchestrator updates status and stage fields on every stage
+    # transition; keep those assignments plain attribute stores rather
+    # than validator calls
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=False)
 
     job_id: str = Field(default_factory=lambda: f"job-{uuid4().hex[:12]}")
     document_id: str
@@ -385,7 +420,7 @@ class PipelineJob(BaseModel):
     error_message: Optional[str] = None
     retry_count: int = Field(default=0, ge=0)
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
     tenant_id: Optional[str] = None
     correlation_id: str = Field(default_factory=lambda: str(uuid4()))
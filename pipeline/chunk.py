@@ -18,18 +18,112 @@ Example:
     ... )
 """
 
+import asyncio
 import logging
 import re
 import time
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import accumulate
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from models.document import CleanedDocument, Chunk
+from models.document import CleanedDocument, Chunk, FrozenMetadata
+from pipeline.stats import StageStats
 from services.telemetry_db_client import telemetry
 from config import settings
+from utils.ids import id_pool
 
 logger = logging.getLogger(__name__)
 
+# Boundary patterns capture the separator in group 1; anything matched
+# outside it stays with the preceding segment.
+# Paragraph break: a blank line, tolerating stray spaces, tabs and CRs on it
+_PARAGRAPH_RE = re.compile(r'(\n[ \t\r]*\n)')
+
+# Sentence break: whitespace following a sentence terminator (. ! ?). Leading
+# with the terminator class lets the engine skip ahead to candidate positions
+# instead of evaluating a lookbehind at every character.
+_SENTENCE_RE = re.compile(r'[.!?](\s+)')
+
+# (text, start_char, end_char) of a stripped segment within a document
+Span = Tuple[str, int, int]
+
+# (text, tokens, start_char, end_char) of a segment ready to be packed
+Unit = Tuple[str, int, int, int]
+
+
+def _split_spans(text: str, separator: re.Pattern, base: int = 0) -> List[Span]:
+    """Split text on a separator pattern, keeping each piece's offsets.
+
+    Pieces between separators are stripped and empty pieces dropped, and
+    the start/end of every piece in the original text is recorded.
+
+    Args:
+        text: Text to split
+        separator: Compiled pattern whose group 1 is the separator
+        base: Offset of ``text`` within the enclosing document
+
+    Returns:
+        List of (piece, start, end) tuples with absolute offsets
+    """
+    spans: List[Span] = []
+    pos = 0
+    for match in separator.finditer(text):
+        _append_stripped(spans, text, pos, match.start(1), base)
+        pos = match.end(1)
+    _append_stripped(spans, text, pos, len(text), base)
+    return spans
+
+
+def _append_stripped(spans: List[Span], text: str, start: int, end: int, base: int) -> None:
+    """Append text[start:end] to spans with surrounding whitespace trimmed."""
+    piece = text[start:end]
+    stripped = piece.strip()
+    if stripped:
+        start += len(piece) - len(piece.lstrip())
+        spans.append((stripped, base + start, base + start + len(stripped)))
+
+
+def _char_boundary(data: bytes, pos: int) -> int:
+    """Move a byte offset in UTF-8 data forward to the next character start."""
+    while pos < len(data) and 0x80 <= data[pos] < 0xC0:
+        pos += 1
+    return pos
+
+
+# Use tiktoken for real token counts when available; the encoder is loaded on
+# first use (it may need to fetch its BPE file) and shared across stages.
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+TOKENIZER_MODEL = "cl100k_base"
+_encoder = None
+_encoder_loaded = False
+
+
+def _get_encoder():
+    """Return the shared tiktoken encoder, or None to use the length heuristic.
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken or its encoding is unavailable
+    """
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        if TIKTOKEN_AVAILABLE:
+            try:
+                _encoder = tiktoken.get_encoding(TOKENIZER_MODEL)
+            except Exception as e:
+                logger.warning(
+                    f"Could not load tiktoken encoding '{TOKENIZER_MODEL}', "
+                    f"estimating tokens from text length: {e}"
+                )
+        _encoder_loaded = True
+    return _encoder
+
 # Import semantic chunker for advanced chunking strategies
 try:
     from pipeline.semantic_chunker import SemanticChunker, ChunkingStrategy
@@ -80,7 +174,8 @@ class ChunkStage:
         respect_paragraphs: bool = True,
         min_chunk_size: int = 50,
         strategy: str = "legacy",
-        similarity_threshold: float = 0.5
+        similarity_threshold: float = 0.5,
+        max_concurrency: Optional[int] = None
     ):
         """Initialize chunk stage.
 
@@ -92,6 +187,7 @@ class ChunkStage:
             min_chunk_size: Minimum chunk size in tokens
             strategy: Chunking strategy - "legacy", "token", "semantic", or "hybrid"
             similarity_threshold: Threshold for semantic boundaries (0-1)
+            max_concurrency: Documents chunked at once (default from settings)
 
         Example:
             >>> # Legacy chunking (original implementation)
@@ -104,12 +200,13 @@ class ChunkStage:
             >>> stage = ChunkStage(chunk_size=500, strategy="hybrid")
         """
         self.chunk_size = chunk_size or settings.CHUNK_SIZE
-        self.overlap = overlap or settings.CHUNK_OVERLAP
+        self.overlap = overlap if overlap is not None else settings.CHUNK_OVERLAP
         self.respect_sentences = respect_sentences
         self.respect_paragraphs = respect_paragraphs
         self.min_chunk_size = min_chunk_size
         self.strategy = strategy
         self.similarity_threshold = similarity_threshold
+        self.max_concurrency = max_concurrency or settings.MAX_WORKERS
         self.logger = logging.getLogger(__name__)
 
         # Validate chunk size and overlap
@@ -140,8 +237,8 @@ class ChunkStage:
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
-        Uses a simple heuristic: ~4 characters per token for English text.
-        For production, consider using tiktoken for accurate counts.
+        Counts tokens with tiktoken when available, otherwise falls back to
+        a simple heuristic: ~4 characters per token for English text.
 
         Args:
             text: Text to estimate tokens for
@@ -152,10 +249,36 @@ class ChunkStage:
         Example:
             >>> tokens = stage._estimate_tokens("Hello world")
             >>> print(tokens)
-            3
+            2
         """
+        encoder = _get_encoder()
+        if encoder is not None:
+            return max(1, len(encoder.encode_ordinary(text)))
         # Simple estimation: average 4 chars per token
-        return max(1, len(text) // 4)
+        return max(1, len(text) >> 2)
+
+    def _estimate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Estimate token counts for many texts at once.
+
+        Texts are encoded in a plain loop: this runs inside the stage's
+        worker threads, which already chunk MAX_WORKERS documents at once,
+        so a thread pool per call would only nest pools and add overhead.
+
+        Args:
+            texts: Texts to estimate tokens for
+
+        Returns:
+            Estimated token count per text, in input order
+
+        Example:
+            >>> stage._estimate_tokens_batch(["Hello world", "Hi"])
+            [2, 1]
+        """
+        encoder = _get_encoder()
+        if encoder is not None:
+            encode = encoder.encode_ordinary
+            return [max(1, len(encode(text))) for text in texts]
+        return [max(1, len(text) >> 2) for text in texts]
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences.
@@ -171,10 +294,25 @@ class ChunkStage:
             >>> print(len(sentences))
             3
         """
+        return [sentence for sentence, _, _ in self._sentence_spans(text)]
+
+    def _sentence_spans(self, text: str, base: int = 0) -> List[Span]:
+        """Split text into sentences with their character offsets.
+
+        Args:
+            text: Text to split
+            base: Offset of ``text`` within the document
+
+        Returns:
+            List of (sentence, start_char, end_char) tuples
+
+        Example:
+            >>> stage._sentence_spans("Hello. World.")
+            [('Hello.', 0, 6), ('World.', 7, 13)]
+        """
         # Simple sentence splitting (can be improved with NLTK for better accuracy)
         # Handles common sentence endings: . ! ?
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return _split_spans(text, _SENTENCE_RE, base)
 
     def _split_into_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs.
@@ -190,8 +328,27 @@ class ChunkStage:
             >>> print(len(paragraphs))
             2
         """
-        paragraphs = text.split('\n\n')
-        return [p.strip() for p in paragraphs if p.strip()]
+        return [paragraph for paragraph, _, _ in self._paragraph_spans(text)]
+
+    def _paragraph_spans(self, text: str) -> List[Span]:
+        """Split text into paragraphs with their character offsets.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (paragraph, start_char, end_char) tuples
+
+        Example:
+            >>> stage._paragraph_spans("Para 1\\n\\nPara 2")
+            [('Para 1', 0, 6), ('Para 2', 8, 14)]
+        """
+        # A paragraph break needs two newlines; skip the regex when there aren't
+        if text.count('\n') < 2:
+            spans: List[Span] = []
+            _append_stripped(spans, text, 0, len(text), 0)
+            return spans
+        return _split_spans(text, _PARAGRAPH_RE)
 
     def _create_chunks(
         self,
@@ -212,145 +369,250 @@ class ChunkStage:
         chunks: List[Chunk] = []
         content = document.content
 
+        # Fast path: a document that fits in one chunk needs no segmentation.
+        # Longer texts can't plausibly fit, so don't count their tokens twice.
+        if len(content) <= self.chunk_size * 8:
+            stripped = content.strip()
+            total_tokens = self._estimate_tokens(stripped)
+            if stripped and self.min_chunk_size <= total_tokens <= self.chunk_size:
+                start = len(content) - len(content.lstrip())
+                return [self._create_chunk(
+                    document=document,
+                    content=stripped,
+                    position=0,
+                    start_char=start,
+                    end_char=start + len(stripped),
+                    token_count=total_tokens
+                )]
+
         # Start with paragraphs if respect_paragraphs is True
         if self.respect_paragraphs:
-            segments = self._split_into_paragraphs(content)
+            segments = self._paragraph_spans(content)
         elif self.respect_sentences:
-            segments = self._split_into_sentences(content)
+            segments = self._sentence_spans(content)
         else:
             # Simple character-based chunking
-            segments = [content]
-
-        current_chunk = []
-        current_tokens = 0
-        chunk_position = 0
-        char_offset = 0
-
-        for segment in segments:
-            segment_tokens = self._estimate_tokens(segment)
-
-            # If segment alone exceeds chunk_size, split it further
-            if segment_tokens > self.chunk_size:
-                # If we have a current chunk, save it first
-                if current_chunk:
-                    chunk_text = ' '.join(current_chunk) if self.respect_sentences else '\n\n'.join(current_chunk)
-                    chunk_start = char_offset - len(chunk_text)
-                    chunks.append(self._create_chunk(
-                        document=document,
-                        content=chunk_text,
-                        position=chunk_position,
-                        start_char=chunk_start,
-                        end_char=char_offset
-                    ))
-                    chunk_position += 1
-                    current_chunk = []
-                    current_tokens = 0
-
-                # Split large segment by sentences or characters
-                if self.respect_sentences:
-                    sentences = self._split_into_sentences(segment)
-                    for sentence in sentences:
-                        sentence_tokens = self._estimate_tokens(sentence)
-                        if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
-                            # Save current chunk
-                            chunk_text = ' '.join(current_chunk)
-                            chunk_start = char_offset - len(chunk_text)
-                            chunks.append(self._create_chunk(
-                                document=document,
-                                content=chunk_text,
-                                position=chunk_position,
-                                start_char=chunk_start,
-                                end_char=char_offset
-                            ))
-                            chunk_position += 1
-                            # Start new chunk with overlap
-                            if self.overlap > 0 and current_chunk:
-                                overlap_text = ' '.join(current_chunk[-(self.overlap//4):])
-                                current_chunk = [overlap_text, sentence]
-                                current_tokens = self._estimate_tokens(overlap_text) + sentence_tokens
-                            else:
-                                current_chunk = [sentence]
-                                current_tokens = sentence_tokens
-                        else:
-                            current_chunk.append(sentence)
-                            current_tokens += sentence_tokens
-                else:
-                    # Character-based splitting for very large segments
-                    for i in range(0, len(segment), self.chunk_size * 4):
-                        chunk_text = segment[i:i + self.chunk_size * 4]
-                        chunks.append(self._create_chunk(
-                            document=document,
-                            content=chunk_text,
-                            position=chunk_position,
-                            start_char=char_offset + i,
-                            end_char=char_offset + i + len(chunk_text)
-                        ))
-                        chunk_position += 1
-
-                char_offset += len(segment) + 2  # +2 for paragraph separator
+            segments = []
+            _append_stripped(segments, content, 0, len(content), 0)
+
+        chunk_size = self.chunk_size
+        estimate_tokens_batch = self._estimate_tokens_batch
+        respect_sentences = self.respect_sentences
+
+        # Segments that are already sentences cannot be split any finer by
+        # the sentence splitter, so oversize ones go straight to characters
+        sentence_level = respect_sentences and not self.respect_paragraphs
+
+        # Estimate all segments in one batch; offsets come from the source
+        segment_tokens = estimate_tokens_batch([text for text, _, _ in segments])
+
+        # Every chunk of this document shares the same metadata; build it once
+        base_metadata = self._chunk_metadata(document)
+
+        # One random prefix per document; chunk positions make IDs unique
+        id_prefix = f"chunk-{id_pool.next_hex12()}"
+
+        separator = ' ' if respect_sentences else '\n\n'
+
+        # Consecutive (text, tokens, start, end) units packed together. A run
+        # is only broken by an oversize segment, which flushes it first.
+        run: List[Unit] = []
+
+        for (segment, seg_start, seg_end), seg_tokens in zip(segments, segment_tokens):
+            if seg_tokens <= chunk_size:
+                run.append((segment, seg_tokens, seg_start, seg_end))
                 continue
 
-            # Add segment to current chunk if it fits
-            if current_tokens + segment_tokens <= self.chunk_size:
-                current_chunk.append(segment)
-                current_tokens += segment_tokens
-            else:
-                # Save current chunk
-                if current_chunk:
-                    chunk_text = ' '.join(current_chunk) if self.respect_sentences else '\n\n'.join(current_chunk)
-                    chunk_start = char_offset - len(chunk_text)
+            # Segment alone exceeds chunk_size: save the current chunk first
+            self._pack_units(document, run, chunks, base_metadata, separator, id_prefix)
+            run = []
+
+            if sentence_level or not respect_sentences:
+                # Token-window splitting for very large segments
+                for chunk_text, piece_tokens, start, end in self._split_by_tokens(segment):
                     chunks.append(self._create_chunk(
                         document=document,
                         content=chunk_text,
-                        position=chunk_position,
-                        start_char=chunk_start,
-                        end_char=char_offset
+                        position=len(chunks),
+                        start_char=seg_start + start,
+                        end_char=seg_start + end,
+                        metadata=base_metadata,
+                        id_prefix=id_prefix,
+                        token_count=piece_tokens
                     ))
-                    chunk_position += 1
-
-                # Start new chunk with overlap
-                if self.overlap > 0 and current_chunk:
-                    overlap_segments = current_chunk[-(max(1, len(current_chunk) // 4)):]
-                    current_chunk = overlap_segments + [segment]
-                    current_tokens = sum(self._estimate_tokens(s) for s in current_chunk)
-                else:
-                    current_chunk = [segment]
-                    current_tokens = segment_tokens
-
-            char_offset += len(segment) + 2  # +2 for paragraph separator
-
-        # Save final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk) if self.respect_sentences else '\n\n'.join(current_chunk)
-            # Only save if above minimum size
-            if self._estimate_tokens(chunk_text) >= self.min_chunk_size:
-                chunk_start = max(0, char_offset - len(chunk_text))
-                chunks.append(self._create_chunk(
-                    document=document,
-                    content=chunk_text,
-                    position=chunk_position,
-                    start_char=chunk_start,
-                    end_char=char_offset
-                ))
+                continue
+
+            # Pack the large segment sentence by sentence
+            sentences = self._sentence_spans(segment, seg_start)
+            sentence_tokens = estimate_tokens_batch([text for text, _, _ in sentences])
+            run.extend(
+                (text, tokens, start, end)
+                for (text, start, end), tokens in zip(sentences, sentence_tokens)
+            )
+
+        self._pack_units(document, run, chunks, base_metadata, separator, id_prefix, final=True)
 
         return chunks
 
+    def _split_by_tokens(self, text: str) -> List[Unit]:
+        """Split text into consecutive pieces of at most chunk_size tokens.
+
+        The text is encoded once and the token ids are cut into windows of
+        chunk_size. Window edges are found as byte offsets and moved forward
+        to the next character start when a token splits a character, as in
+        SemanticChunker._chunk_token_based. Without tiktoken the text is cut
+        every chunk_size * 4 characters, matching the length heuristic.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (piece, token_count, start_char, end_char) tuples, with
+            offsets relative to ``text``
+
+        Example:
+            >>> stage._split_by_tokens("Hello world")
+            [('Hello world', 2, 0, 11)]
+        """
+        chunk_size = self.chunk_size
+        encoder = _get_encoder()
+        if encoder is None:
+            step = chunk_size * 4
+            return [
+                (text[i:i + step], max(1, len(text[i:i + step]) >> 2), i, min(i + step, len(text)))
+                for i in range(0, len(text), step)
+            ]
+
+        ids = encoder.encode_ordinary(text)
+        data = text.encode("utf-8")
+        pieces: List[Unit] = []
+        token_byte = 0  # Byte offset just past the tokens consumed so far
+        start_byte = 0  # Piece start, on a character boundary
+        start_char = 0
+        pending = 0  # Tokens of windows that ended inside one character
+
+        for start in range(0, len(ids), chunk_size):
+            window = ids[start:start + chunk_size]
+            token_byte += len(encoder.decode_bytes(window))
+            pending += len(window)
+            end_byte = _char_boundary(data, token_byte)
+            # A tiny window can fall entirely inside one character
+            if end_byte > start_byte:
+                piece = data[start_byte:end_byte].decode("utf-8")
+                pieces.append((piece, pending, start_char, start_char + len(piece)))
+                start_char += len(piece)
+                start_byte = end_byte
+                pending = 0
+
+        return pieces
+
+    def _pack_units(
+        self,
+        document: CleanedDocument,
+        units: List[Unit],
+        chunks: List[Chunk],
+        metadata: Dict[str, Any],
+        separator: str,
+        id_prefix: Optional[str] = None,
+        final: bool = False
+    ) -> None:
+        """Greedily pack consecutive units into overlapping chunks.
+
+        Works on prefix sums of the unit token counts, so each chunk boundary
+        is a binary search rather than a per-unit loop. A chunk takes every
+        unit that fits in chunk_size (and always at least one new unit); the
+        next chunk starts with the longest run of trailing units that fits in
+        the overlap budget. Text is only joined for emitted chunks, and each
+        chunk's token count is the sum of its units' counts.
+
+        Args:
+            document: Parent document
+            units: (text, tokens, start_char, end_char) units in order
+            chunks: Output list; new chunks are appended in position order
+            metadata: Shared chunk metadata
+            separator: String placed between unit texts
+            id_prefix: Per-document chunk ID prefix
+            final: Whether these are the document's last units, in which case
+                a trailing chunk below min_chunk_size is dropped
+        """
+        if not units:
+            return
+
+        prefix = [0, *accumulate(unit[1] for unit in units)]
+        count = len(units)
+        chunk_size = self.chunk_size
+        overlap = self.overlap
+        start = 0
+        end = 0
+
+        while end < count:
+            end = max(end + 1, bisect_right(prefix, prefix[start] + chunk_size, start + 1) - 1)
+
+            if final and end == count and prefix[end] - prefix[start] < self.min_chunk_size:
+                break
+
+            chunk_units = units[start:end]
+            chunks.append(self._create_chunk(
+                document=document,
+                content=separator.join(unit[0] for unit in chunk_units),
+                position=len(chunks),
+                start_char=chunk_units[0][2],
+                end_char=chunk_units[-1][3],
+                metadata=metadata,
+                id_prefix=id_prefix,
+                token_count=prefix[end] - prefix[start]
+            ))
+
+            # Seed the next chunk with the trailing units within the overlap
+            start = bisect_left(prefix, prefix[end] - overlap, 0, end) if overlap > 0 else end
+
+    def _chunk_metadata(self, document: CleanedDocument) -> FrozenMetadata:
+        """Build the metadata shared by every chunk of a document.
+
+        The result is read-only so a single instance can be referenced by
+        all of the document's chunks.
+
+        Args:
+            document: Parent document
+
+        Returns:
+            Document metadata extended with chunking parameters
+        """
+        return FrozenMetadata({
+            **document.metadata,
+            "chunk_strategy": "token_based",
+            "chunk_size_tokens": self.chunk_size,
+            "overlap_tokens": self.overlap
+        })
+
     def _create_chunk(
         self,
         document: CleanedDocument,
         content: str,
         position: int,
         start_char: int,
-        end_char: int
+        end_char: int,
+        metadata: Optional[Dict[str, Any]] = None,
+        id_prefix: Optional[str] = None,
+        token_count: Optional[int] = None
     ) -> Chunk:
         """Create a Chunk object.
 
+        Skips Pydantic validation: _create_chunks only produces non-empty
+        content with end_char > start_char, so the model's checks are
+        guaranteed to pass and would only add per-chunk overhead.
+
         Args:
             document: Parent document
             content: Chunk content
             position: Chunk position in document
             start_char: Start character index
             end_char: End character index
+            metadata: Shared chunk metadata (built from document if None)
+            id_prefix: Per-document ID prefix; the chunk ID appends the
+                position, avoiding a uuid4() (os.urandom) call per chunk
+            token_count: Token count already known to the caller (counted
+                from content if None)
 
         Returns:
             Chunk object
@@ -358,38 +620,92 @@ class ChunkStage:
         Example:
             >>> chunk = stage._create_chunk(doc, "text", 0, 0, 4)
         """
-        return Chunk(
+        return Chunk.model_construct(
+            id=f"{id_prefix}-{position}" if id_prefix else f"chunk-{id_pool.next_hex12()}",
             document_id=document.id,
             content=content,
-            metadata={
-                **document.metadata,
-                "chunk_strategy": "token_based",
-                "chunk_size_tokens": self.chunk_size,
-                "overlap_tokens": self.overlap
-            },
+            metadata=metadata if metadata is not None else self._chunk_metadata(document),
             position=position,
-            token_count=self._estimate_tokens(content),
+            token_count=token_count if token_count is not None else self._estimate_tokens(content),
             start_char=start_char,
             end_char=end_char,
             tenant_id=document.tenant_id
         )
 
+    async def _chunk_document(
+        self,
+        document: CleanedDocument,
+        index: int,
+        total: int,
+        correlation_id: str
+    ) -> List[Chunk]:
+        """Chunk a single document off the event loop.
+
+        Legacy chunking is pure CPU work with no shared state, so it runs in
+        the default thread pool; the semantic chunker is awaited directly.
+
+        Args:
+            document: Cleaned document to chunk
+            index: Zero-based position of the document in the batch
+            total: Number of documents in the batch
+            correlation_id: Distributed tracing ID
+
+        Returns:
+            List of Chunk objects for the document
+        """
+        # Skip building messages, extras and averages when debug is off
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            self.logger.debug(
+                f"Chunking document {index+1}/{total}: {document.id}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "document_id": document.id,
+                    "document_index": index+1,
+                    "word_count": document.word_count
+                }
+            )
+
+        # Use semantic chunker if available, otherwise fall back to legacy
+        if self.semantic_chunker:
+            doc_chunks = await self.semantic_chunker.chunk_document(document)
+        else:
+            doc_chunks = await asyncio.to_thread(self._create_chunks, document)
+
+        if debug:
+            self.logger.debug(
+                f"Created {len(doc_chunks)} chunks from document {document.id}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "document_id": document.id,
+                    "chunk_count": len(doc_chunks),
+                    "avg_chunk_tokens": sum(c.token_count for c in doc_chunks) // len(doc_chunks) if doc_chunks else 0
+                }
+            )
+
+        return doc_chunks
+
     async def execute(
         self,
         documents: List[CleanedDocument],
         correlation_id: str,
         job_id: Optional[str] = None,
-        tenant_id: Optional[str] = None
+        tenant_id: Optional[str] = None,
+        stats: Optional[StageStats] = None
     ) -> List[Chunk]:
         """Execute the chunk stage.
 
-        Splits all documents into chunks and emits telemetry.
+        Splits all documents into chunks and emits telemetry. Collects the
+        output of execute_stream into a list.
 
         Args:
             documents: List of cleaned documents to chunk
             correlation_id: Distributed tracing ID
             job_id: Optional job identifier
             tenant_id: Multi-tenant identifier
+            stats: Optional StageStats to fill with the chunk count and
+                total tokens
 
         Returns:
             List of Chunk objects
@@ -405,60 +721,99 @@ class ChunkStage:
             ... )
             >>> print(f"Created {len(chunks)} chunks")
         """
-        start_time = time.time()
-        job_id = job_id or f"job-{uuid4().hex[:12]}"
+        return [
+            chunk async for chunk in self.execute_stream(
+                documents=documents,
+                correlation_id=correlation_id,
+                job_id=job_id,
+                tenant_id=tenant_id,
+                stats=stats
+            )
+        ]
+
+    async def execute_stream(
+        self,
+        documents: List[CleanedDocument],
+        correlation_id: str,
+        job_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        stats: Optional[StageStats] = None
+    ) -> AsyncIterator[Chunk]:
+        """Execute the chunk stage, yielding chunks as documents finish.
+
+        Up to max_concurrency documents are chunked at once and their chunks
+        are yielded in document order, so only a window of documents' chunks
+        is held in memory. Telemetry is emitted once the last document has
+        been chunked.
+
+        Args:
+            documents: List of cleaned documents to chunk
+            correlation_id: Distributed tracing ID
+            job_id: Optional job identifier
+            tenant_id: Multi-tenant identifier
+            stats: Optional StageStats to fill with the chunk count and
+                total tokens once the last chunk has been yielded
+
+        Yields:
+            Chunk objects, grouped by document in input order
+
+        Raises:
+            ChunkStageError: If chunking fails
+
+        Example:
+            >>> async for chunk in stage.execute_stream(docs, "trace-123"):
+            ...     batch.append(chunk)
+        """
+        start_time = time.perf_counter()
+        job_id = job_id or f"job-{id_pool.next_hex12()}"
+        document_count = len(documents)
 
         self.logger.info(
-            f"Starting chunk stage for {len(documents)} documents",
+            f"Starting chunk stage for {document_count} documents",
             extra={
                 "correlation_id": correlation_id,
                 "job_id": job_id,
-                "document_count": len(documents),
+                "document_count": document_count,
                 "chunk_size": self.chunk_size,
                 "overlap": self.overlap,
                 "tenant_id": tenant_id
             }
         )
 
+        # In-flight per-document tasks, oldest first
+        pending: Deque[asyncio.Task] = deque()
+
         try:
-            all_chunks: List[Chunk] = []
+            chunk_count = 0
+            total_tokens = 0
 
             for i, doc in enumerate(documents):
-                self.logger.debug(
-                    f"Chunking document {i+1}/{len(documents)}: {doc.id}",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "document_id": doc.id,
-                        "document_index": i+1,
-                        "word_count": doc.word_count
-                    }
-                )
-
-                # Create chunks for this document
-                # Use semantic chunker if available, otherwise fall back to legacy
-                if self.semantic_chunker:
-                    doc_chunks = await self.semantic_chunker.chunk_document(doc)
-                else:
-                    doc_chunks = self._create_chunks(doc)
-
-                all_chunks.extend(doc_chunks)
-
-                self.logger.debug(
-                    f"Created {len(doc_chunks)} chunks from document {doc.id}",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "document_id": doc.id,
-                        "chunk_count": len(doc_chunks),
-                        "avg_chunk_tokens": sum(c.token_count for c in doc_chunks) // len(doc_chunks) if doc_chunks else 0
-                    }
-                )
+                pending.append(asyncio.ensure_future(
+                    self._chunk_document(doc, i, document_count, correlation_id)
+                ))
+                if len(pending) < self.max_concurrency:
+                    continue
+                for chunk in await pending.popleft():
+                    chunk_count += 1
+                    total_tokens += chunk.token_count
+                    yield chunk
+
+            while pending:
+                for chunk in await pending.popleft():
+                    chunk_count += 1
+                    total_tokens += chunk.token_count
+                    yield chunk
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            if stats is not None:
+                stats.items = chunk_count
+                stats.total_tokens = total_tokens
+                stats.duration_ms = duration_ms
 
             # Calculate statistics
-            total_tokens = sum(chunk.token_count for chunk in all_chunks)
-            avg_chunk_size = total_tokens / len(all_chunks) if all_chunks else 0
+            avg_chunk_size = total_tokens / chunk_count if chunk_count else 0
 
             # Emit telemetry
             await telemetry.emit_phase_completed(
@@ -467,34 +822,32 @@ class ChunkStage:
                 phase_number=3,
                 correlation_id=correlation_id,
                 duration_ms=duration_ms,
-                items_processed=len(all_chunks),
+                items_processed=chunk_count,
                 tenant_id=tenant_id,
                 metadata={
-                    "document_count": len(documents),
-                    "chunk_count": len(all_chunks),
+                    "document_count": document_count,
+                    "chunk_count": chunk_count,
                     "total_tokens": total_tokens,
                     "avg_chunk_size": round(avg_chunk_size, 2),
-                    "chunks_per_document": round(len(all_chunks) / len(documents), 2) if documents else 0,
+                    "chunks_per_document": round(chunk_count / document_count, 2) if document_count else 0,
                     "chunking_strategy": self.strategy,
                     "similarity_threshold": self.similarity_threshold if self.strategy in ("semantic", "hybrid") else None
                 }
             )
 
             self.logger.info(
-                f"Chunk stage completed: {len(all_chunks)} chunks in {duration_ms:.2f}ms",
+                f"Chunk stage completed: {chunk_count} chunks in {duration_ms:.2f}ms",
                 extra={
                     "correlation_id": correlation_id,
                     "job_id": job_id,
-                    "chunk_count": len(all_chunks),
+                    "chunk_count": chunk_count,
                     "total_tokens": total_tokens,
                     "duration_ms": duration_ms
                 }
             )
 
-            return all_chunks
-
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
                 f"Chunk stage failed: {str(e)}",
@@ -523,11 +876,15 @@ class ChunkStage:
                 error=str(e)
             )
 
+        finally:
+            # Consumer stopped early or a document failed: drop the rest
+            for task in pending:
+                if not task.cancel() and not task.cancelled():
+                    task.exception()  # Already finished; mark its result retrieved
+
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
-
     async def test_chunk_stage():
         """Test the chunk stage."""
         stage = ChunkStage(
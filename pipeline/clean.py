@@ -21,18 +21,58 @@ Example:
     ... )
 """
 
+import asyncio
+import functools
 import logging
 import re
 import time
 import unicodedata
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from models.document import RawDocument, CleanedDocument
+from pipeline.stats import StageStats
 from services.telemetry_db_client import telemetry
+from utils.ids import id_pool
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by CleanStage._clean_text, compiled once at import time
+_URL_RE = re.compile(
+    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_MULTI_NL_RE = re.compile(r'\n{3,}')
+
+# Whitespace that _clean_text may need to rewrite: any run of two or more
+# whitespace characters, or a single whitespace character other than a space
+# (a lone space between words is already normalized and is skipped)
+_WHITESPACE_RUN_RE = re.compile(r'\s{2,}|[^\S ]')
+_MULTI_SPACE_RE = re.compile(r' +')
+# Whitespace other than plain spaces and newlines
+_SPECIAL_WHITESPACE_RE = re.compile(r'[^\S \n]')
+
+
+def _replace_whitespace_run(match: re.Match) -> str:
+    """Normalize one whitespace run in a single pass.
+
+    A run containing line breaks becomes one newline, or a paragraph break
+    if it spans two or more line breaks; the whitespace padding the lines
+    is dropped with it. Otherwise only runs of spaces are collapsed.
+    """
+    run = match.group()
+    breaks = run.count('\n')
+    if not breaks:
+        return ' ' if not run.strip(' ') else _MULTI_SPACE_RE.sub(' ', run)
+    return '\n\n' if breaks > 1 else '\n'
+
+
+def _reduction_percent(original_length: int, cleaned_length: int) -> float:
+    """Percentage of characters removed by cleaning, rounded to 2 places."""
+    if original_length <= 0:
+        return 0
+    return round((1 - cleaned_length / original_length) * 100, 2)
+
 
 class CleanStageError(Exception):
     """Exception raised when clean stage fails.
@@ -73,7 +113,10 @@ class CleanStage:
         remove_emails: bool = False,
         normalize_whitespace: bool = True,
         normalize_unicode: bool = True,
-        min_content_length: int = 10
+        min_content_length: int = 10,
+        parallel_threshold: int = 8,
+        cache_size: int = 0,
+        cache_max_chars: int = 100_000
     ):
         """Initialize clean stage.
 
@@ -83,6 +126,10 @@ class CleanStage:
             normalize_whitespace: Whether to normalize whitespace
             normalize_unicode: Whether to normalize unicode characters
             min_content_length: Minimum content length (chars)
+            parallel_threshold: Batches larger than this are cleaned in
+                worker threads instead of on the event loop
+            cache_size: Number of cleaned texts to memoize (0 disables)
+            cache_max_chars: Texts longer than this are never memoized
 
         Example:
             >>> stage = CleanStage(
@@ -95,8 +142,26 @@ class CleanStage:
         self.normalize_whitespace = normalize_whitespace
         self.normalize_unicode = normalize_unicode
         self.min_content_length = min_content_length
+        self.parallel_threshold = parallel_threshold
+        self.cache_max_chars = cache_max_chars
         self.logger = logging.getLogger(__name__)
 
+        # Re-ingested documents return their earlier result. The cleaning
+        # flags are fixed per instance, so the text alone is the cache key.
+        self._clean_cached = (
+            functools.lru_cache(maxsize=cache_size)(self._clean_uncached)
+            if cache_size > 0 else None
+        )
+
+        # URL and email removal share one alternation so enabled removals
+        # cost a single scan of the text
+        removal_patterns = []
+        if remove_urls:
+            removal_patterns.append(_URL_RE.pattern)
+        if remove_emails:
+            removal_patterns.append(_EMAIL_RE.pattern)
+        self._removal_re = re.compile('|'.join(removal_patterns)) if removal_patterns else None
+
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content.
 
@@ -111,43 +176,86 @@ class CleanStage:
             >>> print(cleaned)
             Hello World\n\nTest
         """
-        # Normalize unicode
-        if self.normalize_unicode:
-            text = unicodedata.normalize('NFKC', text)
+        return self._clean_and_count_words(text)[0]
 
-        # Remove URLs
-        if self.remove_urls:
-            text = re.sub(
-                r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
-                '',
-                text
-            )
+    def _clean_and_count_words(
+        self,
+        text: str,
+        pre_normalized: bool = False
+    ) -> Tuple[str, int]:
+        """Clean and normalize text content and count its words.
 
-        # Remove email addresses
-        if self.remove_emails:
-            text = re.sub(
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-                '',
-                text
-            )
+        When whitespace normalization already splits the text into words,
+        the count comes from that split instead of a second pass. Results
+        are memoized when the stage was created with a cache_size.
+
+        Args:
+            text: Raw text to clean
+            pre_normalized: Whether the source already delivers NFKC text,
+                in which case unicode normalization is skipped
+
+        Returns:
+            Tuple of (cleaned text, word count)
+
+        Example:
+            >>> stage._clean_and_count_words("Hello   World\\n\\n\\nTest")
+            ('Hello World\n\nTest', 3)
+        """
+        if self._clean_cached is not None and len(text) <= self.cache_max_chars:
+            return self._clean_cached(text, pre_normalized)
+        return self._clean_uncached(text, pre_normalized)
+
+    def _clean_uncached(self, text: str, pre_normalized: bool = False) -> Tuple[str, int]:
+        """Clean text and count its words, bypassing the cache.
+
+        Args:
+            text: Raw text to clean
+            pre_normalized: Whether to skip unicode normalization
 
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        Returns:
+            Tuple of (cleaned text, word count)
+        """
+        word_count = None
+
+        # Normalize unicode (ASCII text is already in NFKC form)
+        if self.normalize_unicode and not pre_normalized and not text.isascii():
+            text = unicodedata.normalize('NFKC', text)
 
-        # Remove excessive newlines (more than 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Remove URLs and/or email addresses
+        if self._removal_re is not None:
+            text = self._removal_re.sub('', text)
+
+        # Normalize line endings (most text has no carriage returns at all)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
 
-        # Normalize whitespace
         if self.normalize_whitespace:
-            # Replace multiple spaces with single space
-            text = re.sub(r' +', ' ', text)
-            # Remove spaces at start/end of lines
-            text = '\n'.join(line.strip() for line in text.split('\n'))
+            if text.isascii() and not _SPECIAL_WHITESPACE_RE.search(text):
+                # Only spaces and newlines: str.split collapses space runs
+                # and strips each line in C, then blank-line runs collapse
+                word_count = 0
+                lines = []
+                for line in text.split('\n'):
+                    words = line.split()
+                    word_count += len(words)
+                    lines.append(' '.join(words))
+                text = '\n'.join(lines)
+                text = _MULTI_NL_RE.sub('\n\n', text)
+            else:
+                # Collapse blank-line and space runs and strip each line in
+                # one pass
+                text = _WHITESPACE_RUN_RE.sub(_replace_whitespace_run, text)
+        else:
+            # Remove excessive newlines (more than 2 consecutive)
+            text = _MULTI_NL_RE.sub('\n\n', text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
 
-        return text
+        if word_count is None:
+            word_count = self._calculate_word_count(text)
+
+        return text, word_count
 
     def _calculate_word_count(self, text: str) -> int:
         """Calculate word count.
@@ -170,17 +278,22 @@ class CleanStage:
         documents: List[RawDocument],
         correlation_id: str,
         job_id: Optional[str] = None,
-        tenant_id: Optional[str] = None
+        tenant_id: Optional[str] = None,
+        stats: Optional[StageStats] = None
     ) -> List[CleanedDocument]:
         """Execute the clean stage.
 
-        Cleans and normalizes all documents and emits telemetry.
+        Cleans and normalizes all documents and emits telemetry. Documents
+        whose metadata sets "pre_normalized" (sources that already emit
+        NFKC text) skip unicode normalization.
 
         Args:
             documents: List of raw documents to clean
             correlation_id: Distributed tracing ID
             job_id: Optional job identifier
             tenant_id: Multi-tenant identifier
+            stats: Optional StageStats to fill with the document count and
+                cleaned character and word totals
 
         Returns:
             List of CleanedDocument objects
@@ -197,8 +310,8 @@ class CleanStage:
             ... )
             >>> print(f"Cleaned {len(cleaned_docs)} documents")
         """
-        start_time = time.time()
-        job_id = job_id or f"job-{uuid4().hex[:12]}"
+        start_time = time.perf_counter()
+        job_id = job_id or f"job-{id_pool.next_hex12()}"
 
         self.logger.info(
             f"Starting clean stage for {len(documents)} documents",
@@ -211,29 +324,59 @@ class CleanStage:
         )
 
         try:
-            cleaned_documents: List[CleanedDocument] = []
-
-            for i, doc in enumerate(documents):
-                self.logger.debug(
-                    f"Cleaning document {i+1}/{len(documents)}: {doc.id}",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "document_id": doc.id,
-                        "document_index": i+1
-                    }
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+
+            # Clean the content, off the event loop for large batches
+            if len(documents) > self.parallel_threshold:
+                cleaned_results = await asyncio.gather(*(
+                    asyncio.to_thread(
+                        self._clean_and_count_words,
+                        doc.content,
+                        bool(doc.metadata.get("pre_normalized"))
+                    )
+                    for doc in documents
+                ))
+            else:
+                cleaned_results = [
+                    self._clean_and_count_words(doc.content, bool(doc.metadata.get("pre_normalized")))
+                    for doc in documents
+                ]
+
+            # Create CleanedDocuments
+            cleaned_documents = [
+                CleanedDocument(
+                    id=doc.id,
+                    source=doc.source,
+                    content=cleaned_content,
+                    metadata=dict(
+                        doc.metadata,
+                        original_length=len(doc.content),
+                        cleaned_length=len(cleaned_content),
+                        reduction_percent=_reduction_percent(len(doc.content), len(cleaned_content))
+                    ),
+                    word_count=word_count,
+                    char_count=len(cleaned_content),
+                    tenant_id=tenant_id or doc.tenant_id
                 )
+                for doc, (cleaned_content, word_count) in zip(documents, cleaned_results)
+            ]
+
+            total_original = total_cleaned = total_words = 0
 
-                # Clean the content
-                cleaned_content = self._clean_text(doc.content)
+            for i, (doc, cleaned_doc) in enumerate(zip(documents, cleaned_documents)):
+                total_original += len(doc.content)
+                total_cleaned += cleaned_doc.char_count
+                total_words += cleaned_doc.word_count
 
                 # Validate minimum length
-                if len(cleaned_content) < self.min_content_length:
+                if cleaned_doc.char_count < self.min_content_length:
                     self.logger.warning(
-                        f"Document {doc.id} content too short after cleaning: {len(cleaned_content)} chars",
+                        f"Document {cleaned_doc.id} content too short after cleaning: "
+                        f"{cleaned_doc.char_count} chars",
                         extra={
                             "correlation_id": correlation_id,
-                            "document_id": doc.id,
-                            "content_length": len(cleaned_content),
+                            "document_id": cleaned_doc.id,
+                            "content_length": cleaned_doc.char_count,
                             "min_length": self.min_content_length
                         }
                     )
@@ -241,48 +384,28 @@ class CleanStage:
                     # For now, we'll include it but log a warning
                     # Could raise an error instead if preferred
 
-                # Calculate statistics
-                word_count = self._calculate_word_count(cleaned_content)
-                char_count = len(cleaned_content)
-
-                # Create CleanedDocument
-                cleaned_doc = CleanedDocument(
-                    id=doc.id,
-                    source=doc.source,
-                    content=cleaned_content,
-                    metadata={
-                        **doc.metadata,
-                        "original_length": len(doc.content),
-                        "cleaned_length": char_count,
-                        "reduction_percent": round(
-                            (1 - char_count / len(doc.content)) * 100, 2
-                        ) if len(doc.content) > 0 else 0
-                    },
-                    word_count=word_count,
-                    char_count=char_count,
-                    tenant_id=tenant_id or doc.tenant_id
-                )
-
-                cleaned_documents.append(cleaned_doc)
-
-                self.logger.debug(
-                    f"Cleaned document {doc.id}: {len(doc.content)} → {char_count} chars",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "document_id": doc.id,
-                        "original_length": len(doc.content),
-                        "cleaned_length": char_count,
-                        "word_count": word_count
-                    }
-                )
+                if debug:
+                    self.logger.debug(
+                        f"Cleaned document {i+1}/{len(documents)} {cleaned_doc.id}: "
+                        f"{len(doc.content)} → {cleaned_doc.char_count} chars",
+                        extra={
+                            "correlation_id": correlation_id,
+                            "document_id": cleaned_doc.id,
+                            "document_index": i+1,
+                            "original_length": len(doc.content),
+                            "cleaned_length": cleaned_doc.char_count,
+                            "word_count": cleaned_doc.word_count
+                        }
+                    )
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
-            # Calculate total statistics
-            total_original = sum(len(doc.content) for doc in documents)
-            total_cleaned = sum(doc.char_count for doc in cleaned_documents)
-            total_words = sum(doc.word_count for doc in cleaned_documents)
+            if stats is not None:
+                stats.items = len(cleaned_documents)
+                stats.total_chars = total_cleaned
+                stats.total_words = total_words
+                stats.duration_ms = duration_ms
 
             # Emit telemetry
             await telemetry.emit_phase_completed(
@@ -298,9 +421,7 @@ class CleanStage:
                     "total_original_chars": total_original,
                     "total_cleaned_chars": total_cleaned,
                     "total_words": total_words,
-                    "avg_reduction_percent": round(
-                        (1 - total_cleaned / total_original) * 100, 2
-                    ) if total_original > 0 else 0
+                    "avg_reduction_percent": _reduction_percent(total_original, total_cleaned)
                 }
             )
 
@@ -318,7 +439,7 @@ class CleanStage:
             return cleaned_documents
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
                 f"Clean stage failed: {str(e)}",
@@ -350,8 +471,6 @@ class CleanStage:
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
-
     async def test_clean_stage():
         """Test the clean stage."""
         stage = CleanStage(
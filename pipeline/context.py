@@ -0,0 +1,84 @@
+"""Job Context for Rake Pipeline
+
+Context variables holding the identifiers of the job being processed,
+and a logging filter that copies them onto every log record. The
+orchestrator binds them once per job, so log calls inside the job do not
+need to repeat them in ``extra``. asyncio tasks copy the current context
+when created, so tasks spawned by a job see its identifiers too.
+
+Example:
+    >>> from pipeline.context import job_context, ContextFilter
+    >>>
+    >>> handler.addFilter(ContextFilter())
+    >>> with job_context(correlation_id="trace-123", job_id="job-abc", tenant_id="tenant-1"):
+    ...     logger.info("Fetching")  # record.job_id == "job-abc"
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+job_id_var: ContextVar[Optional[str]] = ContextVar("job_id", default=None)
+tenant_id_var: ContextVar[Optional[str]] = ContextVar("tenant_id", default=None)
+
+
+@contextmanager
+def job_context(
+    correlation_id: Optional[str],
+    job_id: Optional[str],
+    tenant_id: Optional[str] = None
+) -> Iterator[None]:
+    """Bind job identifiers for the duration of a block.
+
+    Args:
+        correlation_id: Distributed tracing ID
+        job_id: Job identifier
+        tenant_id: Multi-tenant identifier
+
+    Example:
+        >>> with job_context("trace-123", "job-abc"):
+        ...     await orchestrator._run_job(...)
+    """
+    tokens = (
+        correlation_id_var.set(correlation_id),
+        job_id_var.set(job_id),
+        tenant_id_var.set(tenant_id),
+    )
+    try:
+        yield
+    finally:
+        tenant_id_var.reset(tokens[2])
+        job_id_var.reset(tokens[1])
+        correlation_id_var.reset(tokens[0])
+
+
+class ContextFilter(logging.Filter):
+    """Logging filter that adds the bound job identifiers to records.
+
+    Attributes passed explicitly through ``extra`` take precedence.
+    Attach it to handlers rather than loggers: logger filters do not see
+    records propagated from child loggers.
+
+    Example:
+        >>> handler = logging.StreamHandler()
+        >>> handler.addFilter(ContextFilter())
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Copy bound identifiers onto the record.
+
+        Args:
+            record: Log record being handled
+
+        Returns:
+            Always True (records are never dropped)
+        """
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id_var.get()
+        if not hasattr(record, "job_id"):
+            record.job_id = job_id_var.get()
+        if not hasattr(record, "tenant_id"):
+            record.tenant_id = tenant_id_var.get()
+        return True
@@ -15,12 +15,14 @@ Example:
 
 import logging
 import time
-from typing import List, Optional
+from collections import Counter
+from typing import AsyncGenerator, Dict, List, Optional
 from uuid import uuid4
 
 from models.document import Chunk, Embedding
 from services.embedding_service import EmbeddingService, EmbeddingError
 from services.telemetry_db_client import telemetry
+from utils.ids import id_pool
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +83,8 @@ class EmbedStage:
     ) -> List[Embedding]:
         """Execute the embed stage.
 
-        Generates embeddings for all chunks and emits telemetry.
+        Generates embeddings for all chunks and emits telemetry. Collects
+        the output of execute_stream into a list.
 
         Args:
             chunks: List of chunks to embed
@@ -103,8 +106,48 @@ class EmbedStage:
             ... )
             >>> print(f"Generated {len(embeddings)} embeddings")
         """
-        start_time = time.time()
-        job_id = job_id or f"job-{uuid4().hex[:12]}"
+        return [
+            embedding
+            async for batch in self.execute_stream(
+                chunks=chunks,
+                correlation_id=correlation_id,
+                job_id=job_id,
+                tenant_id=tenant_id
+            )
+            for embedding in batch
+        ]
+
+    async def execute_stream(
+        self,
+        chunks: List[Chunk],
+        correlation_id: str,
+        job_id: Optional[str] = None,
+        tenant_id: Optional[str] = None
+    ) -> AsyncGenerator[List[Embedding], None]:
+        """Execute the embed stage, yielding embeddings batch by batch.
+
+        Each API batch is turned into Embedding objects and yielded before
+        the next batch is requested, so only one batch of vectors is held
+        in memory at a time. Telemetry is emitted after the last batch.
+
+        Args:
+            chunks: List of chunks to embed
+            correlation_id: Distributed tracing ID
+            job_id: Optional job identifier
+            tenant_id: Multi-tenant identifier
+
+        Yields:
+            Lists of Embedding objects, in chunk order
+
+        Raises:
+            EmbedStageError: If embedding generation fails
+
+        Example:
+            >>> async for batch in stage.execute_stream(chunks, "trace-123"):
+            ...     await store_stage.execute(batch, "trace-123")
+        """
+        start_time = time.perf_counter()
+        job_id = job_id or f"job-{id_pool.next_hex12()}"
 
         if not chunks:
             self.logger.warning(
@@ -114,7 +157,7 @@ class EmbedStage:
                     "job_id": job_id
                 }
             )
-            return []
+            return
 
         self.logger.info(
             f"Starting embed stage for {len(chunks)} chunks",
@@ -127,58 +170,104 @@ class EmbedStage:
         )
 
         try:
-            # Extract text content from chunks
-            texts = [chunk.content for chunk in chunks]
-
-            self.logger.debug(
-                f"Generating embeddings for {len(texts)} texts",
-                extra={
-                    "correlation_id": correlation_id,
-                    "text_count": len(texts),
-                    "avg_length": sum(len(t) for t in texts) // len(texts) if texts else 0
-                }
-            )
-
-            # Generate embeddings using the service
-            vectors = await self.embedding_service.generate_embeddings(
-                texts=texts,
-                correlation_id=correlation_id,
-                model=self.model
-            )
-
-            # Create Embedding objects
-            embeddings: List[Embedding] = []
-            for chunk, vector in zip(chunks, vectors):
-                embedding = Embedding(
-                    chunk_id=chunk.id,
-                    vector=vector,
-                    model=self.embedding_service.model,
-                    metadata={
-                        **chunk.metadata,
-                        "document_id": chunk.document_id,
-                        "chunk_position": chunk.position,
-                        "embedding_dimension": len(vector)
-                    },
-                    tenant_id=tenant_id or chunk.tenant_id
-                )
-                embeddings.append(embedding)
-
+            # Each distinct text is embedded once; text_indices maps every
+            # chunk to the position of its text in the deduplicated list
+            unique_index: Dict[str, int] = {}
+            text_indices = [
+                unique_index.setdefault(chunk.content, len(unique_index))
+                for chunk in chunks
+            ]
+            texts = list(unique_index)
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+
+            if debug:
                 self.logger.debug(
-                    f"Created embedding for chunk {chunk.id}",
+                    f"Generating embeddings for {len(texts)} texts",
                     extra={
                         "correlation_id": correlation_id,
-                        "chunk_id": chunk.id,
-                        "embedding_id": embedding.id,
-                        "vector_dimension": len(vector)
+                        "text_count": len(texts),
+                        "duplicate_count": len(chunks) - len(texts),
+                        "avg_length": sum(len(t) for t in texts) // len(texts) if texts else 0
                     }
                 )
 
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            model_name = self.embedding_service.model
+            vector_dim = 0
+            embedding_count = 0
+            total_tokens = 0
 
-            # Calculate statistics
-            total_tokens = sum(chunk.token_count for chunk in chunks)
-            avg_vector_dim = sum(len(e.vector) for e in embeddings) / len(embeddings) if embeddings else 0
+            # Vectors received but still needed by a later chunk, and how
+            # many chunks still need each of them
+            pending_vectors: Dict[int, List[float]] = {}
+            remaining_uses = Counter(text_indices)
+            received = 0
+
+            # Generate embeddings using the service, one API batch at a time
+            async for vectors in self.embedding_service.generate_embeddings_streaming(
+                texts=texts,
+                correlation_id=correlation_id,
+                model=self.model
+            ):
+                # Check dimensions here so the Embedding objects can take the
+                # vectors as-is instead of validating and copying every float
+                for vector in vectors:
+                    Embedding.validate_vector_dimensions(vector)
+
+                # All vectors come from one model and share its dimension
+                if vectors and not vector_dim:
+                    vector_dim = len(vectors[0])
+
+                pending_vectors.update(zip(range(received, received + len(vectors)), vectors))
+                received += len(vectors)
+
+                # Fan the vectors out to every chunk whose text is now embedded
+                batch_start = embedding_count
+                batch_end = batch_start
+                while batch_end < len(chunks) and text_indices[batch_end] < received:
+                    batch_end += 1
+                batch_chunks = chunks[batch_start:batch_end]
+                batch_vectors = []
+                for index in text_indices[batch_start:batch_end]:
+                    batch_vectors.append(pending_vectors[index])
+                    remaining_uses[index] -= 1
+                    if not remaining_uses[index]:
+                        del pending_vectors[index]
+
+                # Create Embedding objects
+                embeddings = [
+                    Embedding.model_construct(
+                        chunk_id=chunk.id,
+                        vector=vector,
+                        model=model_name,
+                        metadata={
+                            **chunk.metadata,
+                            "document_id": chunk.document_id,
+                            "chunk_position": chunk.position,
+                            "embedding_dimension": vector_dim
+                        },
+                        tenant_id=tenant_id or chunk.tenant_id
+                    )
+                    for chunk, vector in zip(batch_chunks, batch_vectors)
+                ]
+                embedding_count += len(embeddings)
+                total_tokens += sum(chunk.token_count for chunk in batch_chunks)
+
+                if debug:
+                    for embedding in embeddings:
+                        self.logger.debug(
+                            f"Created embedding for chunk {embedding.chunk_id}",
+                            extra={
+                                "correlation_id": correlation_id,
+                                "chunk_id": embedding.chunk_id,
+                                "embedding_id": embedding.id,
+                                "vector_dimension": vector_dim
+                            }
+                        )
+
+                yield embeddings
+
+            # Calculate duration
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Emit telemetry
             await telemetry.emit_phase_completed(
@@ -187,32 +276,31 @@ class EmbedStage:
                 phase_number=4,
                 correlation_id=correlation_id,
                 duration_ms=duration_ms,
-                items_processed=len(embeddings),
+                items_processed=embedding_count,
                 tenant_id=tenant_id,
                 metadata={
                     "chunk_count": len(chunks),
-                    "embedding_count": len(embeddings),
+                    "unique_text_count": len(texts),
+                    "embedding_count": embedding_count,
                     "total_tokens": total_tokens,
-                    "model": self.embedding_service.model,
-                    "vector_dimension": int(avg_vector_dim)
+                    "model": model_name,
+                    "vector_dimension": vector_dim
                 }
             )
 
             self.logger.info(
-                f"Embed stage completed: {len(embeddings)} embeddings in {duration_ms:.2f}ms",
+                f"Embed stage completed: {embedding_count} embeddings in {duration_ms:.2f}ms",
                 extra={
                     "correlation_id": correlation_id,
                     "job_id": job_id,
-                    "embedding_count": len(embeddings),
+                    "embedding_count": embedding_count,
                     "total_tokens": total_tokens,
                     "duration_ms": duration_ms
                 }
             )
 
-            return embeddings
-
         except EmbeddingError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
                 f"Embed stage failed: {str(e)}",
@@ -243,7 +331,7 @@ class EmbedStage:
             )
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
                 f"Unexpected error in embed stage: {str(e)}",
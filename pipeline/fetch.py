@@ -14,20 +14,21 @@ Example:
     ... )
 """
 
+import asyncio
+import importlib
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from models.document import RawDocument, DocumentSource
+from pipeline.stats import StageStats
 from sources.base import BaseSourceAdapter, FetchError
-from sources.file_upload import FileUploadAdapter
-from sources.sec_edgar import SECEdgarAdapter
-from sources.url_scrape import URLScrapeAdapter
-from sources.api_fetch import APIFetchAdapter
-from sources.database_query import DatabaseQueryAdapter
 from services.telemetry_db_client import telemetry
 from config import settings
+from utils.concurrency import SharedSemaphore
+from utils.http import SharedTransport
+from utils.ids import id_pool
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,48 @@ class FetchStageError(Exception):
         super().__init__(message)
 
 
+# Builds a source adapter for a tenant; adapter classes themselves qualify
+AdapterFactory = Callable[..., BaseSourceAdapter]
+
+
+def _lazy_adapter(module: str, class_name: str, **bound: Any) -> AdapterFactory:
+    """Build an adapter factory that imports its adapter class on first use.
+
+    Adapter modules pull in parsers and HTTP/database clients, so only the
+    sources a process actually uses are imported. The class is resolved
+    once and kept by the factory.
+
+    Args:
+        module: Module defining the adapter class
+        class_name: Adapter class name
+        **bound: Keyword arguments passed to every adapter built
+
+    Returns:
+        Factory taking tenant_id and returning a new adapter
+
+    Example:
+        >>> factory = _lazy_adapter("sources.url_scrape", "URLScrapeAdapter")
+        >>> adapter = factory(tenant_id="tenant-123")
+    """
+    adapter_class = None
+
+    def factory(tenant_id: Optional[str] = None) -> BaseSourceAdapter:
+        nonlocal adapter_class
+        if adapter_class is None:
+            adapter_class = getattr(importlib.import_module(module), class_name)
+        return adapter_class(tenant_id=tenant_id, **bound)
+
+    return factory
+
+
+def _missing_sec_edgar_user_agent(tenant_id: Optional[str] = None) -> BaseSourceAdapter:
+    """Adapter factory registered for SEC EDGAR when no user agent is configured."""
+    raise FetchStageError(
+        "SEC_EDGAR_USER_AGENT configuration is required for SEC EDGAR source",
+        source=DocumentSource.SEC_EDGAR.value
+    )
+
+
 class FetchStage:
     """Stage 1: Fetch documents from sources.
 
@@ -52,7 +95,17 @@ class FetchStage:
     source adapter. Emits telemetry events for monitoring.
 
     Attributes:
-        adapters: Registry of available source adapters
+        adapters: Registry of adapter factories, keyed by source type
+
+    Adapters are created once per (source, tenant) and reused, so HTTP
+    clients and database pools keep their connections between fetches.
+    The HTTP adapters also share one connection pool, so keep-alive
+    connections and TLS sessions to a host are reused across sources and
+    tenants. Call close() to release them.
+
+    Adapter calls from all FetchStage instances share a limit of
+    settings.FETCH_MAX_CONCURRENCY, so fan-out from the scheduler cannot
+    exhaust file descriptors or sockets.
 
     Example:
         >>> stage = FetchStage()
@@ -63,6 +116,8 @@ class FetchStage:
         ... )
     """
 
+    _fetch_limit = SharedSemaphore(settings.FETCH_MAX_CONCURRENCY)
+
     def __init__(self):
         """Initialize fetch stage with available adapters.
 
@@ -70,13 +125,40 @@ class FetchStage:
             >>> stage = FetchStage()
             >>> print(stage.get_available_sources())
         """
-        self.adapters: Dict[str, type[BaseSourceAdapter]] = {
-            DocumentSource.FILE_UPLOAD.value: FileUploadAdapter,
-            DocumentSource.SEC_EDGAR.value: SECEdgarAdapter,
-            DocumentSource.URL_SCRAPE.value: URLScrapeAdapter,
-            DocumentSource.API_FETCH.value: APIFetchAdapter,
-            DocumentSource.DATABASE_QUERY.value: DatabaseQueryAdapter,
+        self._http_transport = SharedTransport(
+            max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+        )
+
+        # Source-specific settings are bound here once, so building an
+        # adapter is a single call with the tenant_id. Adapter modules are
+        # imported on first use.
+        if settings.SEC_EDGAR_USER_AGENT:
+            sec_edgar_factory = _lazy_adapter(
+                "sources.sec_edgar",
+                "SECEdgarAdapter",
+                user_agent=settings.SEC_EDGAR_USER_AGENT,
+                rate_limit_delay=settings.SEC_EDGAR_RATE_LIMIT,
+                transport=self._http_transport
+            )
+        else:
+            sec_edgar_factory = _missing_sec_edgar_user_agent
+
+        self.adapters: Dict[str, AdapterFactory] = {
+            DocumentSource.FILE_UPLOAD.value: _lazy_adapter("sources.file_upload", "FileUploadAdapter"),
+            DocumentSource.SEC_EDGAR.value: sec_edgar_factory,
+            DocumentSource.URL_SCRAPE.value: _lazy_adapter(
+                "sources.url_scrape", "URLScrapeAdapter", transport=self._http_transport
+            ),
+            DocumentSource.API_FETCH.value: _lazy_adapter(
+                "sources.api_fetch", "APIFetchAdapter", transport=self._http_transport
+            ),
+            DocumentSource.DATABASE_QUERY.value: _lazy_adapter("sources.database_query", "DatabaseQueryAdapter"),
         }
+        self._adapter_cache: Dict[Tuple[str, Optional[str]], BaseSourceAdapter] = {}
+        # source -> (time.monotonic() of the probe, healthy)
+        self._health_cache: Dict[str, Tuple[float, bool]] = {}
         self.logger = logging.getLogger(__name__)
 
     def get_available_sources(self) -> List[str]:
@@ -100,6 +182,10 @@ class FetchStage:
     ) -> BaseSourceAdapter:
         """Get appropriate source adapter for the given source type.
 
+        Returns the cached adapter for (source, tenant_id) if there is one.
+        Construction is synchronous, so concurrent callers cannot race to
+        create the same adapter.
+
         Args:
             source: Source type identifier
             tenant_id: Multi-tenant identifier
@@ -108,7 +194,8 @@ class FetchStage:
             Initialized source adapter
 
         Raises:
-            FetchStageError: If source type is not supported
+            FetchStageError: If source type is not supported, or is SEC
+                EDGAR without SEC_EDGAR_USER_AGENT configured
 
         Example:
             >>> adapter = stage._get_adapter("file_upload", "tenant-123")
@@ -120,23 +207,14 @@ class FetchStage:
                 available_sources=self.get_available_sources()
             )
 
-        adapter_class = self.adapters[source]
-
-        # SEC EDGAR adapter requires user_agent
-        if source == DocumentSource.SEC_EDGAR.value:
-            user_agent = settings.SEC_EDGAR_USER_AGENT
-            if not user_agent:
-                raise FetchStageError(
-                    "SEC_EDGAR_USER_AGENT configuration is required for SEC EDGAR source",
-                    source=source
-                )
-            return adapter_class(
-                user_agent=user_agent,
-                tenant_id=tenant_id,
-                rate_limit_delay=settings.SEC_EDGAR_RATE_LIMIT
-            )
+        key = (source, tenant_id)
+        adapter = self._adapter_cache.get(key)
+        if adapter is not None:
+            return adapter
 
-        return adapter_class(tenant_id=tenant_id)
+        adapter = self.adapters[source](tenant_id=tenant_id)
+        self._adapter_cache[key] = adapter
+        return adapter
 
     async def execute(
         self,
@@ -144,6 +222,7 @@ class FetchStage:
         correlation_id: str,
         job_id: Optional[str] = None,
         tenant_id: Optional[str] = None,
+        stats: Optional[StageStats] = None,
         **source_params
     ) -> List[RawDocument]:
         """Execute the fetch stage.
@@ -155,6 +234,8 @@ class FetchStage:
             correlation_id: Distributed tracing ID
             job_id: Optional job identifier
             tenant_id: Multi-tenant identifier
+            stats: Optional StageStats to fill with the document count and
+                total content length
             **source_params: Source-specific parameters (file_path, url, etc.)
 
         Returns:
@@ -173,39 +254,53 @@ class FetchStage:
             ... )
             >>> print(f"Fetched {len(documents)} documents")
         """
-        start_time = time.time()
-        job_id = job_id or f"job-{uuid4().hex[:12]}"
-
-        self.logger.info(
-            f"Starting fetch stage for source: {source}",
-            extra={
-                "correlation_id": correlation_id,
-                "job_id": job_id,
-                "source": source,
-                "tenant_id": tenant_id
-            }
-        )
+        start_time = time.perf_counter()
+        job_id = job_id or f"job-{id_pool.next_hex12()}"
 
-        try:
-            # Get appropriate adapter
-            adapter = self._get_adapter(source, tenant_id)
+        # Skip building log messages and extras for disabled levels
+        info = self.logger.isEnabledFor(logging.INFO)
 
-            self.logger.debug(
-                f"Using adapter: {adapter.__class__.__name__}",
+        if info:
+            self.logger.info(
+                f"Starting fetch stage for source: {source}",
                 extra={
                     "correlation_id": correlation_id,
-                    "adapter": adapter.__class__.__name__
+                    "job_id": job_id,
+                    "source": source,
+                    "tenant_id": tenant_id
                 }
             )
 
+        try:
+            # Get appropriate adapter
+            adapter = self._get_adapter(source, tenant_id)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Using adapter: {adapter.__class__.__name__}",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "adapter": adapter.__class__.__name__
+                    }
+                )
+
             # Fetch documents with retry logic
-            documents = await adapter.fetch_with_retry(
-                max_attempts=3,
-                **source_params
-            )
+            async with self._fetch_limit:
+                documents = await adapter.fetch_with_retry(
+                    max_attempts=settings.RETRY_ATTEMPTS,
+                    backoff_base=settings.RETRY_DELAY,
+                    backoff_max=settings.RETRY_MAX_DELAY,
+                    **source_params
+                )
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            total_content_length = sum(len(doc.content) for doc in documents)
+
+            if stats is not None:
+                stats.items = len(documents)
+                stats.total_chars = total_content_length
+                stats.duration_ms = duration_ms
 
             # Emit telemetry
             await telemetry.emit_phase_completed(
@@ -219,32 +314,45 @@ class FetchStage:
                 metadata={
                     "source": source,
                     "document_count": len(documents),
-                    "total_content_length": sum(len(doc.content) for doc in documents)
-                }
+                    "total_content_length": total_content_length
+                },
+                wait=False
             )
 
-            self.logger.info(
-                f"Fetch stage completed: {len(documents)} documents in {duration_ms:.2f}ms",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "document_count": len(documents),
-                    "duration_ms": duration_ms
-                }
-            )
+            if info:
+                self.logger.info(
+                    f"Fetch stage completed: {len(documents)} documents in {duration_ms:.2f}ms",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "job_id": job_id,
+                        "document_count": len(documents),
+                        "duration_ms": duration_ms
+                    }
+                )
 
             return documents
 
-        except FetchError as e:
-            duration_ms = (time.time() - start_time) * 1000
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            error = str(e)
+
+            # Adapter failures carry their own context; anything else is unexpected
+            if isinstance(e, FetchError):
+                message = f"Fetch failed: {error}"
+                log_message = f"Fetch stage failed: {error}"
+                context = dict(e.context)
+            else:
+                message = f"Unexpected error: {error}"
+                log_message = f"Unexpected error in fetch stage: {error}"
+                context = {}
 
             self.logger.error(
-                f"Fetch stage failed: {str(e)}",
+                log_message,
                 extra={
                     "correlation_id": correlation_id,
                     "job_id": job_id,
                     "source": source,
-                    "error": str(e),
+                    "error": error,
                     "duration_ms": duration_ms
                 },
                 exc_info=True
@@ -257,52 +365,59 @@ class FetchStage:
                 correlation_id=correlation_id,
                 failed_stage="fetch",
                 error_type=e.__class__.__name__,
-                error_message=str(e),
+                error_message=error,
                 tenant_id=tenant_id
             )
 
-            raise FetchStageError(
-                f"Fetch failed: {str(e)}",
-                source=source,
-                error=str(e),
-                **e.context if hasattr(e, 'context') else {}
-            )
+            context.update(source=source, error=error)
+            raise FetchStageError(message, **context) from e
 
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+    async def close(self) -> None:
+        """Close all cached source adapters and the shared HTTP pool.
 
-            self.logger.error(
-                f"Unexpected error in fetch stage: {str(e)}",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "source": source,
-                    "error": str(e),
-                    "duration_ms": duration_ms
-                },
-                exc_info=True
-            )
+        Should be called during application shutdown.
 
-            # Emit failure telemetry
-            await telemetry.emit_job_failed(
-                job_id=job_id,
-                source=source,
-                correlation_id=correlation_id,
-                failed_stage="fetch",
-                error_type=e.__class__.__name__,
-                error_message=str(e),
-                tenant_id=tenant_id
-            )
+        Example:
+            >>> await stage.close()
+        """
+        adapters = list(self._adapter_cache.values())
+        self._adapter_cache.clear()
 
-            raise FetchStageError(
-                f"Unexpected error: {str(e)}",
-                source=source,
-                error=str(e)
-            )
+        for adapter in adapters:
+            try:
+                await adapter.close()
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to close {adapter.__class__.__name__}: {str(e)}",
+                    extra={"adapter": adapter.__class__.__name__, "error": str(e)}
+                )
+
+        await self._http_transport.close()
+
+    async def _probe_adapter(self, adapter_factory: AdapterFactory) -> bool:
+        """Run one adapter's health check on a throwaway instance.
+
+        Args:
+            adapter_factory: Factory for the adapter to probe
+
+        Returns:
+            True if the adapter reports healthy
+        """
+        adapter = adapter_factory()
+        try:
+            return await adapter.health_check()
+        finally:
+            await adapter.close()
 
     async def health_check(self) -> Dict[str, Any]:
         """Check health of all registered source adapters.
 
+        Adapters are probed concurrently, each bounded by
+        settings.HEALTHCHECK_TIMEOUT, so the check takes as long as the
+        slowest probe rather than the sum of all of them. Results are
+        reused for settings.HEALTHCHECK_TTL_SEC, so frequent load-balancer
+        checks do not probe upstream services on every call.
+
         Returns:
             Dict mapping source types to health status
 
@@ -311,26 +426,45 @@ class FetchStage:
             >>> print(health)
             {'file_upload': True}
         """
-        health_status = {}
+        now = time.monotonic()
+        ttl = settings.HEALTHCHECK_TTL_SEC
+        stale = [
+            source_type
+            for source_type in self.adapters
+            if source_type not in self._health_cache
+            or now - self._health_cache[source_type][0] >= ttl
+        ]
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self._probe_adapter(self.adapters[source_type]),
+                    timeout=settings.HEALTHCHECK_TIMEOUT
+                )
+                for source_type in stale
+            ),
+            return_exceptions=True
+        )
 
-        for source_type, adapter_class in self.adapters.items():
-            try:
-                adapter = adapter_class()
-                is_healthy = await adapter.health_check()
-                health_status[source_type] = is_healthy
-            except Exception as e:
+        for source_type, result in zip(stale, results):
+            # A probe can also end in a BaseException such as CancelledError
+            if isinstance(result, BaseException):
+                error = str(result) or result.__class__.__name__
                 self.logger.warning(
-                    f"Health check failed for {source_type}: {str(e)}",
-                    extra={"source_type": source_type, "error": str(e)}
+                    f"Health check failed for {source_type}: {error}",
+                    extra={"source_type": source_type, "error": error}
                 )
-                health_status[source_type] = False
+                result = False
+            self._health_cache[source_type] = (now, result)
 
-        return health_status
+        return {
+            source_type: self._health_cache[source_type][1]
+            for source_type in self.adapters
+        }
 
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
     from pathlib import Path
 
     async def test_fetch_stage():
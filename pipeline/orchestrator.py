@@ -18,22 +18,93 @@ Example:
     ... )
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional
-from uuid import uuid4
-from datetime import datetime
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from datetime import timedelta
 
-from models.document import PipelineJob, ProcessingStatus, DocumentSource
+from config import settings
+from models.document import Chunk, PipelineJob, ProcessingStatus, DocumentSource, StoredDocument
 from pipeline.fetch import FetchStage, FetchStageError
 from pipeline.clean import CleanStage, CleanStageError
 from pipeline.chunk import ChunkStage, ChunkStageError
+from pipeline.context import job_context
 from pipeline.embed import EmbedStage, EmbedStageError
 from pipeline.store import StoreStage, StoreStageError
+from pipeline.stats import StageStats
 from services.telemetry_db_client import telemetry
+from utils.concurrency import SharedSemaphore
+from utils.ids import id_pool
 
 logger = logging.getLogger(__name__)
 
+# Queued after the last item to tell a consumer the stream has ended
+_END_OF_STREAM = object()
+
+# Stages in run order; job.current_stage is 1-based into this tuple. Stages
+# run strictly in sequence, so the stages completed are always a prefix
+# and need no per-stage bookkeeping.
+STAGE_NAMES = ("fetch", "clean", "chunk", "embed", "store")
+
+
+async def _drain(queue: asyncio.Queue) -> AsyncIterator[Any]:
+    """Yield items from a queue until the end-of-stream marker.
+
+    An exception put on the queue is raised instead of yielded.
+    """
+    while True:
+        item = await queue.get()
+        if item is _END_OF_STREAM:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+async def _fail_stream(queue: asyncio.Queue, error: Exception, consumer: asyncio.Task) -> None:
+    """End a queue's stream with an error and wait for its consumer to finish.
+
+    Items still queued are dropped, so the consumer sees the error next.
+
+    Args:
+        queue: Queue read by the consumer through _drain
+        error: Error for the consumer to raise
+        consumer: Task draining the queue
+    """
+    while not queue.empty():
+        queue.get_nowait()
+    if not consumer.done():
+        queue.put_nowait(error)
+        await asyncio.gather(consumer, return_exceptions=True)
+
+
+async def _put_while_running(queue: asyncio.Queue, item: Any, consumer: asyncio.Task) -> bool:
+    """Put an item on a bounded queue unless its consumer has stopped.
+
+    A plain queue.put() would block forever on a full queue whose
+    consumer has failed, so the put is raced against the consumer task.
+
+    Args:
+        queue: Bounded queue read by the consumer
+        item: Item to enqueue
+        consumer: Task draining the queue
+
+    Returns:
+        True if the item was queued, False if the consumer finished first
+    """
+    if not queue.full():
+        queue.put_nowait(item)
+        return True
+
+    put = asyncio.ensure_future(queue.put(item))
+    await asyncio.wait((put, consumer), return_when=asyncio.FIRST_COMPLETED)
+    if put.done():
+        return True
+    put.cancel()
+    return False
+
 
 class PipelineError(Exception):
     """Exception raised when pipeline execution fails.
@@ -51,8 +122,11 @@ class PipelineError(Exception):
 class PipelineOrchestrator:
     """Orchestrates the complete 5-stage pipeline.
 
-    Manages execution of all pipeline stages in sequence, with error
-    handling, telemetry emission, and job tracking.
+    Manages execution of all pipeline stages, with error handling,
+    telemetry emission, and job tracking. The embed and store stages
+    overlap: each embedding batch is stored while the next is generated.
+    Embed stages across all orchestrators share a limit of
+    settings.EMBED_MAX_CONCURRENCY to stay within the provider's rate limit.
 
     Attributes:
         fetch_stage: Stage 1 - Fetch documents
@@ -70,13 +144,16 @@ class PipelineOrchestrator:
         ... )
     """
 
+    _embed_limit = SharedSemaphore(settings.EMBED_MAX_CONCURRENCY)
+
     def __init__(
         self,
         fetch_stage: Optional[FetchStage] = None,
         clean_stage: Optional[CleanStage] = None,
         chunk_stage: Optional[ChunkStage] = None,
         embed_stage: Optional[EmbedStage] = None,
-        store_stage: Optional[StoreStage] = None
+        store_stage: Optional[StoreStage] = None,
+        queue_size: Optional[int] = None
     ):
         """Initialize pipeline orchestrator.
 
@@ -86,6 +163,8 @@ class PipelineOrchestrator:
             chunk_stage: Custom ChunkStage (creates default if None)
             embed_stage: Custom EmbedStage (creates default if None)
             store_stage: Custom StoreStage (creates default if None)
+            queue_size: Embedding batches buffered between the embed and
+                store stages (defaults to settings.PIPELINE_QUEUE_SIZE)
 
         Example:
             >>> orchestrator = PipelineOrchestrator(
@@ -98,6 +177,7 @@ class PipelineOrchestrator:
         self.chunk_stage = chunk_stage or ChunkStage()
         self.embed_stage = embed_stage or EmbedStage()
         self.store_stage = store_stage or StoreStage()
+        self.queue_size = queue_size or settings.PIPELINE_QUEUE_SIZE
         self.logger = logging.getLogger(__name__)
 
     async def run(
@@ -110,7 +190,8 @@ class PipelineOrchestrator:
     ) -> Dict[str, Any]:
         """Run the complete 5-stage pipeline.
 
-        Executes all stages in sequence, emitting telemetry at each step.
+        Executes all stages, emitting telemetry at each step. Embedding
+        batches are stored as they are generated.
 
         Args:
             source: Source type (file_upload, url_scrape, etc.)
@@ -142,11 +223,40 @@ class PipelineOrchestrator:
             >>> print(f"Created {result['chunks_created']} chunks")
         """
         # Generate IDs
-        job_id = job_id or f"job-{uuid4().hex[:12]}"
-        correlation_id = correlation_id or str(uuid4())
+        job_id = job_id or f"job-{id_pool.next_hex12()}"
+        correlation_id = correlation_id or id_pool.next_uuid()
+
+        # Bind the IDs for every log record and task created by the job
+        with job_context(correlation_id, job_id, tenant_id):
+            return await self._run_job(source, tenant_id, job_id, correlation_id, **source_params)
 
+    async def _run_job(
+        self,
+        source: str,
+        tenant_id: Optional[str],
+        job_id: str,
+        correlation_id: str,
+        **source_params
+    ) -> Dict[str, Any]:
+        """Run the pipeline stages for a job whose context is bound.
+
+        Args:
+            source: Source type (file_upload, url_scrape, etc.)
+            tenant_id: Multi-tenant identifier
+            job_id: Job identifier
+            correlation_id: Correlation ID
+
+        Returns:
+            Dict with pipeline results (see run)
+
+        Raises:
+            PipelineError: If any stage fails
+        """
         # Track pipeline execution
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        # Skip building stage log messages and extras when info is off
+        info = self.logger.isEnabledFor(logging.INFO)
         job = PipelineJob(
             job_id=job_id,
             document_id="",  # Will be set after fetch
@@ -157,23 +267,20 @@ class PipelineOrchestrator:
             correlation_id=correlation_id
         )
 
-        self.logger.info(
-            f"Starting pipeline job: {job_id}",
-            extra={
-                "correlation_id": correlation_id,
-                "job_id": job_id,
-                "source": source,
-                "tenant_id": tenant_id
-            }
-        )
+        if info:
+            self.logger.info(
+                f"Starting pipeline job: {job_id}",
+                extra={"source": source}
+            )
 
-        # Emit job started event
+        # Emit job started event; queued so the write stays off the job's path
         await telemetry.emit_job_started(
             job_id=job_id,
             source=source,
             correlation_id=correlation_id,
             scheduled=source_params.get("scheduled", False),
-            tenant_id=tenant_id
+            tenant_id=tenant_id,
+            wait=False
         )
 
         try:
@@ -183,25 +290,26 @@ class PipelineOrchestrator:
             job.status = ProcessingStatus.FETCHING
             job.current_stage = 1
 
+            fetch_stats = StageStats()
             raw_documents = await self.fetch_stage.execute(
                 source=source,
                 correlation_id=correlation_id,
                 job_id=job_id,
                 tenant_id=tenant_id,
+                stats=fetch_stats,
                 **source_params
             )
 
-            job.stages_completed.append("fetch")
             job.document_id = raw_documents[0].id if raw_documents else "unknown"
 
-            self.logger.info(
-                f"Stage 1/5 complete: Fetched {len(raw_documents)} documents",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "document_count": len(raw_documents)
-                }
-            )
+            if info:
+                self.logger.info(
+                    f"Stage 1/5 complete: Fetched {len(raw_documents)} documents",
+                    extra={
+                        "document_count": len(raw_documents),
+                        "duration_ms": fetch_stats.duration_ms
+                    }
+                )
 
             # ============================================================
             # STAGE 2: CLEAN
@@ -209,24 +317,24 @@ class PipelineOrchestrator:
             job.status = ProcessingStatus.CLEANING
             job.current_stage = 2
 
+            clean_stats = StageStats()
             cleaned_documents = await self.clean_stage.execute(
                 documents=raw_documents,
                 correlation_id=correlation_id,
                 job_id=job_id,
-                tenant_id=tenant_id
+                tenant_id=tenant_id,
+                stats=clean_stats
             )
 
-            job.stages_completed.append("clean")
-
-            self.logger.info(
-                f"Stage 2/5 complete: Cleaned {len(cleaned_documents)} documents",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "document_count": len(cleaned_documents),
-                    "total_words": sum(d.word_count for d in cleaned_documents)
-                }
-            )
+            if info:
+                self.logger.info(
+                    f"Stage 2/5 complete: Cleaned {len(cleaned_documents)} documents",
+                    extra={
+                        "document_count": len(cleaned_documents),
+                        "total_words": clean_stats.total_words,
+                        "duration_ms": clean_stats.duration_ms
+                    }
+                )
 
             # ============================================================
             # STAGE 3: CHUNK
@@ -234,82 +342,48 @@ class PipelineOrchestrator:
             job.status = ProcessingStatus.CHUNKING
             job.current_stage = 3
 
+            chunk_stats = StageStats()
             chunks = await self.chunk_stage.execute(
                 documents=cleaned_documents,
                 correlation_id=correlation_id,
                 job_id=job_id,
-                tenant_id=tenant_id
+                tenant_id=tenant_id,
+                stats=chunk_stats
             )
 
-            job.stages_completed.append("chunk")
-
-            self.logger.info(
-                f"Stage 3/5 complete: Created {len(chunks)} chunks",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "chunk_count": len(chunks),
-                    "avg_chunk_size": sum(c.token_count for c in chunks) / len(chunks) if chunks else 0
-                }
-            )
+            if info:
+                self.logger.info(
+                    f"Stage 3/5 complete: Created {len(chunks)} chunks",
+                    extra={
+                        "chunk_count": len(chunks),
+                        "avg_chunk_size": chunk_stats.total_tokens / chunk_stats.items if chunk_stats.items else 0,
+                        "duration_ms": chunk_stats.duration_ms
+                    }
+                )
 
             # ============================================================
-            # STAGE 4: EMBED
+            # STAGES 4-5: EMBED + STORE
             # ============================================================
-            job.status = ProcessingStatus.EMBEDDING
-            job.current_stage = 4
-
-            embeddings = await self.embed_stage.execute(
+            embedding_count, stored_documents = await self._embed_and_store(
+                job=job,
                 chunks=chunks,
                 correlation_id=correlation_id,
                 job_id=job_id,
-                tenant_id=tenant_id
-            )
-
-            job.stages_completed.append("embed")
-
-            self.logger.info(
-                f"Stage 4/5 complete: Generated {len(embeddings)} embeddings",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "embedding_count": len(embeddings)
-                }
-            )
-
-            # ============================================================
-            # STAGE 5: STORE
-            # ============================================================
-            job.status = ProcessingStatus.STORING
-            job.current_stage = 5
-
-            stored_documents = await self.store_stage.execute(
-                embeddings=embeddings,
-                correlation_id=correlation_id,
-                job_id=job_id,
                 tenant_id=tenant_id,
                 source=source,
                 url=source_params.get("file_path") or source_params.get("url")
             )
 
-            job.stages_completed.append("store")
-
-            self.logger.info(
-                f"Stage 5/5 complete: Stored {len(stored_documents)} documents",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "document_count": len(stored_documents)
-                }
-            )
-
             # ============================================================
             # PIPELINE COMPLETE
             # ============================================================
-            job.status = ProcessingStatus.COMPLETED
-            job.completed_at = datetime.utcnow()
+            # One clock read at job end; the wall-clock completion time is
+            # derived from it
+            total_duration_ms = (time.perf_counter() - start_time) * 1000
 
-            total_duration_ms = (time.time() - start_time) * 1000
+            job.status = ProcessingStatus.COMPLETED
+            job.stages_completed = list(STAGE_NAMES)
+            job.completed_at = job.started_at + timedelta(milliseconds=total_duration_ms)
 
             # Emit job completed event
             await telemetry.emit_job_completed(
@@ -318,26 +392,26 @@ class PipelineOrchestrator:
                 correlation_id=correlation_id,
                 total_duration_ms=total_duration_ms,
                 chunks_created=len(chunks),
-                embeddings_generated=len(embeddings),
+                embeddings_generated=embedding_count,
                 tenant_id=tenant_id,
                 metadata={
                     "documents_fetched": len(raw_documents),
                     "documents_cleaned": len(cleaned_documents),
                     "documents_stored": len(stored_documents),
                     "stages_completed": job.stages_completed
-                }
+                },
+                wait=False
             )
 
-            self.logger.info(
-                f"Pipeline completed successfully: {job_id} in {total_duration_ms:.2f}ms",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "duration_ms": total_duration_ms,
-                    "chunks_created": len(chunks),
-                    "embeddings_generated": len(embeddings)
-                }
-            )
+            if info:
+                self.logger.info(
+                    f"Pipeline completed successfully: {job_id} in {total_duration_ms:.2f}ms",
+                    extra={
+                        "duration_ms": total_duration_ms,
+                        "chunks_created": len(chunks),
+                        "embeddings_generated": embedding_count
+                    }
+                )
 
             # Return results
             return {
@@ -346,7 +420,7 @@ class PipelineOrchestrator:
                 "status": job.status.value,
                 "documents_stored": len(stored_documents),
                 "chunks_created": len(chunks),
-                "embeddings_generated": len(embeddings),
+                "embeddings_generated": embedding_count,
                 "duration_ms": total_duration_ms,
                 "duration_seconds": total_duration_ms / 1000,
                 "stages_completed": job.stages_completed,
@@ -355,44 +429,44 @@ class PipelineOrchestrator:
 
         except (FetchStageError, CleanStageError, ChunkStageError, EmbedStageError, StoreStageError) as e:
             # Stage-specific error already logged and telemetry emitted
+            error = str(e)
             job.status = ProcessingStatus.FAILED
-            job.error_message = str(e)
+            job.stages_completed = list(STAGE_NAMES[:max(job.current_stage - 1, 0)])
+            job.error_message = error
 
-            total_duration_ms = (time.time() - start_time) * 1000
+            total_duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
-                f"Pipeline failed at stage {job.current_stage}: {str(e)}",
+                f"Pipeline failed at stage {job.current_stage}: {error}",
                 extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
                     "failed_stage": job.current_stage,
-                    "error": str(e),
+                    "error": error,
                     "duration_ms": total_duration_ms
-                },
-                exc_info=True
+                }
             )
 
+            # The stage logged the traceback; chain instead of logging it again
             raise PipelineError(
-                f"Pipeline failed at stage {job.current_stage}: {str(e)}",
+                f"Pipeline failed at stage {job.current_stage}: {error}",
                 job_id=job_id,
                 failed_stage=job.current_stage,
-                error=str(e)
-            )
+                error=error
+            ) from e
 
         except Exception as e:
             # Unexpected error
+            error = str(e)
             job.status = ProcessingStatus.FAILED
-            job.error_message = str(e)
+            job.stages_completed = list(STAGE_NAMES[:max(job.current_stage - 1, 0)])
+            job.error_message = error
 
-            total_duration_ms = (time.time() - start_time) * 1000
+            total_duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
-                f"Pipeline failed with unexpected error: {str(e)}",
+                f"Pipeline failed with unexpected error: {error}",
                 extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
                     "current_stage": job.current_stage,
-                    "error": str(e),
+                    "error": error,
                     "duration_ms": total_duration_ms
                 },
                 exc_info=True
@@ -405,25 +479,198 @@ class PipelineOrchestrator:
                 correlation_id=correlation_id,
                 failed_stage=f"stage_{job.current_stage}",
                 error_type=e.__class__.__name__,
-                error_message=str(e),
+                error_message=error,
                 tenant_id=tenant_id
             )
 
             raise PipelineError(
-                f"Pipeline failed: {str(e)}",
+                f"Pipeline failed: {error}",
                 job_id=job_id,
                 current_stage=job.current_stage,
-                error=str(e)
+                error=error
+            ) from e
+
+    async def _embed_and_store(
+        self,
+        job: PipelineJob,
+        chunks: List[Chunk],
+        correlation_id: str,
+        job_id: str,
+        tenant_id: Optional[str],
+        source: str,
+        url: Optional[str]
+    ) -> Tuple[int, List[StoredDocument]]:
+        """Run the embed and store stages concurrently.
+
+        The store stage runs as a task fed through a bounded queue, so each
+        embedding batch is written to DataForge while the next batch is
+        being generated, and at most queue_size batches wait in between.
+        Jobs whose chunks fit in one embedding batch (typically a single
+        small document) have nothing to overlap, so they run the two
+        stages back to back without the queue and task.
+
+        Args:
+            job: Job being tracked; its stage fields are updated
+            chunks: Chunks to embed
+            correlation_id: Distributed tracing ID
+            job_id: Job identifier
+            tenant_id: Multi-tenant identifier
+            source: Document source type
+            url: Optional source URL
+
+        Returns:
+            Tuple of (embeddings generated, stored documents)
+
+        Raises:
+            EmbedStageError: If embedding generation fails
+            StoreStageError: If storage fails
+        """
+        job.status = ProcessingStatus.EMBEDDING
+        job.current_stage = 4
+        info = self.logger.isEnabledFor(logging.INFO)
+
+        if len(chunks) <= self.embed_stage.embedding_service.batch_size:
+            async with self._embed_limit:
+                embeddings = await self.embed_stage.execute(
+                    chunks=chunks,
+                    correlation_id=correlation_id,
+                    job_id=job_id,
+                    tenant_id=tenant_id
+                )
+            embedding_count = len(embeddings)
+
+            if info:
+                self.logger.info(
+                    f"Stage 4/5 complete: Generated {embedding_count} embeddings",
+                    extra={
+                        "embedding_count": embedding_count
+                    }
+                )
+
+            job.status = ProcessingStatus.STORING
+            job.current_stage = 5
+
+            stored_documents = await self.store_stage.execute(
+                embeddings=embeddings,
+                correlation_id=correlation_id,
+                job_id=job_id,
+                tenant_id=tenant_id,
+                source=source,
+                url=url
+            )
+        else:
+            embedding_count, stored_documents = await self._embed_and_store_streaming(
+                job, chunks, correlation_id, job_id, tenant_id, source, url
+            )
+
+        if info:
+            self.logger.info(
+                f"Stage 5/5 complete: Stored {len(stored_documents)} documents",
+                extra={
+                    "document_count": len(stored_documents)
+                }
+            )
+
+        return embedding_count, stored_documents
+
+    async def _embed_and_store_streaming(
+        self,
+        job: PipelineJob,
+        chunks: List[Chunk],
+        correlation_id: str,
+        job_id: str,
+        tenant_id: Optional[str],
+        source: str,
+        url: Optional[str]
+    ) -> Tuple[int, List[StoredDocument]]:
+        """Embed chunks batch by batch while a store task writes each batch.
+
+        If embedding fails part way, queued batches are dropped and the
+        documents whose embeddings were already stored are recorded with
+        FAILED status before the error propagates.
+
+        Args:
+            job: Job being tracked; its stage fields are updated
+            chunks: Chunks to embed
+            correlation_id: Distributed tracing ID
+            job_id: Job identifier
+            tenant_id: Multi-tenant identifier
+            source: Document source type
+            url: Optional source URL
+
+        Returns:
+            Tuple of (embeddings generated, stored documents)
+        """
+        info = self.logger.isEnabledFor(logging.INFO)
+
+        batches: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        store_task = asyncio.create_task(self.store_stage.execute_stream(
+            embedding_batches=_drain(batches),
+            correlation_id=correlation_id,
+            job_id=job_id,
+            tenant_id=tenant_id,
+            source=source,
+            url=url
+        ))
+        embedding_count = 0
+
+        try:
+            embed_stream = self.embed_stage.execute_stream(
+                chunks=chunks,
+                correlation_id=correlation_id,
+                job_id=job_id,
+                tenant_id=tenant_id
             )
+            try:
+                async with self._embed_limit, aclosing(embed_stream):
+                    async for batch in embed_stream:
+                        embedding_count += len(batch)
+                        if store_task.done() or not await _put_while_running(batches, batch, store_task):
+                            break
+            except Exception as e:
+                # Batches already stored would be left without document
+                # metadata; the store task records their documents as failed
+                await _fail_stream(batches, e, store_task)
+                raise
+
+            # The store task only returns after the end-of-stream marker,
+            # so finishing early means it failed
+            if store_task.done():
+                job.current_stage = 5
+                await store_task
+
+            if info:
+                self.logger.info(
+                    f"Stage 4/5 complete: Generated {embedding_count} embeddings",
+                    extra={
+                        "embedding_count": embedding_count
+                    }
+                )
+
+            job.status = ProcessingStatus.STORING
+            job.current_stage = 5
+
+            await _put_while_running(batches, _END_OF_STREAM, store_task)
+            stored_documents = await store_task
+
+        finally:
+            # Stop the store task if it is still running and collect its result
+            store_task.cancel()
+            await asyncio.gather(store_task, return_exceptions=True)
+
+        return embedding_count, stored_documents
 
     async def close(self) -> None:
-        """Close all stage resources.
+        """Close all stage resources and write queued telemetry.
 
         Should be called during application shutdown.
 
         Example:
             >>> await orchestrator.close()
         """
+        await telemetry.flush()
+        if self.fetch_stage:
+            await self.fetch_stage.close()
         if self.embed_stage:
             await self.embed_stage.close()
         if self.store_stage:
@@ -20,18 +20,84 @@ Example:
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import re
+import threading
 import tiktoken
 import numpy as np
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Optional, cast
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 
 from sentence_transformers import SentenceTransformer
 from models.document import CleanedDocument, Chunk
+from utils.concurrency import SharedSemaphore
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries: whitespace after . ? or ! that doesn't follow an
+# abbreviation like "e.g." or "Dr."
+_SENTENCE_RE = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|!)\s')
+
+
+def _char_boundary(data: bytes, pos: int) -> int:
+    """Move a byte offset in UTF-8 data forward to the next character start."""
+    while pos < len(data) and 0x80 <= data[pos] < 0xC0:
+        pos += 1
+    return pos
+
+
+# Sentences embedded at a time during boundary detection; consecutive
+# windows share one sentence, so every adjacent pair is still compared
+_BOUNDARY_WINDOW = 512
+
+# Threads for batched tokenization (tiktoken releases the GIL while encoding)
+_TOKENIZER_THREADS = os.cpu_count() or 1
+
+# Serializes model loads so concurrent workers don't load the same weights twice
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _get_tokenizer(name: str) -> tiktoken.Encoding:
+    """
+    Get a tiktoken encoding, shared by every chunker that uses it.
+    
+    Args:
+        name: Tiktoken encoding name
+    
+    Returns:
+        Tiktoken encoding
+    """
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=4)
+def _load_embedding_model(name: str) -> SentenceTransformer:
+    """Load a sentence transformer model (call through _get_embedding_model)."""
+    logger.info(f"Loading sentence transformer model: {name}")
+    return SentenceTransformer(name)
+
+
+def _get_embedding_model(name: str) -> SentenceTransformer:
+    """
+    Get a sentence transformer model, shared by every chunker that uses it.
+    
+    The weights are loaded once per process; later chunkers reuse them.
+    
+    Args:
+        name: Sentence transformer model name
+    
+    Returns:
+        Sentence transformer model
+    """
+    with _model_lock:
+        return _load_embedding_model(name)
+
 
 class ChunkingStrategy(str, Enum):
     """Chunking strategy options."""
@@ -66,6 +132,8 @@ class SemanticChunker:
         similarity_threshold: Threshold for detecting topic boundaries
         embedding_model: Sentence transformer model for embeddings
         tokenizer: Tiktoken tokenizer for accurate token counting
+        embedding_cache_size: Maximum number of sentence embeddings kept
+        smoothing_window: Sentences on each side averaged into a similarity
     
     Example:
         >>> chunker = SemanticChunker(
@@ -77,6 +145,10 @@ class SemanticChunker:
         >>> chunks = await chunker.chunk_document(document)
     """
     
+    # One encode at a time: the shared model already saturates the device,
+    # and concurrent forward passes would only contend for it
+    _encode_limit = SharedSemaphore(1)
+    
     def __init__(
         self,
         chunk_size: int = 500,
@@ -84,7 +156,9 @@ class SemanticChunker:
         strategy: ChunkingStrategy = ChunkingStrategy.HYBRID,
         similarity_threshold: float = 0.5,
         embedding_model: str = "all-MiniLM-L6-v2",  # Fast, lightweight model
-        tokenizer_model: str = "cl100k_base"
+        tokenizer_model: str = "cl100k_base",
+        embedding_cache_size: int = 10000,
+        smoothing_window: int = 0
     ):
         """
         Initialize semantic chunker.
@@ -98,21 +172,32 @@ class SemanticChunker:
                                   Higher = fewer boundaries (longer chunks)
             embedding_model: Sentence transformer model name
             tokenizer_model: Tiktoken model for token counting
+            embedding_cache_size: Maximum number of sentence embeddings kept
+                                  for reuse across documents (0 disables)
+            smoothing_window: Average each adjacent-pair similarity with the
+                              k pairs on either side before thresholding, so
+                              one off-topic sentence doesn't split a topic
+                              (0 = no smoothing)
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.strategy = strategy
         self.similarity_threshold = similarity_threshold
+        self.embedding_cache_size = embedding_cache_size
+        self.smoothing_window = smoothing_window
+        
+        # LRU cache of sentence embeddings keyed by content hash, so
+        # boilerplate repeated across documents is embedded once
+        self._embed_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
         
         # Initialize tiktoken for accurate token counting
-        self.tokenizer = tiktoken.get_encoding(tokenizer_model)
+        self.tokenizer = _get_tokenizer(tokenizer_model)
         
         # Initialize sentence transformer for semantic embeddings
         # Only load if semantic or hybrid strategy
         self.embedding_model = None
         if strategy in (ChunkingStrategy.SEMANTIC, ChunkingStrategy.HYBRID):
-            logger.info(f"Loading sentence transformer model: {embedding_model}")
-            self.embedding_model = SentenceTransformer(embedding_model)
+            self.embedding_model = _get_embedding_model(embedding_model)
         
         logger.info(
             f"SemanticChunker initialized: strategy={strategy.value}, "
@@ -136,9 +221,29 @@ class SemanticChunker:
         """
         return len(self.tokenizer.encode(text))
     
-    def _split_into_sentences(self, text: str) -> List[str]:
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
         """
-        Split text into sentences.
+        Count tokens of many texts in one call.
+        
+        Texts are encoded across threads in native code. With a single CPU
+        they are encoded in a plain loop instead, since a thread pool would
+        only add per-text overhead.
+        
+        Args:
+            texts: Texts to count tokens for
+        
+        Returns:
+            Token count of each text
+        """
+        if _TOKENIZER_THREADS > 1:
+            encoded = self.tokenizer.encode_ordinary_batch(texts, num_threads=_TOKENIZER_THREADS)
+        else:
+            encoded = [self.tokenizer.encode_ordinary(text) for text in texts]
+        return [len(ids) for ids in encoded]
+    
+    def _split_into_sentences(self, text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+        """
+        Split text into sentences, keeping each sentence's offsets.
         
         Uses simple regex for now. Could be enhanced with NLTK or spaCy
         for better accuracy.
@@ -147,12 +252,90 @@ class SemanticChunker:
             text: Text to split
         
         Returns:
-            List of sentences
+            List of stripped sentences, and the (start_char, end_char) of
+            each sentence within text
         """
-        import re
-        # Enhanced sentence splitting (handles abbreviations better)
-        sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|!)\s', text)
-        return [s.strip() for s in sentences if s.strip()]
+        sentences: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        
+        # Enhanced sentence splitting (handles abbreviations better); each
+        # separator is a single whitespace character
+        start = 0
+        ends = [match.start() for match in _SENTENCE_RE.finditer(text)]
+        ends.append(len(text))
+        for end in ends:
+            piece = text[start:end]
+            sentence = piece.strip()
+            if sentence:
+                offset = start + len(piece) - len(piece.lstrip())
+                sentences.append(sentence)
+                spans.append((offset, offset + len(sentence)))
+            start = end + 1
+        
+        return sentences, spans
+    
+    async def _embed_sentences(self, sentences: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Embed sentences, reusing cached embeddings of previously seen ones.
+        
+        Misses are encoded in one batched call in a worker thread, so the
+        event loop keeps running, and added to the cache; least recently
+        used entries are evicted past embedding_cache_size.
+        
+        Vectors are rounded to float16 and cached that way, which halves
+        cache memory and is ample precision for a threshold compare; every
+        vector is rounded, cached or not, so results don't depend on cache
+        state. They are widened back to float32 for the similarity math,
+        because NumPy has no native float16 arithmetic on CPU and computing
+        in it is far slower.
+        
+        Args:
+            sentences: List of sentences
+            batch_size: Encoder batch size
+        
+        Returns:
+            Unit-length embeddings, one row per sentence
+        """
+        cache = self._embed_cache
+        keys = [hashlib.blake2b(s.encode(), digest_size=16).digest() for s in sentences]
+        
+        # Take hits before awaiting, since other documents may evict them;
+        # each distinct uncached sentence is encoded once
+        rows: List[Optional[np.ndarray]] = [None] * len(sentences)
+        misses: Dict[bytes, List[int]] = {}
+        for i, key in enumerate(keys):
+            row = cache.get(key)
+            if row is not None:
+                cache.move_to_end(key)
+                rows[i] = row
+            else:
+                misses.setdefault(key, []).append(i)
+        
+        if misses:
+            # Only semantic and hybrid chunkers embed, and they load a model
+            assert self.embedding_model is not None
+            async with self._encode_limit:
+                encoded = await asyncio.to_thread(
+                    self.embedding_model.encode,
+                    [sentences[indices[0]] for indices in misses.values()],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
+            encoded = encoded.astype(np.float16)
+            for indices, row in zip(misses.values(), encoded):
+                for i in indices:
+                    rows[i] = row
+            
+            if self.embedding_cache_size > 0:
+                # Copy rows so cached entries don't pin whole encode batches
+                cache.update((key, row.copy()) for key, row in zip(misses, encoded))
+                while len(cache) > self.embedding_cache_size:
+                    cache.popitem(last=False)
+        
+        # Every row is filled by now, from the cache or the encoder
+        return np.stack(cast(List[np.ndarray], rows)).astype(np.float32, copy=False)
     
     async def _detect_semantic_boundaries(
         self,
@@ -162,9 +345,13 @@ class SemanticChunker:
         Detect semantic boundaries between sentences using embeddings.
         
         Algorithm:
-        1. Generate embeddings for all sentences
+        1. Generate embeddings for a window of sentences
         2. Calculate cosine similarity between adjacent sentences
-        3. Mark low-similarity pairs as boundaries
+        3. Repeat over overlapping windows to the end of the document
+        4. Mark low-similarity pairs as boundaries
+        
+        Only one window of embeddings is held at a time, so memory stays
+        bounded however long the document is.
         
         Args:
             sentences: List of sentences
@@ -175,115 +362,179 @@ class SemanticChunker:
         if not self.embedding_model or len(sentences) < 2:
             return []
         
-        # Generate embeddings for all sentences
-        embeddings = self.embedding_model.encode(sentences)
+        # Each window starts on the previous window's last sentence
+        window_similarities = []
+        for start in range(0, len(sentences) - 1, _BOUNDARY_WINDOW - 1):
+            # Unit-length embeddings, so cosine similarity is a plain dot product
+            embeddings = await self._embed_sentences(sentences[start:start + _BOUNDARY_WINDOW])
+            window_similarities.append(self._adjacent_similarities(embeddings))
         
-        # Calculate cosine similarity between adjacent sentences
-        boundaries: List[SemanticBoundary] = []
+        return self._boundaries_from_similarities(np.concatenate(window_similarities))
+    
+    def _boundaries_from_embeddings(self, embeddings: np.ndarray) -> List[SemanticBoundary]:
+        """
+        Mark semantic boundaries from precomputed sentence embeddings.
         
-        for i in range(len(sentences) - 1):
-            # Cosine similarity between current and next sentence
-            similarity = np.dot(embeddings[i], embeddings[i + 1]) / (
-                np.linalg.norm(embeddings[i]) * np.linalg.norm(embeddings[i + 1])
-            )
-            
-            # Mark as boundary if similarity is below threshold
-            is_boundary = similarity < self.similarity_threshold
-            
-            boundaries.append(SemanticBoundary(
+        Args:
+            embeddings: Unit-length embeddings, one row per sentence
+        
+        Returns:
+            List of semantic boundaries
+        """
+        if len(embeddings) < 2:
+            return []
+        
+        return self._boundaries_from_similarities(self._adjacent_similarities(embeddings))
+    
+    def _adjacent_similarities(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Compute the cosine similarity of each pair of adjacent sentences.
+        
+        Args:
+            embeddings: Unit-length embeddings, one row per sentence
+        
+        Returns:
+            Similarity of rows i and i+1 at index i
+        """
+        # Cosine similarity of every adjacent pair in one vectorized pass.
+        # Only the N-1 adjacent dot products are computed, O(N*d): a full
+        # E @ E.T GEMM, quantized or not, would do N times the work to
+        # read back its superdiagonal, and this pass already costs well
+        # under a millisecond next to the encoder's forward pass
+        return np.einsum('ij,ij->i', embeddings[:-1], embeddings[1:])
+    
+    def _boundaries_from_similarities(self, similarities: np.ndarray) -> List[SemanticBoundary]:
+        """
+        Mark semantic boundaries from adjacent-pair similarities.
+        
+        Args:
+            similarities: Similarity of sentences i and i+1 at index i
+        
+        Returns:
+            List of semantic boundaries
+        """
+        # Moving average over the window from prefix sums; pairs near the
+        # edges are averaged over the neighbours they actually have
+        if self.smoothing_window > 0:
+            n = len(similarities)
+            index = np.arange(n)
+            lo = np.maximum(index - self.smoothing_window, 0)
+            hi = np.minimum(index + self.smoothing_window + 1, n)
+            prefix = np.concatenate(([0.0], np.cumsum(similarities)))
+            similarities = (prefix[hi] - prefix[lo]) / (hi - lo)
+        
+        # Mark pairs below the threshold as boundaries
+        is_boundary = similarities < self.similarity_threshold
+        boundaries: List[SemanticBoundary] = [
+            SemanticBoundary(
                 position=i,
-                similarity_score=float(similarity),
-                is_boundary=is_boundary
-            ))
+                similarity_score=similarity,
+                is_boundary=boundary
+            )
+            for i, (similarity, boundary) in enumerate(zip(similarities.tolist(), is_boundary.tolist()))
+        ]
         
         return boundaries
     
     async def _chunk_token_based(
         self,
-        sentences: List[str],
         document: CleanedDocument
     ) -> List[Chunk]:
         """
-        Original token-based chunking (no semantic awareness).
+        Token-based chunking (no semantic awareness).
+        
+        Encodes the whole document once and cuts windows of chunk_size
+        tokens that advance by chunk_size - overlap, so no sentence
+        splitting or per-sentence tokenization is needed.
         
         Args:
-            sentences: List of sentences
             document: Parent document
         
         Returns:
-            List of chunks
+            List of chunks (none for a blank document)
         """
+        # Whitespace would otherwise come back as whitespace-only chunks
+        if not document.content or document.content.isspace():
+            return []
+        
+        ids = self.tokenizer.encode_ordinary(document.content)
+        step = max(1, self.chunk_size - self.overlap)
+        
+        # Window edges are found as byte offsets (exact, since the token
+        # bytes concatenate to the UTF-8 content) and moved forward to the
+        # next character boundary when a token splits a character
+        data = document.content.encode("utf-8")
+        token_byte = 0  # Byte offset of the window's first token
+        start_byte = 0  # Window start, on a character boundary
+        start_char = 0
+        
+        base_metadata = self._base_metadata(document, "token_based")
         chunks: List[Chunk] = []
-        current_chunk = []
-        current_tokens = 0
-        chunk_position = 0
         
-        for sentence in sentences:
-            sentence_tokens = self.count_tokens(sentence)
-            
-            if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
-                # Save current chunk
-                chunk_text = ' '.join(current_chunk)
+        for start in range(0, len(ids), step):
+            window = ids[start:start + self.chunk_size]
+            end_byte = _char_boundary(data, token_byte + len(self.tokenizer.decode_bytes(window)))
+            # A tiny window can fall entirely inside one character
+            if end_byte > start_byte:
                 chunks.append(self._create_chunk(
                     document=document,
-                    content=chunk_text,
-                    position=chunk_position,
-                    token_count=current_tokens,
-                    strategy="token_based"
+                    start_char=start_char,
+                    end_char=start_char + len(data[start_byte:end_byte].decode("utf-8")),
+                    position=len(chunks),
+                    token_count=len(window),
+                    base_metadata=base_metadata
                 ))
-                chunk_position += 1
-                
-                # Start new chunk with overlap
-                if self.overlap > 0:
-                    overlap_sentences = current_chunk[-(len(current_chunk) // 4):]
-                    current_chunk = overlap_sentences + [sentence]
-                    current_tokens = sum(self.count_tokens(s) for s in current_chunk)
-                else:
-                    current_chunk = [sentence]
-                    current_tokens = sentence_tokens
-            else:
-                current_chunk.append(sentence)
-                current_tokens += sentence_tokens
+            
+            # The last window reached the end of the document
+            if start + self.chunk_size >= len(ids):
+                break
+            
+            # Advance past the tokens stepped over
+            token_byte += len(self.tokenizer.decode_bytes(ids[start:start + step]))
+            next_byte = _char_boundary(data, token_byte)
+            start_char += len(data[start_byte:next_byte].decode("utf-8"))
+            start_byte = next_byte
         
-        # Save final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
-            chunks.append(self._create_chunk(
-                document=document,
-                content=chunk_text,
-                position=chunk_position,
-                token_count=self.count_tokens(chunk_text),
-                strategy="token_based"
-            ))
+        logger.info(
+            f"Chunked document {document.id}: "
+            f"{len(ids)} tokens → {len(chunks)} chunks "
+            f"(strategy={self.strategy.value})"
+        )
         
         return chunks
     
     async def _chunk_semantic(
         self,
         sentences: List[str],
-        document: CleanedDocument
+        spans: List[Tuple[int, int]],
+        token_counts: List[int],
+        document: CleanedDocument,
+        boundaries: Optional[List[SemanticBoundary]] = None
     ) -> List[Chunk]:
         """
         Pure semantic chunking (respect topic boundaries).
         
         Args:
             sentences: List of sentences
+            spans: (start_char, end_char) of each sentence in the document
+            token_counts: Token count of each sentence
             document: Parent document
+            boundaries: Precomputed semantic boundaries (detected if None)
         
         Returns:
             List of chunks
         """
         # Detect semantic boundaries
-        boundaries = await self._detect_semantic_boundaries(sentences)
+        if boundaries is None:
+            boundaries = await self._detect_semantic_boundaries(sentences)
         
+        base_metadata = self._base_metadata(document, "semantic")
         chunks: List[Chunk] = []
-        current_chunk = []
+        chunk_start = 0  # Index of the current chunk's first sentence
         current_tokens = 0
         chunk_position = 0
         
-        for i, sentence in enumerate(sentences):
-            sentence_tokens = self.count_tokens(sentence)
-            current_chunk.append(sentence)
+        for i, sentence_tokens in enumerate(token_counts):
             current_tokens += sentence_tokens
             
             # Check if we should split here
@@ -298,29 +549,29 @@ class SemanticChunker:
                 should_split = True
             
             # Save chunk if splitting
-            if should_split and current_chunk:
-                chunk_text = ' '.join(current_chunk)
+            if should_split:
                 chunks.append(self._create_chunk(
                     document=document,
-                    content=chunk_text,
+                    start_char=spans[chunk_start][0],
+                    end_char=spans[i][1],
                     position=chunk_position,
                     token_count=current_tokens,
-                    strategy="semantic",
+                    base_metadata=base_metadata,
                     boundary_score=boundaries[i].similarity_score if i < len(boundaries) else None
                 ))
                 chunk_position += 1
-                current_chunk = []
+                chunk_start = i + 1
                 current_tokens = 0
         
         # Save final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
+        if chunk_start < len(sentences):
             chunks.append(self._create_chunk(
                 document=document,
-                content=chunk_text,
+                start_char=spans[chunk_start][0],
+                end_char=spans[-1][1],
                 position=chunk_position,
-                token_count=self.count_tokens(chunk_text),
-                strategy="semantic"
+                token_count=current_tokens,
+                base_metadata=base_metadata
             ))
         
         return chunks
@@ -328,7 +579,10 @@ class SemanticChunker:
     async def _chunk_hybrid(
         self,
         sentences: List[str],
-        document: CleanedDocument
+        spans: List[Tuple[int, int]],
+        token_counts: List[int],
+        document: CleanedDocument,
+        boundaries: Optional[List[SemanticBoundary]] = None
     ) -> List[Chunk]:
         """
         Hybrid chunking: respect semantic boundaries but enforce token limits.
@@ -339,22 +593,25 @@ class SemanticChunker:
         
         Args:
             sentences: List of sentences
+            spans: (start_char, end_char) of each sentence in the document
+            token_counts: Token count of each sentence
             document: Parent document
+            boundaries: Precomputed semantic boundaries (detected if None)
         
         Returns:
             List of chunks
         """
         # Detect semantic boundaries
-        boundaries = await self._detect_semantic_boundaries(sentences)
+        if boundaries is None:
+            boundaries = await self._detect_semantic_boundaries(sentences)
         
+        base_metadata = self._base_metadata(document, "hybrid")
         chunks: List[Chunk] = []
-        current_chunk = []
+        chunk_start = 0  # Index of the current chunk's first sentence
         current_tokens = 0
         chunk_position = 0
         
-        for i, sentence in enumerate(sentences):
-            sentence_tokens = self.count_tokens(sentence)
-            current_chunk.append(sentence)
+        for i, sentence_tokens in enumerate(token_counts):
             current_tokens += sentence_tokens
             
             # Determine if we should split
@@ -373,73 +630,97 @@ class SemanticChunker:
                     split_reason = "semantic_boundary"
             
             # Save chunk if splitting
-            if should_split and current_chunk:
-                chunk_text = ' '.join(current_chunk)
+            if should_split:
                 chunks.append(self._create_chunk(
                     document=document,
-                    content=chunk_text,
+                    start_char=spans[chunk_start][0],
+                    end_char=spans[i][1],
                     position=chunk_position,
                     token_count=current_tokens,
-                    strategy="hybrid",
+                    base_metadata=base_metadata,
                     split_reason=split_reason,
                     boundary_score=boundaries[i].similarity_score if i < len(boundaries) else None
                 ))
                 chunk_position += 1
                 
-                # Start new chunk with overlap if at token limit
+                # Start new chunk with overlap if at token limit (the last
+                # quarter of the chunk's sentences, or all of them in a chunk
+                # of under 4); only the kept sentences are re-summed
                 if split_reason == "token_limit" and self.overlap > 0:
-                    overlap_sentences = current_chunk[-(len(current_chunk) // 4):]
-                    current_chunk = overlap_sentences
-                    current_tokens = sum(self.count_tokens(s) for s in current_chunk)
+                    kept = (i + 1 - chunk_start) // 4 or i + 1 - chunk_start
+                    chunk_start = i + 1 - kept
+                    current_tokens = sum(token_counts[chunk_start:i + 1])
                 else:
-                    current_chunk = []
+                    chunk_start = i + 1
                     current_tokens = 0
         
         # Save final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
+        if chunk_start < len(sentences):
             chunks.append(self._create_chunk(
                 document=document,
-                content=chunk_text,
+                start_char=spans[chunk_start][0],
+                end_char=spans[-1][1],
                 position=chunk_position,
-                token_count=self.count_tokens(chunk_text),
-                strategy="hybrid"
+                token_count=current_tokens,
+                base_metadata=base_metadata
             ))
         
         return chunks
     
+    def _base_metadata(self, document: CleanedDocument, strategy: str) -> Dict[str, Any]:
+        """
+        Build the metadata shared by every chunk of a document.
+        
+        Args:
+            document: Parent document
+            strategy: Chunking strategy used
+        
+        Returns:
+            Document metadata plus the chunking settings
+        """
+        return {
+            **document.metadata,
+            "chunk_strategy": strategy,
+            "chunk_size_tokens": self.chunk_size,
+            "overlap_tokens": self.overlap,
+        }
+    
     def _create_chunk(
         self,
         document: CleanedDocument,
-        content: str,
+        start_char: int,
+        end_char: int,
         position: int,
         token_count: int,
-        strategy: str,
+        base_metadata: Dict[str, Any],
         boundary_score: Optional[float] = None,
         split_reason: Optional[str] = None
     ) -> Chunk:
         """
         Create a Chunk object with metadata.
         
+        The content is sliced from the document, so it keeps the original
+        whitespace between sentences.
+        
+        Skips Pydantic validation: the strategies only emit non-empty spans
+        of at least one token, so the model's checks always pass, and
+        validating would copy the metadata dict a second time.
+        
         Args:
             document: Parent document
-            content: Chunk content
+            start_char: Start of the chunk in the document
+            end_char: End of the chunk in the document
             position: Chunk position
             token_count: Accurate token count
-            strategy: Chunking strategy used
+            base_metadata: Metadata shared by the document's chunks (from
+                _base_metadata)
             boundary_score: Semantic boundary score (if applicable)
             split_reason: Reason for split (hybrid mode)
         
         Returns:
             Chunk object
         """
-        metadata = {
-            **document.metadata,
-            "chunk_strategy": strategy,
-            "chunk_size_tokens": self.chunk_size,
-            "overlap_tokens": self.overlap,
-            "actual_tokens": token_count,
-        }
+        metadata = {**base_metadata, "actual_tokens": token_count}
         
         if boundary_score is not None:
             metadata["boundary_similarity"] = round(boundary_score, 3)
@@ -447,14 +728,14 @@ class SemanticChunker:
         if split_reason:
             metadata["split_reason"] = split_reason
         
-        return Chunk(
+        return Chunk.model_construct(
             document_id=document.id,
-            content=content,
+            content=document.content[start_char:end_char],
             metadata=metadata,
             position=position,
             token_count=token_count,
-            start_char=0,  # Would need full document to calculate accurately
-            end_char=len(content),
+            start_char=start_char,
+            end_char=end_char,
             tenant_id=document.tenant_id
         )
     
@@ -476,19 +757,180 @@ class SemanticChunker:
             >>> print(f"Created {len(chunks)} chunks")
             >>> print(f"Avg tokens: {sum(c.token_count for c in chunks) / len(chunks):.0f}")
         """
+        # Token windows need no sentence splitting
+        if self.strategy == ChunkingStrategy.TOKEN_BASED:
+            return await self._chunk_token_based(document)
+        
+        # A document that fits in one chunk needs no embeddings
+        whole = self._chunk_whole_document(document)
+        if whole is not None:
+            return whole
+        
         # Split into sentences
-        sentences = self._split_into_sentences(document.content)
+        sentences, spans = self._split_into_sentences(document.content)
         
         if not sentences:
             return []
         
-        # Apply strategy
+        # Tokenize every sentence in one batched call and keep the counts,
+        # so the strategies never re-encode a sentence
+        token_counts = self._count_tokens_batch(sentences)
+        
+        return await self._apply_strategy(document, sentences, spans, token_counts)
+    
+    def _chunk_whole_document(self, document: CleanedDocument) -> Optional[List[Chunk]]:
+        """
+        Chunk a document that fits within chunk_size as a single chunk.
+        
+        Documents over 8 characters per allowed token are assumed not to
+        fit and are not tokenized, so long documents don't pay for an
+        extra full encode.
+        
+        Args:
+            document: Cleaned document to chunk
+        
+        Returns:
+            The document as one chunk (or no chunks if it is blank), or
+            None if it needs splitting
+        """
+        content = document.content
+        if len(content) > self.chunk_size * 8:
+            return None
+        
+        stripped = content.strip()
+        if not stripped:
+            return []
+        
+        total_tokens = len(self.tokenizer.encode_ordinary(stripped))
+        if total_tokens > self.chunk_size:
+            return None
+        
+        start_char = len(content) - len(content.lstrip())
+        return [self._create_chunk(
+            document=document,
+            start_char=start_char,
+            end_char=start_char + len(stripped),
+            position=0,
+            token_count=total_tokens,
+            base_metadata=self._base_metadata(document, self.strategy.value)
+        )]
+    
+    async def chunk_documents(
+        self,
+        documents: List[CleanedDocument]
+    ) -> List[List[Chunk]]:
+        """
+        Chunk several documents, embedding all of their sentences at once.
+        
+        Equivalent to calling chunk_document on each document, but the
+        sentences of every document are tokenized in one batch and encoded
+        in one large forward pass, which keeps the model busy even when
+        individual documents are short.
+        
+        Args:
+            documents: Cleaned documents to chunk
+        
+        Returns:
+            List of chunks for each document, in input order
+        
+        Example:
+            >>> per_doc = await chunker.chunk_documents(documents)
+            >>> print(f"Created {sum(map(len, per_doc))} chunks")
+        """
         if self.strategy == ChunkingStrategy.TOKEN_BASED:
-            chunks = await self._chunk_token_based(sentences, document)
-        elif self.strategy == ChunkingStrategy.SEMANTIC:
-            chunks = await self._chunk_semantic(sentences, document)
+            return [await self._chunk_token_based(doc) for doc in documents]
+        
+        # Documents that fit in one chunk are not split or embedded
+        wholes = [self._chunk_whole_document(doc) for doc in documents]
+        doc_splits = [
+            self._split_into_sentences(doc.content) if whole is None else ([], [])
+            for doc, whole in zip(documents, wholes)
+        ]
+        doc_sentences = [sentences for sentences, _ in doc_splits]
+        all_sentences = [s for sentences in doc_sentences for s in sentences]
+        offsets = np.cumsum([0] + [len(sentences) for sentences in doc_sentences]).tolist()
+        
+        all_counts = self._count_tokens_batch(all_sentences)
+        
+        # One forward pass over every document's sentences
+        embeddings = None
+        if self.embedding_model and all_sentences:
+            embeddings = await self._embed_sentences(all_sentences, batch_size=256)
+        
+        async def chunk_one(k: int) -> List[Chunk]:
+            whole = wholes[k]
+            if whole is not None:
+                return whole
+            if not doc_sentences[k]:
+                return []
+            start, end = offsets[k], offsets[k + 1]
+            boundaries = None
+            if embeddings is not None:
+                boundaries = self._boundaries_from_embeddings(embeddings[start:end])
+            sentences, spans = doc_splits[k]
+            return await self._apply_strategy(
+                documents[k], sentences, spans, all_counts[start:end], boundaries
+            )
+        
+        return list(await asyncio.gather(*(chunk_one(k) for k in range(len(documents)))))
+    
+    async def chunk_many(
+        self,
+        documents: List[CleanedDocument],
+        concurrency: int = 4
+    ) -> List[List[Chunk]]:
+        """
+        Chunk documents concurrently, a bounded number at a time.
+        
+        Each document is chunked with chunk_document, so splitting and
+        tokenizing one document overlaps with encoding another. Prefer this
+        over chunk_documents for large batches, whose sentences should not
+        all be embedded in one pass; prefer chunk_documents for many short
+        documents.
+        
+        Args:
+            documents: Cleaned documents to chunk
+            concurrency: Maximum documents chunked at once
+        
+        Returns:
+            List of chunks for each document, in input order
+        
+        Example:
+            >>> per_doc = await chunker.chunk_many(documents, concurrency=8)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def chunk_one(document: CleanedDocument) -> List[Chunk]:
+            async with semaphore:
+                return await self.chunk_document(document)
+        
+        return list(await asyncio.gather(*(chunk_one(doc) for doc in documents)))
+    
+    async def _apply_strategy(
+        self,
+        document: CleanedDocument,
+        sentences: List[str],
+        spans: List[Tuple[int, int]],
+        token_counts: List[int],
+        boundaries: Optional[List[SemanticBoundary]] = None
+    ) -> List[Chunk]:
+        """
+        Chunk a document's sentences with the semantic or hybrid strategy.
+        
+        Args:
+            document: Parent document
+            sentences: Document sentences (non-empty)
+            spans: (start_char, end_char) of each sentence in the document
+            token_counts: Token count of each sentence
+            boundaries: Precomputed semantic boundaries (detected if None)
+        
+        Returns:
+            List of chunks
+        """
+        if self.strategy == ChunkingStrategy.SEMANTIC:
+            chunks = await self._chunk_semantic(sentences, spans, token_counts, document, boundaries)
         else:  # HYBRID
-            chunks = await self._chunk_hybrid(sentences, document)
+            chunks = await self._chunk_hybrid(sentences, spans, token_counts, document, boundaries)
         
         logger.info(
             f"Chunked document {document.id}: "
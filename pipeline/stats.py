@@ -0,0 +1,40 @@
+"""
+Pipeline Stage Statistics
+
+Counters a stage accumulates while it processes a batch, so callers can
+report totals without walking the stage's output again.
+
+Example:
+    >>> from pipeline.stats import StageStats
+    >>> stats = StageStats()
+    >>> chunks = await chunk_stage.execute(documents, "trace-123", stats=stats)
+    >>> print(stats.total_tokens / stats.items)
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class StageStats:
+    """Totals filled in by a stage for the batch it just processed.
+
+    Stages set the fields that apply to them and leave the rest at zero.
+
+    Attributes:
+        items: Number of items the stage produced
+        total_chars: Total characters of content produced
+        total_words: Total words of content produced
+        total_tokens: Total tokens of content produced
+        duration_ms: Stage duration, from the stage's own timing read
+
+    Example:
+        >>> stats = StageStats()
+        >>> cleaned = await clean_stage.execute(docs, "trace-123", stats=stats)
+        >>> print(f"{stats.total_words} words")
+    """
+
+    items: int = 0
+    total_chars: int = 0
+    total_words: int = 0
+    total_tokens: int = 0
+    duration_ms: float = 0.0
@@ -13,18 +13,67 @@ Example:
     ... )
 """
 
+import asyncio
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
 from uuid import uuid4
 from datetime import datetime
 
+from config import settings
 from models.document import Embedding, StoredDocument, DocumentSource, ProcessingStatus
-from services.dataforge_client import DataForgeClient, DataForgeError
+from services.dataforge_client import DataForgeClient, DataForgeError, get_dataforge_client
 from services.telemetry_db_client import telemetry
+from utils.concurrency import SharedSemaphore
+from utils.ids import id_pool
 
 logger = logging.getLogger(__name__)
 
+# Source values accepted by StoredDocument; others are stored as file uploads
+_DOCUMENT_SOURCE_VALUES: frozenset = frozenset(s.value for s in DocumentSource)
+
+
+def _resolve_source(source: str) -> DocumentSource:
+    """Map a job's source name to a DocumentSource (file upload if unknown)."""
+    return DocumentSource(source) if source in _DOCUMENT_SOURCE_VALUES else DocumentSource.FILE_UPLOAD
+
+
+async def _single_batch(embeddings: List[Embedding]) -> AsyncIterator[List[Embedding]]:
+    """Present a list of embeddings as a one-batch stream."""
+    if embeddings:
+        yield embeddings
+
+
+class _SourceError(Exception):
+    """Wraps an error raised by the embedding batch stream itself."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+        super().__init__(str(error))
+
+
+async def _guard_source(batches: AsyncIterable[List[Embedding]]) -> AsyncIterator[List[Embedding]]:
+    """Yield from a batch stream, raising its own errors as _SourceError."""
+    iterator = aiter(batches)
+    while True:
+        try:
+            batch = await anext(iterator)
+        except StopAsyncIteration:
+            return
+        except Exception as e:
+            raise _SourceError(e) from e
+        yield batch
+
+
+def _new_group(embedding: Embedding) -> Dict[str, Any]:
+    """Start the per-document tally for a document's first embedding."""
+    return {
+        "chunk_ids": set(),
+        "count": 0,
+        "first_meta": embedding.metadata,
+        "first_tenant": embedding.tenant_id
+    }
+
 
 class StoreStageError(Exception):
     """Exception raised when store stage fails.
@@ -33,6 +82,9 @@ class StoreStageError(Exception):
         >>> raise StoreStageError("Storage failed", document_id="doc-123")
     """
 
+    # Keeps message and context out of a per-instance __dict__
+    __slots__ = ("message", "context")
+
     def __init__(self, message: str, **context):
         self.message = message
         self.context = context
@@ -53,6 +105,10 @@ class StoreStage:
         >>> stored_docs = await stage.execute(embeddings, "trace-123")
     """
 
+    # Shared by all instances: bounds per-document metadata writes when
+    # DataForge lacks the batch endpoint
+    _metadata_limit = SharedSemaphore(settings.STORE_META_CONCURRENCY)
+
     def __init__(
         self,
         dataforge_client: Optional[DataForgeClient] = None
@@ -60,86 +116,216 @@ class StoreStage:
         """Initialize store stage.
 
         Args:
-            dataforge_client: DataForgeClient instance (creates new if None)
+            dataforge_client: DataForgeClient instance (uses the shared
+                process-wide client if None)
 
         Example:
             >>> client = DataForgeClient(timeout=60)
             >>> stage = StoreStage(dataforge_client=client)
         """
-        self.dataforge_client = dataforge_client or DataForgeClient()
+        self._shared_client = dataforge_client is None
+        self.dataforge_client = dataforge_client or get_dataforge_client()
         self.logger = logging.getLogger(__name__)
+        self._batch_metadata_supported = True
 
-    def _group_embeddings_by_document(
-        self,
+    @staticmethod
+    def _group_embeddings(
+        groups: Dict[str, Dict[str, Any]],
         embeddings: List[Embedding]
-    ) -> Dict[str, List[Embedding]]:
-        """Group embeddings by their parent document ID.
+    ) -> None:
+        """Add a batch of embeddings to the per-document groups.
 
-        Args:
-            embeddings: List of embeddings
+        Each group keeps only its document's chunk IDs, embedding count,
+        and the metadata and tenant of its first embedding, so the batch
+        itself can be released once it is stored.
 
-        Returns:
-            Dict mapping document_id to list of embeddings
+        Args:
+            groups: Dict mapping document_id to its group, updated in place
+            embeddings: Batch of embeddings
 
         Example:
-            >>> grouped = stage._group_embeddings_by_document(embeddings)
-            >>> print(grouped.keys())
+            >>> groups = {}
+            >>> StoreStage._group_embeddings(groups, embeddings)
+            >>> groups.keys()
             dict_keys(['doc-1', 'doc-2'])
         """
-        grouped: Dict[str, List[Embedding]] = {}
+        if not embeddings:
+            return
+
+        # Fast path: a batch from a single document (common for API jobs)
+        # updates its group in bulk. Comparing the first and last IDs
+        # rules out most multi-document batches before the full check.
+        first_id = embeddings[0].metadata.get("document_id", "unknown")
+        if embeddings[-1].metadata.get("document_id", "unknown") == first_id and all(
+            embedding.metadata.get("document_id", "unknown") == first_id for embedding in embeddings
+        ):
+            group = groups.get(first_id)
+            if group is None:
+                group = groups[first_id] = _new_group(embeddings[0])
+            group["chunk_ids"].update(embedding.chunk_id for embedding in embeddings)
+            group["count"] += len(embeddings)
+            return
+
+        # Bound once: this loop runs for every embedding of the job
+        get_group = groups.get
 
         for embedding in embeddings:
             # Get document_id from embedding metadata
             doc_id = embedding.metadata.get("document_id", "unknown")
 
-            if doc_id not in grouped:
-                grouped[doc_id] = []
+            group = get_group(doc_id)
+            if group is None:
+                group = groups[doc_id] = _new_group(embedding)
 
-            grouped[doc_id].append(embedding)
+            group["chunk_ids"].add(embedding.chunk_id)
+            group["count"] += 1
 
-        return grouped
-
-    def _create_stored_document(
+    def _build_stored_documents(
         self,
-        document_id: str,
-        embeddings: List[Embedding],
-        source: str = "unknown",
+        groups: Dict[str, Dict[str, Any]],
+        source: DocumentSource = DocumentSource.FILE_UPLOAD,
         url: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
-        tenant_id: Optional[str] = None
-    ) -> StoredDocument:
-        """Create a StoredDocument from embeddings.
+        tenant_id: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> List[StoredDocument]:
+        """Create a StoredDocument for each document group.
 
         Args:
-            document_id: Document identifier
-            embeddings: List of embeddings for this document
-            source: Document source type
+            groups: Groups built by _group_embeddings
+            source: Resolved document source
             url: Optional source URL
-            metadata: Document metadata
-            tenant_id: Multi-tenant identifier
+            tenant_id: Multi-tenant identifier (defaults to each document's
+                first embedding tenant)
+            error_message: If set, documents are marked FAILED with this
+                message instead of COMPLETED
 
         Returns:
-            StoredDocument instance
+            StoredDocument per document, in order of first appearance
 
         Example:
-            >>> doc = stage._create_stored_document(
-            ...     document_id="doc-1",
-            ...     embeddings=embeddings,
-            ...     source="file_upload"
-            ... )
+            >>> docs = stage._build_stored_documents(groups, source=DocumentSource.FILE_UPLOAD)
+            >>> [doc.id for doc in docs]
+            ['doc-1', 'doc-2']
+        """
+        return [
+            StoredDocument(
+                id=doc_id,
+                source=source,
+                url=url,
+                metadata=group["first_meta"],
+                chunk_count=len(group["chunk_ids"]),
+                embedding_count=group["count"],
+                status=ProcessingStatus.FAILED if error_message else ProcessingStatus.COMPLETED,
+                error_message=error_message,
+                tenant_id=tenant_id or group["first_tenant"]
+            )
+            for doc_id, group in groups.items()
+        ]
+
+    async def _store_documents_metadata(
+        self,
+        stored_documents: List[StoredDocument],
+        correlation_id: str
+    ) -> None:
+        """Store metadata for all documents of a job.
+
+        Sends one batch request. If DataForge does not provide the batch
+        endpoint (HTTP 404 or 405), documents are written individually,
+        up to STORE_META_CONCURRENCY at a time, for the rest of this
+        stage's lifetime.
+
+        Args:
+            stored_documents: Documents to store
+            correlation_id: Distributed tracing ID
+
+        Raises:
+            DataForgeError: If storage fails
         """
-        # Extract unique chunk IDs
-        chunk_ids = list(set(e.chunk_id for e in embeddings))
+        if self._batch_metadata_supported:
+            try:
+                await self.dataforge_client.store_documents_metadata_batch(
+                    documents=stored_documents,
+                    correlation_id=correlation_id
+                )
+                return
+            except DataForgeError as e:
+                if e.context.get("status_code") not in (404, 405):
+                    raise
+                self._batch_metadata_supported = False
+                self.logger.warning(
+                    "DataForge has no batch metadata endpoint, storing documents individually",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "status_code": e.context.get("status_code")
+                    }
+                )
+
+        async def store_one(document: StoredDocument) -> None:
+            async with self._metadata_limit:
+                await self.dataforge_client.store_document_metadata(
+                    document=document,
+                    correlation_id=correlation_id
+                )
 
-        return StoredDocument(
-            id=document_id,
-            source=DocumentSource(source) if source in [s.value for s in DocumentSource] else DocumentSource.FILE_UPLOAD,
+        await asyncio.gather(*(store_one(document) for document in stored_documents))
+
+    async def _store_failed_documents(
+        self,
+        groups: Dict[str, Dict[str, Any]],
+        error: Exception,
+        source: DocumentSource,
+        url: Optional[str],
+        tenant_id: Optional[str],
+        correlation_id: str,
+        job_id: str
+    ) -> None:
+        """Record documents with stored embeddings as FAILED.
+
+        Used when the embedding stream fails part way. A failure to write
+        the metadata is logged rather than raised, so the stream's error
+        stays the one reported.
+
+        Args:
+            groups: Groups of the embeddings already stored
+            error: Error raised by the embedding stream
+            source: Resolved document source
+            url: Optional source URL
+            tenant_id: Multi-tenant identifier
+            correlation_id: Distributed tracing ID
+            job_id: Job identifier
+        """
+        failed_documents = self._build_stored_documents(
+            groups,
+            source=source,
             url=url,
-            metadata=metadata or embeddings[0].metadata if embeddings else {},
-            chunk_count=len(chunk_ids),
-            embedding_count=len(embeddings),
-            status=ProcessingStatus.COMPLETED,
-            tenant_id=tenant_id or (embeddings[0].tenant_id if embeddings else None)
+            tenant_id=tenant_id,
+            error_message=str(error) or error.__class__.__name__
+        )
+        chunk_ids = [chunk_id for group in groups.values() for chunk_id in group["chunk_ids"]]
+
+        try:
+            await self._store_documents_metadata(failed_documents, correlation_id)
+        except DataForgeError as e:
+            self.logger.error(
+                f"Could not record {len(failed_documents)} partially stored documents as failed: {str(e)}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "job_id": job_id,
+                    "error": str(e),
+                    "stored_chunk_ids": chunk_ids
+                }
+            )
+            return
+
+        self.logger.warning(
+            f"Embedding stream failed; recorded {len(failed_documents)} partially stored documents as failed",
+            extra={
+                "correlation_id": correlation_id,
+                "job_id": job_id,
+                "document_count": len(failed_documents),
+                "embedding_count": sum(group["count"] for group in groups.values()),
+                "stored_chunk_ids": chunk_ids
+            }
         )
 
     async def execute(
@@ -153,7 +339,8 @@ class StoreStage:
     ) -> List[StoredDocument]:
         """Execute the store stage.
 
-        Stores all embeddings and document metadata in DataForge.
+        Stores all embeddings and document metadata in DataForge. Runs
+        execute_stream over the list as a single batch.
 
         Args:
             embeddings: List of embeddings to store
@@ -179,103 +366,163 @@ class StoreStage:
             ... )
             >>> print(f"Stored {len(stored_docs)} documents")
         """
-        start_time = time.time()
-        job_id = job_id or f"job-{uuid4().hex[:12]}"
+        return await self.execute_stream(
+            embedding_batches=_single_batch(embeddings),
+            correlation_id=correlation_id,
+            job_id=job_id,
+            tenant_id=tenant_id,
+            source=source,
+            url=url
+        )
 
-        if not embeddings:
-            self.logger.warning(
-                "No embeddings provided for storage",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id
-                }
-            )
-            return []
+    async def execute_stream(
+        self,
+        embedding_batches: AsyncIterable[List[Embedding]],
+        correlation_id: str,
+        job_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        source: str = "unknown",
+        url: Optional[str] = None
+    ) -> List[StoredDocument]:
+        """Execute the store stage over a stream of embedding batches.
 
-        self.logger.info(
-            f"Starting store stage for {len(embeddings)} embeddings",
-            extra={
-                "correlation_id": correlation_id,
-                "job_id": job_id,
-                "embedding_count": len(embeddings),
-                "tenant_id": tenant_id
-            }
-        )
+        Each batch is sent to DataForge as soon as it arrives, so storage
+        overlaps with whatever produces the batches. Stored batches are
+        only tallied per document and then released, so memory grows with
+        the number of documents rather than embeddings. Document metadata
+        is written in one batch request once the stream is exhausted, when
+        every document's embeddings are known.
 
-        try:
-            # Store embeddings in DataForge
-            self.logger.debug(
-                f"Storing {len(embeddings)} embeddings in DataForge",
-                extra={
-                    "correlation_id": correlation_id,
-                    "embedding_count": len(embeddings)
-                }
-            )
+        If the stream itself raises, the documents whose embeddings were
+        already stored are written with FAILED status, so those embeddings
+        are not left without metadata, and the stream's error is re-raised
+        unchanged for the producing stage to report.
 
-            store_result = await self.dataforge_client.store_embeddings(
-                embeddings=embeddings,
-                correlation_id=correlation_id,
-                tenant_id=tenant_id
-            )
+        Args:
+            embedding_batches: Async iterable of embedding lists
+            correlation_id: Distributed tracing ID
+            job_id: Optional job identifier
+            tenant_id: Multi-tenant identifier
+            source: Document source type
+            url: Optional source URL
 
-            self.logger.info(
-                f"Stored embeddings: {store_result}",
-                extra={
-                    "correlation_id": correlation_id,
-                    "store_result": store_result
-                }
-            )
+        Returns:
+            List of StoredDocument objects
+
+        Raises:
+            StoreStageError: If storage fails
+
+        Example:
+            >>> stored_docs = await stage.execute_stream(
+            ...     embed_stage.execute_stream(chunks, "trace-123"),
+            ...     correlation_id="trace-123"
+            ... )
+        """
+        start_time = time.perf_counter()
+        job_id = job_id or f"job-{id_pool.next_hex12()}"
+        document_source = _resolve_source(source)
 
-            # Group embeddings by document to create StoredDocument records
-            grouped = self._group_embeddings_by_document(embeddings)
+        # Skip building log messages and extras for disabled levels
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        info = self.logger.isEnabledFor(logging.INFO)
 
-            self.logger.debug(
-                f"Grouped embeddings into {len(grouped)} documents",
+        if info:
+            self.logger.info(
+                "Starting store stage",
                 extra={
                     "correlation_id": correlation_id,
-                    "document_count": len(grouped)
+                    "job_id": job_id,
+                    "tenant_id": tenant_id
                 }
             )
 
-            # Create and store document metadata
-            stored_documents: List[StoredDocument] = []
-
-            for doc_id, doc_embeddings in grouped.items():
-                # Create StoredDocument
-                stored_doc = self._create_stored_document(
-                    document_id=doc_id,
-                    embeddings=doc_embeddings,
-                    source=source,
-                    url=url,
+        try:
+            groups: Dict[str, Dict[str, Any]] = {}
+            store_result: Dict[str, Any] = {}
+            store_batches = 0
+
+            async for batch in _guard_source(embedding_batches):
+                if not batch:
+                    continue
+
+                # Store embeddings in DataForge
+                if debug:
+                    self.logger.debug(
+                        f"Storing {len(batch)} embeddings in DataForge",
+                        extra={
+                            "correlation_id": correlation_id,
+                            "embedding_count": len(batch)
+                        }
+                    )
+
+                store_result = await self.dataforge_client.store_embeddings(
+                    embeddings=batch,
+                    correlation_id=correlation_id,
                     tenant_id=tenant_id
                 )
 
-                # Store document metadata
-                await self.dataforge_client.store_document_metadata(
-                    document=stored_doc,
-                    correlation_id=correlation_id
+                if info:
+                    self.logger.info(
+                        f"Stored embeddings: {store_result}",
+                        extra={
+                            "correlation_id": correlation_id,
+                            "store_result": store_result
+                        }
+                    )
+
+                self._group_embeddings(groups, batch)
+                store_batches += 1
+
+            if not groups:
+                self.logger.warning(
+                    "No embeddings provided for storage",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "job_id": job_id
+                    }
                 )
+                return []
 
-                stored_documents.append(stored_doc)
+            # Create StoredDocument records from the per-document groups
+            stored_documents = self._build_stored_documents(
+                groups,
+                source=document_source,
+                url=url,
+                tenant_id=tenant_id
+            )
+
+            if debug:
+                self.logger.debug(
+                    f"Grouped embeddings into {len(stored_documents)} documents",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "document_count": len(stored_documents)
+                    }
+                )
+
+            # Store all document metadata in one request
+            await self._store_documents_metadata(stored_documents, correlation_id)
 
+            if debug:
                 self.logger.debug(
-                    f"Stored document metadata: {doc_id}",
+                    f"Stored metadata for {len(stored_documents)} documents",
                     extra={
                         "correlation_id": correlation_id,
-                        "document_id": doc_id,
-                        "chunk_count": stored_doc.chunk_count,
-                        "embedding_count": stored_doc.embedding_count
+                        "document_count": len(stored_documents)
                     }
                 )
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
-            # Calculate statistics
-            total_chunks = sum(doc.chunk_count for doc in stored_documents)
-            total_embeddings = sum(doc.embedding_count for doc in stored_documents)
+            # Calculate statistics in one pass over the groups
+            total_chunks = 0
+            total_embeddings = 0
+            for group in groups.values():
+                total_chunks += len(group["chunk_ids"])
+                total_embeddings += group["count"]
 
-            # Emit telemetry
+            # Emit telemetry (queued, written off the request path)
             await telemetry.emit_phase_completed(
                 job_id=job_id,
                 phase="store",
@@ -288,25 +535,41 @@ class StoreStage:
                     "document_count": len(stored_documents),
                     "total_chunks": total_chunks,
                     "total_embeddings": total_embeddings,
-                    "store_result": store_result
-                }
+                    "store_result": store_result,
+                    "store_batches": store_batches
+                },
+                wait=False
             )
 
-            self.logger.info(
-                f"Store stage completed: {len(stored_documents)} documents in {duration_ms:.2f}ms",
-                extra={
-                    "correlation_id": correlation_id,
-                    "job_id": job_id,
-                    "document_count": len(stored_documents),
-                    "total_embeddings": total_embeddings,
-                    "duration_ms": duration_ms
-                }
-            )
+            if info:
+                self.logger.info(
+                    f"Store stage completed: {len(stored_documents)} documents in {duration_ms:.2f}ms",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "job_id": job_id,
+                        "document_count": len(stored_documents),
+                        "total_embeddings": total_embeddings,
+                        "duration_ms": duration_ms
+                    }
+                )
 
             return stored_documents
 
+        except _SourceError as e:
+            if groups:
+                await self._store_failed_documents(
+                    groups,
+                    error=e.error,
+                    source=document_source,
+                    url=url,
+                    tenant_id=tenant_id,
+                    correlation_id=correlation_id,
+                    job_id=job_id
+                )
+            raise e.error
+
         except DataForgeError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
                 f"Store stage failed: {str(e)}",
@@ -319,7 +582,7 @@ class StoreStage:
                 exc_info=True
             )
 
-            # Emit failure telemetry
+            # Emit failure telemetry (queued, so the error surfaces at once)
             await telemetry.emit_job_failed(
                 job_id=job_id,
                 source=source,
@@ -327,7 +590,8 @@ class StoreStage:
                 failed_stage="store",
                 error_type=e.__class__.__name__,
                 error_message=str(e),
-                tenant_id=tenant_id
+                tenant_id=tenant_id,
+                wait=False
             )
 
             raise StoreStageError(
@@ -337,7 +601,7 @@ class StoreStage:
             )
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             self.logger.error(
                 f"Unexpected error in store stage: {str(e)}",
@@ -350,7 +614,7 @@ class StoreStage:
                 exc_info=True
             )
 
-            # Emit failure telemetry
+            # Emit failure telemetry (queued, so the error surfaces at once)
             await telemetry.emit_job_failed(
                 job_id=job_id,
                 source=source,
@@ -358,7 +622,8 @@ class StoreStage:
                 failed_stage="store",
                 error_type=e.__class__.__name__,
                 error_message=str(e),
-                tenant_id=tenant_id
+                tenant_id=tenant_id,
+                wait=False
             )
 
             raise StoreStageError(
@@ -369,12 +634,13 @@ class StoreStage:
     async def close(self) -> None:
         """Close the DataForge client.
 
-        Should be called during application shutdown.
+        The shared client is left open for other stages; it is closed
+        at application shutdown.
 
         Example:
             >>> await stage.close()
         """
-        if self.dataforge_client:
+        if self.dataforge_client and not self._shared_client:
             await self.dataforge_client.close()
 
 
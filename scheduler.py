@@ -29,6 +29,7 @@ Example:
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from uuid import uuid4
 
@@ -49,6 +50,23 @@ from services.telemetry_db_client import telemetry
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_cron_trigger(expr: str) -> CronTrigger:
+    """Parse a crontab expression, reusing triggers for repeated expressions.
+
+    A CronTrigger is not changed by computing fire times, so jobs with
+    the same expression can share one. Invalid expressions raise
+    ValueError every time, since lru_cache does not cache exceptions.
+
+    Args:
+        expr: Crontab expression (e.g., "0 2 * * *")
+
+    Returns:
+        CronTrigger for the expression
+    """
+    return CronTrigger.from_crontab(expr)
+
+
 class SchedulerError(Exception):
     """Exception raised for scheduler-related errors.
 
@@ -288,7 +306,7 @@ class RakeScheduler:
         try:
             # Determine trigger type
             if cron_expression:
-                trigger = CronTrigger.from_crontab(cron_expression)
+                trigger = _parse_cron_trigger(cron_expression)
                 trigger_type = "cron"
                 trigger_value = cron_expression
             else:
@@ -13,7 +13,13 @@ Example:
     ... )
 """
 
+import asyncio
+import base64
+import json
 import logging
+import sys
+from array import array
+from itertools import chain
 from typing import List, Dict, Any, Optional
 
 import httpx
@@ -24,6 +30,47 @@ from models.document import Embedding, StoredDocument, ProcessingStatus
 logger = logging.getLogger(__name__)
 
 
+def _encode_json(payload: Any) -> bytes:
+    """Serialize a request body as compact UTF-8 JSON.
+
+    Embedding batches are mostly float lists, so dropping the space after
+    each comma (which older httpx versions emit) trims about 5% of the
+    bytes sent. Callers rely on the client's default Content-Type.
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+# Records serialized between event loop yields in _encode_batch_json
+_ENCODE_SLICE = 16
+
+
+async def _encode_batch_json(key: str, records: List[Dict[str, Any]], fields: Dict[str, Any]) -> bytes:
+    """Serialize {key: records, **fields} like _encode_json, in slices.
+
+    Encoding an embedding batch takes tens of milliseconds per hundred
+    vectors. json.dumps holds the GIL throughout, so a worker thread would
+    stall the event loop just the same; instead the records are encoded
+    a slice at a time, yielding to the loop in between.
+
+    Args:
+        key: Name of the records list in the body
+        records: JSON-serializable records
+        fields: Other top-level fields, serialized after the records
+
+    Returns:
+        UTF-8 JSON body
+    """
+    parts = []
+    for start in range(0, len(records), _ENCODE_SLICE):
+        parts.append(_encode_json(records[start:start + _ENCODE_SLICE])[1:-1])
+        await asyncio.sleep(0)
+
+    body = b"{" + _encode_json(key) + b":[" + b",".join(parts) + b"]"
+    if fields:
+        body += b"," + _encode_json(fields)[1:-1]
+    return body + b"}"
+
+
 class DataForgeError(Exception):
     """Exception raised when DataForge API call fails.
 
@@ -43,9 +90,15 @@ class DataForgeClient:
     Handles HTTP requests to DataForge for storing documents,
     chunks, and embeddings with automatic retry and error handling.
 
+    Requests share one keep-alive connection pool, so concurrent writes
+    (such as per-document metadata fallbacks) overlap instead of queueing
+    behind a single connection.
+
     Attributes:
         base_url: DataForge API base URL
         timeout: Request timeout in seconds
+        max_connections: Connection pool size
+        packed_vectors: Whether vectors are sent as one float32 buffer
 
     Example:
         >>> client = DataForgeClient(
@@ -58,13 +111,17 @@ class DataForgeClient:
     def __init__(
         self,
         base_url: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        packed_vectors: Optional[bool] = None
     ):
         """Initialize DataForge client.
 
         Args:
             base_url: DataForge API base URL (defaults to settings)
             timeout: Request timeout in seconds (defaults to settings)
+            max_connections: Connection pool size (defaults to settings)
+            packed_vectors: Send vectors as one float32 buffer (defaults to settings)
 
         Example:
             >>> client = DataForgeClient(
@@ -74,6 +131,8 @@ class DataForgeClient:
         """
         self.base_url = base_url or settings.DATAFORGE_BASE_URL
         self.timeout = timeout or settings.DATAFORGE_TIMEOUT
+        self.max_connections = max_connections or settings.DATAFORGE_MAX_CONNECTIONS
+        self.packed_vectors = settings.DATAFORGE_PACKED_VECTORS if packed_vectors is None else packed_vectors
         self.logger = logging.getLogger(__name__)
         self._client: Optional[httpx.AsyncClient] = None
 
@@ -89,7 +148,15 @@ class DataForgeClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                timeout=self.timeout
+                timeout=self.timeout,
+                # Fixed for every request, so set once instead of per call
+                headers={"Content-Type": "application/json"},
+                # Keep every pooled connection alive so bursts of writes
+                # reuse them instead of reconnecting
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
             )
         return self._client
 
@@ -137,6 +204,33 @@ class DataForgeClient:
             )
             return False
 
+    @staticmethod
+    def _pack_vectors(embeddings: List[Embedding]) -> Dict[str, Any]:
+        """Pack a batch's vectors into one little-endian float32 buffer.
+
+        Row i of the buffer is the vector of embeddings[i]. Compared with
+        JSON float lists this sends 4 bytes per dimension (before base64)
+        and skips formatting every float as text.
+
+        Args:
+            embeddings: Embeddings whose vectors to pack
+
+        Returns:
+            Payload fields describing the packed vectors
+
+        Example:
+            >>> DataForgeClient._pack_vectors(embeddings)["dimensions"]
+            1536
+        """
+        matrix = array('f', chain.from_iterable(emb.vector for emb in embeddings))
+        if sys.byteorder == 'big':
+            matrix.byteswap()
+        return {
+            "vector_encoding": "float32-base64",
+            "dimensions": len(embeddings[0].vector),
+            "vectors": base64.b64encode(matrix.tobytes()).decode("ascii")
+        }
+
     async def store_embeddings(
         self,
         embeddings: List[Embedding],
@@ -145,6 +239,10 @@ class DataForgeClient:
     ) -> Dict[str, Any]:
         """Store embeddings in DataForge.
 
+        With packed_vectors enabled, vectors are omitted from the
+        per-embedding records and sent once as a float32 buffer (see
+        _pack_vectors).
+
         Args:
             embeddings: List of embeddings to store
             correlation_id: Distributed tracing ID
@@ -184,30 +282,32 @@ class DataForgeClient:
             client = await self._get_client()
 
             # Prepare payload
-            payload = {
-                "embeddings": [
-                    {
-                        "id": emb.id,
-                        "chunk_id": emb.chunk_id,
-                        "vector": emb.vector,
-                        "model": emb.model,
-                        "metadata": emb.metadata,
-                        "created_at": emb.created_at.isoformat(),
-                        "tenant_id": tenant_id or emb.tenant_id
-                    }
-                    for emb in embeddings
-                ],
-                "tenant_id": tenant_id
-            }
+            records: List[Dict[str, Any]] = [
+                {
+                    "id": emb.id,
+                    "chunk_id": emb.chunk_id,
+                    "model": emb.model,
+                    "metadata": emb.metadata,
+                    "created_at": emb.created_at.isoformat(),
+                    "tenant_id": tenant_id or emb.tenant_id
+                }
+                for emb in embeddings
+            ]
+            fields = {"tenant_id": tenant_id}
+
+            if self.packed_vectors:
+                fields.update(self._pack_vectors(embeddings))
+            else:
+                for record, emb in zip(records, embeddings):
+                    record["vector"] = emb.vector
+
+            body = await _encode_batch_json("embeddings", records, fields)
 
             # Make API request
             response = await client.post(
                 "/api/v1/embeddings/batch",
-                json=payload,
-                headers={
-                    "X-Correlation-ID": correlation_id,
-                    "Content-Type": "application/json"
-                }
+                content=body,
+                headers={"X-Correlation-ID": correlation_id}
             )
 
             if response.status_code >= 400:
@@ -271,6 +371,30 @@ class DataForgeClient:
             )
             raise DataForgeError(error_msg, error=str(e))
 
+    @staticmethod
+    def _document_payload(document: StoredDocument) -> Dict[str, Any]:
+        """Build the JSON body describing one stored document.
+
+        Args:
+            document: StoredDocument with metadata
+
+        Returns:
+            JSON-serializable document record
+        """
+        return {
+            "id": document.id,
+            "source": document.source.value if hasattr(document.source, 'value') else document.source,
+            "url": document.url,
+            "metadata": document.metadata,
+            "chunk_count": document.chunk_count,
+            "embedding_count": document.embedding_count,
+            "status": document.status.value if hasattr(document.status, 'value') else document.status,
+            "error_message": document.error_message,
+            "created_at": document.created_at.isoformat(),
+            "stored_at": document.stored_at.isoformat(),
+            "tenant_id": document.tenant_id
+        }
+
     async def store_document_metadata(
         self,
         document: StoredDocument,
@@ -307,28 +431,13 @@ class DataForgeClient:
             client = await self._get_client()
 
             # Prepare payload
-            payload = {
-                "id": document.id,
-                "source": document.source.value if hasattr(document.source, 'value') else document.source,
-                "url": document.url,
-                "metadata": document.metadata,
-                "chunk_count": document.chunk_count,
-                "embedding_count": document.embedding_count,
-                "status": document.status.value if hasattr(document.status, 'value') else document.status,
-                "error_message": document.error_message,
-                "created_at": document.created_at.isoformat(),
-                "stored_at": document.stored_at.isoformat(),
-                "tenant_id": document.tenant_id
-            }
+            payload = self._document_payload(document)
 
             # Make API request
             response = await client.post(
                 "/api/v1/documents",
-                json=payload,
-                headers={
-                    "X-Correlation-ID": correlation_id,
-                    "Content-Type": "application/json"
-                }
+                content=_encode_json(payload),
+                headers={"X-Correlation-ID": correlation_id}
             )
 
             if response.status_code >= 400:
@@ -372,6 +481,124 @@ class DataForgeClient:
             )
             raise DataForgeError(error_msg, error=str(e))
 
+    async def store_documents_metadata_batch(
+        self,
+        documents: List[StoredDocument],
+        correlation_id: str
+    ) -> Dict[str, Any]:
+        """Store metadata for many documents in one request.
+
+        DataForge writes the batch in a single transaction, so a job's
+        documents cost one round-trip instead of one per document.
+
+        Args:
+            documents: StoredDocuments with metadata
+            correlation_id: Distributed tracing ID
+
+        Returns:
+            Response data from DataForge
+
+        Raises:
+            DataForgeError: If storage fails
+
+        Example:
+            >>> result = await client.store_documents_metadata_batch(
+            ...     documents=stored_docs,
+            ...     correlation_id="trace-123"
+            ... )
+            >>> print(f"Stored {result['count']} documents")
+        """
+        if not documents:
+            return {"count": 0, "status": "no_data"}
+
+        self.logger.info(
+            f"Storing metadata for {len(documents)} documents in DataForge",
+            extra={
+                "correlation_id": correlation_id,
+                "document_count": len(documents)
+            }
+        )
+
+        try:
+            client = await self._get_client()
+
+            # Prepare payload
+            payload = {
+                "documents": [self._document_payload(document) for document in documents]
+            }
+
+            # Make API request
+            response = await client.post(
+                "/api/v1/documents/batch",
+                content=_encode_json(payload),
+                headers={"X-Correlation-ID": correlation_id}
+            )
+
+            if response.status_code >= 400:
+                error_msg = f"DataForge API error: HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg += f" - {error_data.get('detail', 'Unknown error')}"
+                except:
+                    pass
+
+                raise DataForgeError(
+                    error_msg,
+                    status_code=response.status_code
+                )
+
+            result = response.json()
+
+            self.logger.info(
+                f"Successfully stored metadata for {len(documents)} documents",
+                extra={
+                    "correlation_id": correlation_id,
+                    "document_count": len(documents)
+                }
+            )
+
+            return result
+
+        except DataForgeError:
+            raise
+
+        except Exception as e:
+            error_msg = f"Failed to store document metadata batch: {str(e)}"
+            self.logger.error(
+                error_msg,
+                extra={
+                    "correlation_id": correlation_id,
+                    "document_count": len(documents),
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise DataForgeError(error_msg, error=str(e))
+
+
+# Global DataForge client instance
+_dataforge_client: Optional[DataForgeClient] = None
+
+
+def get_dataforge_client() -> DataForgeClient:
+    """Get global DataForge client instance.
+
+    Shared by every StoreStage created without an explicit client, so the
+    process keeps one connection pool to DataForge. Closed at application
+    shutdown.
+
+    Returns:
+        DataForgeClient instance
+
+    Example:
+        >>> client = get_dataforge_client()
+        >>> await client.health_check()
+    """
+    global _dataforge_client
+    if _dataforge_client is None:
+        _dataforge_client = DataForgeClient()
+    return _dataforge_client
+
 
 # Example usage
 if __name__ == "__main__":
@@ -13,8 +13,11 @@ Example:
     ... )
 """
 
+import base64
 import logging
-from typing import List, Dict, Any, Optional
+import sys
+from array import array
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 import asyncio
 
 from config import settings
@@ -22,6 +25,30 @@ from config import settings
 logger = logging.getLogger(__name__)
 
 
+def _decode_embedding(data: Union[str, List[float]]) -> List[float]:
+    """Decode an embedding returned with encoding_format="base64".
+
+    The API sends the vector as base64 of little-endian float32 values,
+    which is about a quarter of the size of the JSON float list.
+
+    Args:
+        data: Base64 string, or an already-decoded list of floats
+
+    Returns:
+        Embedding vector as a list of floats
+
+    Example:
+        >>> _decode_embedding("AACAPwAAAEA=")
+        [1.0, 2.0]
+    """
+    if not isinstance(data, str):
+        return data
+    vector = array('f', base64.b64decode(data))
+    if sys.byteorder == 'big':
+        vector.byteswap()
+    return vector.tolist()
+
+
 class EmbeddingError(Exception):
     """Exception raised when embedding generation fails.
 
@@ -137,11 +164,51 @@ class EmbeddingService:
             >>> print(len(embeddings))  # 2
             >>> print(len(embeddings[0]))  # 1536
         """
+        all_embeddings: List[List[float]] = []
+
+        async for batch_embeddings in self.generate_embeddings_streaming(
+            texts=texts,
+            correlation_id=correlation_id,
+            model=model
+        ):
+            all_embeddings.extend(batch_embeddings)
+
+        return all_embeddings
+
+    async def generate_embeddings_streaming(
+        self,
+        texts: List[str],
+        correlation_id: str,
+        model: Optional[str] = None
+    ) -> AsyncIterator[List[List[float]]]:
+        """Generate embeddings for a list of texts, one batch at a time.
+
+        Each batch's vectors are yielded as soon as the API returns them,
+        and the next batch is not requested until the caller asks for it.
+
+        Args:
+            texts: List of text strings to embed
+            correlation_id: Distributed tracing ID
+            model: Optional model override
+
+        Yields:
+            Embedding vectors for up to batch_size consecutive texts
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+
+        Example:
+            >>> async for vectors in service.generate_embeddings_streaming(
+            ...     texts=texts,
+            ...     correlation_id="trace-123"
+            ... ):
+            ...     store(vectors)
+        """
         if not texts:
-            return []
+            return
 
         model = model or self.model
-        client = self._get_client()
+        self._get_client()
 
         self.logger.info(
             f"Generating embeddings for {len(texts)} texts",
@@ -153,13 +220,13 @@ class EmbeddingService:
             }
         )
 
-        all_embeddings: List[List[float]] = []
+        generated = 0
+        total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
 
         # Process in batches
         for i in range(0, len(texts), self.batch_size):
             batch = texts[i:i + self.batch_size]
             batch_num = i // self.batch_size + 1
-            total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
 
             self.logger.debug(
                 f"Processing batch {batch_num}/{total_batches} ({len(batch)} texts)",
@@ -177,7 +244,7 @@ class EmbeddingService:
                 correlation_id=correlation_id
             )
 
-            all_embeddings.extend(batch_embeddings)
+            generated += len(batch_embeddings)
 
             self.logger.debug(
                 f"Batch {batch_num}/{total_batches} completed",
@@ -187,16 +254,16 @@ class EmbeddingService:
                 }
             )
 
+            yield batch_embeddings
+
         self.logger.info(
-            f"Generated {len(all_embeddings)} embeddings",
+            f"Generated {generated} embeddings",
             extra={
                 "correlation_id": correlation_id,
-                "total_embeddings": len(all_embeddings)
+                "total_embeddings": generated
             }
         )
 
-        return all_embeddings
-
     async def _generate_batch_with_retry(
         self,
         texts: List[str],
@@ -282,11 +349,12 @@ class EmbeddingService:
         try:
             response = await client.embeddings.create(
                 input=texts,
-                model=model
+                model=model,
+                encoding_format="base64"
             )
 
             # Extract embeddings from response
-            embeddings = [item.embedding for item in response.data]
+            embeddings = [_decode_embedding(item.embedding) for item in response.data]
 
             return embeddings
 
@@ -11,6 +11,8 @@ Features:
     - Correlation ID tracking
     - Multi-tenant support
     - Structured event schemas
+    - Optional background batching (wait=False) to keep writes off the
+      request path
 
 Example:
     >>> from services.telemetry_db_client import telemetry
@@ -21,10 +23,11 @@ Example:
     ... )
 """
 
+import asyncio
 import logging
 import sqlite3
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
@@ -40,6 +43,20 @@ from models.events import (
 
 logger = logging.getLogger(__name__)
 
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (
+        event_id,
+        timestamp,
+        service,
+        event_type,
+        severity,
+        correlation_id,
+        metadata,
+        metrics
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class TelemetryDatabaseClient:
     """Client for emitting telemetry events directly to database.
@@ -47,9 +64,14 @@ class TelemetryDatabaseClient:
     Writes telemetry events to DataForge SQLite database for consumption
     by ForgeCommand monitoring dashboard.
 
+    Events emitted with wait=False are queued and written by a background
+    task in one transaction per flush_interval, instead of opening a
+    connection per event on the caller's path.
+
     Attributes:
         db_path: Path to DataForge SQLite database
         enabled: Whether telemetry is enabled
+        flush_interval: Seconds to collect queued events before writing
 
     Example:
         >>> client = TelemetryDatabaseClient()
@@ -59,13 +81,15 @@ class TelemetryDatabaseClient:
     def __init__(
         self,
         db_path: Optional[str] = None,
-        enabled: bool = True
+        enabled: bool = True,
+        flush_interval: float = 0.1
     ):
         """Initialize database telemetry client.
 
         Args:
             db_path: Path to DataForge database (defaults to configured path)
             enabled: Whether to actually emit events (disable for testing)
+            flush_interval: Seconds to collect queued events before writing
 
         Example:
             >>> client = TelemetryDatabaseClient(
@@ -80,6 +104,11 @@ class TelemetryDatabaseClient:
 
         self.db_path = Path(db_path)
         self.enabled = enabled
+        self.flush_interval = flush_interval
+
+        # Rows queued by wait=False emits, and the task writing them
+        self._pending: List[Tuple[Any, ...]] = []
+        self._flusher: Optional[asyncio.Task] = None
 
         # Validate database exists
         if self.enabled and not self.db_path.exists():
@@ -102,6 +131,31 @@ class TelemetryDatabaseClient:
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _event_row(
+        self,
+        event: Dict[str, Any],
+        correlation_id: str
+    ) -> Tuple[Any, ...]:
+        """Build the events table row for a telemetry event.
+
+        Args:
+            event: Event data dictionary
+            correlation_id: Distributed tracing ID
+
+        Returns:
+            Tuple of column values in _INSERT_EVENT_SQL order
+        """
+        return (
+            str(uuid4()),
+            event.get("timestamp", datetime.utcnow().isoformat()),
+            "rake",  # Always "rake" for this client
+            event.get("event_type"),
+            event.get("severity", "info"),
+            correlation_id,
+            json.dumps(event.get("metadata", {})),
+            json.dumps(event.get("metrics", {}))
+        )
+
     def _emit_event(
         self,
         event: Dict[str, Any],
@@ -130,43 +184,10 @@ class TelemetryDatabaseClient:
             return False
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Generate event ID
-            event_id = str(uuid4())
-
-            # Extract event fields
-            event_type = event.get("event_type")
-            timestamp = event.get("timestamp", datetime.utcnow().isoformat())
-            severity = event.get("severity", "info")
-            metadata = json.dumps(event.get("metadata", {}))
-            metrics = json.dumps(event.get("metrics", {}))
-
-            # Insert event into database
-            cursor.execute("""
-                INSERT INTO events (
-                    event_id,
-                    timestamp,
-                    service,
-                    event_type,
-                    severity,
-                    correlation_id,
-                    metadata,
-                    metrics
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event_id,
-                timestamp,
-                "rake",  # Always "rake" for this client
-                event_type,
-                severity,
-                correlation_id,
-                metadata,
-                metrics
-            ))
+            row = self._event_row(event, correlation_id)
 
+            conn = self._get_connection()
+            conn.execute(_INSERT_EVENT_SQL, row)
             conn.commit()
             conn.close()
 
@@ -174,8 +195,8 @@ class TelemetryDatabaseClient:
                 "Telemetry event written to database",
                 extra={
                     "correlation_id": correlation_id,
-                    "event_id": event_id,
-                    "event_type": event_type
+                    "event_id": row[0],
+                    "event_type": row[3]
                 }
             )
             return True
@@ -201,6 +222,95 @@ class TelemetryDatabaseClient:
             )
             return False
 
+    def _emit_event_nowait(
+        self,
+        event: Dict[str, Any],
+        correlation_id: str
+    ) -> bool:
+        """Queue a telemetry event for the background writer.
+
+        Starts the writer task on the running loop if it is not already
+        running there.
+
+        Args:
+            event: Event data dictionary
+            correlation_id: Distributed tracing ID
+
+        Returns:
+            True if the event was queued, False if telemetry is disabled
+        """
+        if not self.enabled:
+            logger.debug(
+                "Telemetry disabled, skipping event emission",
+                extra={"correlation_id": correlation_id}
+            )
+            return False
+
+        self._pending.append(self._event_row(event, correlation_id))
+
+        loop = asyncio.get_running_loop()
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not loop:
+            self._flusher = loop.create_task(self._flush_pending())
+        return True
+
+    def _write_rows(self, rows: List[Tuple[Any, ...]]) -> bool:
+        """Write a batch of event rows in one transaction.
+
+        Args:
+            rows: Rows built by _event_row
+
+        Returns:
+            True if the batch was written successfully, False otherwise
+        """
+        try:
+            conn = self._get_connection()
+            conn.executemany(_INSERT_EVENT_SQL, rows)
+            conn.commit()
+            conn.close()
+
+            logger.debug(
+                f"Wrote {len(rows)} telemetry events to database",
+                extra={"event_count": len(rows)}
+            )
+            return True
+
+        except sqlite3.OperationalError as e:
+            logger.warning(
+                f"Database locked, {len(rows)} telemetry events skipped: {str(e)}",
+                extra={"event_count": len(rows)}
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                f"Failed to write telemetry events to database: {str(e)}",
+                extra={"event_count": len(rows)},
+                exc_info=True
+            )
+            return False
+
+    async def _flush_pending(self) -> None:
+        """Write queued events in batches until the queue is empty."""
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            rows, self._pending = self._pending, []
+            await asyncio.to_thread(self._write_rows, rows)
+
+    async def flush(self) -> None:
+        """Write all queued events now.
+
+        Example:
+            >>> await telemetry.flush()
+        """
+        flusher = self._flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is asyncio.get_running_loop():
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+
+        if self._pending:
+            rows, self._pending = self._pending, []
+            await asyncio.to_thread(self._write_rows, rows)
+
     async def emit_job_started(
         self,
         job_id: str,
@@ -208,7 +318,8 @@ class TelemetryDatabaseClient:
         correlation_id: str,
         scheduled: bool = False,
         tenant_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = True
     ) -> bool:
         """Emit job_started event.
 
@@ -221,9 +332,11 @@ class TelemetryDatabaseClient:
             scheduled: Whether job was triggered by scheduler
             tenant_id: Multi-tenant identifier
             metadata: Additional event metadata
+            wait: Write the event before returning; if False it is queued
+                and written in the background with other queued events
 
         Returns:
-            True if event was written successfully
+            True if event was written (or queued) successfully
 
         Example:
             >>> await telemetry.emit_job_started(
@@ -252,7 +365,10 @@ class TelemetryDatabaseClient:
             }
         )
 
-        return self._emit_event(event.model_dump(mode='json'), correlation_id)
+        event_dict = event.model_dump(mode='json')
+        if not wait:
+            return self._emit_event_nowait(event_dict, correlation_id)
+        return self._emit_event(event_dict, correlation_id)
 
     async def emit_phase_completed(
         self,
@@ -263,7 +379,8 @@ class TelemetryDatabaseClient:
         duration_ms: float,
         items_processed: int = 0,
         tenant_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = True
     ) -> bool:
         """Emit phase_completed event.
 
@@ -278,9 +395,11 @@ class TelemetryDatabaseClient:
             items_processed: Number of items processed
             tenant_id: Multi-tenant identifier
             metadata: Additional event metadata
+            wait: Write the event before returning; if False it is queued
+                and written in the background with other queued events
 
         Returns:
-            True if event was written successfully
+            True if event was written (or queued) successfully
 
         Example:
             >>> await telemetry.emit_phase_completed(
@@ -319,7 +438,10 @@ class TelemetryDatabaseClient:
             }
         )
 
-        return self._emit_event(event.model_dump(mode='json'), correlation_id)
+        event_dict = event.model_dump(mode='json')
+        if not wait:
+            return self._emit_event_nowait(event_dict, correlation_id)
+        return self._emit_event(event_dict, correlation_id)
 
     async def emit_job_completed(
         self,
@@ -330,7 +452,8 @@ class TelemetryDatabaseClient:
         chunks_created: int,
         embeddings_generated: int,
         tenant_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = True
     ) -> bool:
         """Emit job_completed event.
 
@@ -345,9 +468,11 @@ class TelemetryDatabaseClient:
             embeddings_generated: Number of embeddings generated
             tenant_id: Multi-tenant identifier
             metadata: Additional event metadata
+            wait: Write the event before returning; if False it is queued
+                and written in the background with other queued events
 
         Returns:
-            True if event was written successfully
+            True if event was written (or queued) successfully
 
         Example:
             >>> await telemetry.emit_job_completed(
@@ -398,6 +523,8 @@ class TelemetryDatabaseClient:
             }
         )
 
+        if not wait:
+            return self._emit_event_nowait(event_dict, correlation_id)
         return self._emit_event(event_dict, correlation_id)
 
     async def emit_job_failed(
@@ -410,7 +537,8 @@ class TelemetryDatabaseClient:
         error_message: str,
         retry_count: int = 0,
         tenant_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = True
     ) -> bool:
         """Emit job_failed event.
 
@@ -426,9 +554,11 @@ class TelemetryDatabaseClient:
             retry_count: Number of retries attempted
             tenant_id: Multi-tenant identifier
             metadata: Additional event metadata
+            wait: Write the event before returning; if False it is queued
+                and written in the background with other queued events
 
         Returns:
-            True if event was written successfully
+            True if event was written (or queued) successfully
 
         Example:
             >>> await telemetry.emit_job_failed(
@@ -470,6 +600,8 @@ class TelemetryDatabaseClient:
             }
         )
 
+        if not wait:
+            return self._emit_event_nowait(event_dict, correlation_id)
         return self._emit_event(event_dict, correlation_id)
 
     async def emit_retry_attempt(
@@ -482,7 +614,8 @@ class TelemetryDatabaseClient:
         error_message: str,
         backoff_seconds: float,
         tenant_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = True
     ) -> bool:
         """Emit retry_attempt event.
 
@@ -498,9 +631,11 @@ class TelemetryDatabaseClient:
             backoff_seconds: Backoff delay before retry
             tenant_id: Multi-tenant identifier
             metadata: Additional event metadata
+            wait: Write the event before returning; if False it is queued
+                and written in the background with other queued events
 
         Returns:
-            True if event was written successfully
+            True if event was written (or queued) successfully
 
         Example:
             >>> await telemetry.emit_retry_attempt(
@@ -547,17 +682,17 @@ class TelemetryDatabaseClient:
             }
         )
 
+        if not wait:
+            return self._emit_event_nowait(event_dict, correlation_id)
         return self._emit_event(event_dict, correlation_id)
 
     async def close(self) -> None:
-        """Close client (no-op for database client).
-
-        Provided for API compatibility with HTTP client.
+        """Close client, writing any queued events.
 
         Example:
             >>> await telemetry.close()
         """
-        pass  # No cleanup needed for SQLite client
+        await self.flush()
 
 
 # Global telemetry client instance
@@ -38,17 +38,32 @@ Example:
     ... )
 """
 
+import importlib
+
 from sources.base import (
     BaseSourceAdapter,
     SourceError,
     FetchError,
     ValidationError
 )
-from sources.file_upload import FileUploadAdapter
-from sources.sec_edgar import SECEdgarAdapter
-from sources.url_scrape import URLScrapeAdapter
-from sources.api_fetch import APIFetchAdapter
-from sources.database_query import DatabaseQueryAdapter
+
+# Adapters pull in parsers and HTTP/database clients, so each is imported
+# on first attribute access rather than with the package
+_ADAPTER_MODULES = {
+    "FileUploadAdapter": "sources.file_upload",
+    "SECEdgarAdapter": "sources.sec_edgar",
+    "URLScrapeAdapter": "sources.url_scrape",
+    "APIFetchAdapter": "sources.api_fetch",
+    "DatabaseQueryAdapter": "sources.database_query",
+}
+
+
+def __getattr__(name: str):
+    """Import adapter classes lazily (PEP 562)."""
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
 
 __all__ = [
     "BaseSourceAdapter",
@@ -69,7 +69,8 @@ class APIFetchAdapter(BaseSourceAdapter):
         timeout: float = 30.0,
         max_retries: int = 3,
         max_items: int = 100,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """Initialize API fetch adapter.
 
@@ -81,6 +82,9 @@ class APIFetchAdapter(BaseSourceAdapter):
             max_retries: Maximum retry attempts
             max_items: Maximum items to fetch per job
             verify_ssl: Verify SSL certificates
+            transport: Optional shared httpx transport (connection pool);
+                ignored when verify_ssl is False, since certificate
+                verification is a transport setting
 
         Example:
             >>> adapter = APIFetchAdapter(
@@ -104,7 +108,8 @@ class APIFetchAdapter(BaseSourceAdapter):
             headers={"User-Agent": self.user_agent},
             timeout=self.timeout,
             follow_redirects=True,
-            verify=self.verify_ssl
+            verify=self.verify_ssl,
+            transport=transport if self.verify_ssl else None
         )
 
         self.logger.info(
@@ -703,14 +708,7 @@ class APIFetchAdapter(BaseSourceAdapter):
             >>> await adapter._rate_limit()
         """
         if self.rate_limit_delay > 0:
-            await self.client.aclose()
             await asyncio.sleep(self.rate_limit_delay)
-            self.client = httpx.AsyncClient(
-                headers={"User-Agent": self.user_agent},
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=self.verify_ssl
-            )
 
     async def health_check(self) -> bool:
         """Check if HTTP client is working.
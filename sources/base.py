@@ -16,7 +16,11 @@ Example:
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+import asyncio
 import logging
+import random
+
+import httpx
 
 from models.document import RawDocument, DocumentSource
 
@@ -64,6 +68,44 @@ class ValidationError(SourceError):
     pass
 
 
+def is_retryable(error: Exception) -> bool:
+    """Check whether a fetch failure is worth retrying.
+
+    Validation errors and HTTP 4xx responses (other than 429) fail the
+    same way on every attempt. Rate limiting, server errors, network
+    errors and timeouts are transient. The HTTP status is read from the
+    error context (``status_code``) or from an ``httpx.HTTPStatusError``,
+    directly or as the error's cause.
+
+    Args:
+        error: Exception raised by a fetch attempt
+
+    Returns:
+        True if another attempt may succeed, False otherwise
+
+    Example:
+        >>> is_retryable(FetchError("HTTP 503", source="api_fetch", status_code=503))
+        True
+        >>> is_retryable(FetchError("HTTP 404", source="api_fetch", status_code=404))
+        False
+    """
+    if isinstance(error, ValidationError):
+        return False
+
+    status_code = None
+    if isinstance(error, SourceError):
+        status_code = error.context.get("status_code")
+    if status_code is None:
+        for candidate in (error, error.__cause__):
+            if isinstance(candidate, httpx.HTTPStatusError):
+                status_code = candidate.response.status_code
+                break
+
+    if status_code is None:
+        return True
+    return status_code == 429 or status_code >= 500
+
+
 class BaseSourceAdapter(ABC):
     """Abstract base class for all source adapters.
 
@@ -180,20 +222,38 @@ class BaseSourceAdapter(ABC):
             tenant_id=self.tenant_id
         )
 
+    async def close(self) -> None:
+        """Release resources held by the adapter.
+
+        Adapters are cached and reused across fetches, so connections and
+        pools live until this is called. Override this method in adapters
+        that hold HTTP clients or database engines.
+
+        Example:
+            >>> await adapter.close()
+        """
+
     async def fetch_with_retry(
         self,
         max_attempts: int = 3,
-        backoff_base: float = 2.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
         *args,
         **kwargs
     ) -> List[RawDocument]:
         """Fetch documents with automatic retry logic.
 
-        Implements exponential backoff for transient failures.
+        Retries transient failures (see is_retryable) with capped
+        exponential backoff and full jitter: before attempt n + 1 the
+        adapter sleeps a random time between 0 and
+        min(backoff_max, backoff_base * 2 ** (n - 1)) seconds, so jobs
+        that fail together do not retry in lockstep. Permanent failures
+        are not retried.
 
         Args:
-            max_attempts: Maximum number of retry attempts
-            backoff_base: Base for exponential backoff calculation
+            max_attempts: Maximum number of fetch attempts
+            backoff_base: Backoff ceiling before the first retry (seconds)
+            backoff_max: Upper bound for any backoff ceiling (seconds)
             *args: Arguments to pass to fetch()
             **kwargs: Keyword arguments to pass to fetch()
 
@@ -201,7 +261,7 @@ class BaseSourceAdapter(ABC):
             List of RawDocument objects
 
         Raises:
-            FetchError: If all retry attempts fail
+            FetchError: If all retry attempts fail or the failure is permanent
 
         Example:
             >>> documents = await adapter.fetch_with_retry(
@@ -209,8 +269,6 @@ class BaseSourceAdapter(ABC):
             ...     file_path="/path/to/doc.pdf"
             ... )
         """
-        import asyncio
-
         last_error = None
 
         for attempt in range(1, max_attempts + 1):
@@ -239,37 +297,44 @@ class BaseSourceAdapter(ABC):
 
             except Exception as e:
                 last_error = e
+                retryable = is_retryable(e)
                 self.logger.warning(
                     f"Fetch attempt {attempt} failed: {str(e)}",
                     extra={
                         "source_type": self.source_type.value,
                         "attempt": attempt,
-                        "error": str(e)
+                        "error": str(e),
+                        "retryable": retryable
                     }
                 )
 
-                if attempt < max_attempts:
-                    backoff_seconds = backoff_base ** attempt
-                    self.logger.info(
-                        f"Retrying in {backoff_seconds:.1f} seconds",
-                        extra={
-                            "source_type": self.source_type.value,
-                            "backoff_seconds": backoff_seconds
-                        }
-                    )
-                    await asyncio.sleep(backoff_seconds)
+                if not retryable or attempt == max_attempts:
+                    break
+
+                backoff_seconds = random.uniform(
+                    0, min(backoff_max, backoff_base * 2 ** (attempt - 1))
+                )
+                self.logger.info(
+                    f"Retrying in {backoff_seconds:.1f} seconds",
+                    extra={
+                        "source_type": self.source_type.value,
+                        "backoff_seconds": backoff_seconds
+                    }
+                )
+                await asyncio.sleep(backoff_seconds)
 
-        # All attempts failed
-        error_msg = f"Failed to fetch after {max_attempts} attempts: {str(last_error)}"
+        # All attempts failed, or the failure was permanent
+        error_msg = f"Failed to fetch after {attempt} attempts: {str(last_error)}"
         self.logger.error(
             error_msg,
             extra={
                 "source_type": self.source_type.value,
+                "attempts": attempt,
                 "max_attempts": max_attempts
             },
             exc_info=True
         )
-        raise FetchError(error_msg, source=self.source_type.value)
+        raise FetchError(error_msg, source=self.source_type.value) from last_error
 
     def get_supported_formats(self) -> List[str]:
         """Get list of supported file formats for this source.
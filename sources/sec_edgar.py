@@ -102,7 +102,8 @@ class SECEdgarAdapter(BaseSourceAdapter):
         user_agent: str,
         tenant_id: Optional[str] = None,
         rate_limit_delay: float = 0.1,  # 10 requests/second
-        max_filing_size: int = 50 * 1024 * 1024  # 50MB
+        max_filing_size: int = 50 * 1024 * 1024,  # 50MB
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """Initialize SEC EDGAR adapter.
 
@@ -111,6 +112,8 @@ class SECEdgarAdapter(BaseSourceAdapter):
             tenant_id: Multi-tenant identifier
             rate_limit_delay: Delay between requests (default: 0.1s = 10 req/s)
             max_filing_size: Maximum filing size in bytes
+            transport: Optional shared httpx transport (connection pool);
+                a client-owned pool is created if None
 
         Raises:
             ValidationError: If user_agent doesn't include contact information
@@ -148,7 +151,8 @@ class SECEdgarAdapter(BaseSourceAdapter):
                 "Host": "www.sec.gov"
             },
             timeout=30.0,
-            follow_redirects=True
+            follow_redirects=True,
+            transport=transport
         )
 
     def _validate_user_agent(self, user_agent: str) -> bool:
@@ -606,13 +610,21 @@ class SECEdgarAdapter(BaseSourceAdapter):
         """
         return self.SUPPORTED_FORMS
 
+    async def close(self) -> None:
+        """Close HTTP client connection.
+
+        Example:
+            >>> await adapter.close()
+        """
+        await self.client.aclose()
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        await self.close()
 
 
 # Example usage
@@ -95,7 +95,8 @@ class URLScrapeAdapter(BaseSourceAdapter):
         timeout: float = 30.0,
         follow_links: bool = False,
         max_depth: int = 1,
-        respect_robots: bool = True
+        respect_robots: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """Initialize URL scrape adapter.
 
@@ -108,6 +109,8 @@ class URLScrapeAdapter(BaseSourceAdapter):
             follow_links: Whether to follow links
             max_depth: Maximum crawl depth
             respect_robots: Whether to check robots.txt
+            transport: Optional shared httpx transport (connection pool);
+                a client-owned pool is created if None
 
         Example:
             >>> adapter = URLScrapeAdapter(
@@ -132,9 +135,6 @@ class URLScrapeAdapter(BaseSourceAdapter):
         # Track last request time per domain for rate limiting
         self._last_request_per_domain: Dict[str, float] = {}
 
-        # Track visited URLs to avoid duplicates
-        self._visited_urls: Set[str] = set()
-
         # HTTP client
         self.client = httpx.AsyncClient(
             headers={
@@ -145,7 +145,8 @@ class URLScrapeAdapter(BaseSourceAdapter):
             },
             timeout=self.timeout,
             follow_redirects=True,
-            max_redirects=5
+            max_redirects=5,
+            transport=transport
         )
 
     def _get_domain(self, url: str) -> str:
@@ -562,8 +563,9 @@ class URLScrapeAdapter(BaseSourceAdapter):
         # Validate input
         await self.validate_input(url=url, sitemap_url=sitemap_url)
 
-        # Clear visited URLs for new fetch
-        self._visited_urls.clear()
+        # Track visited URLs to avoid duplicates; kept per fetch so that
+        # concurrent fetches through a shared adapter do not interfere
+        visited_urls: Set[str] = set()
 
         try:
             documents = []
@@ -582,10 +584,10 @@ class URLScrapeAdapter(BaseSourceAdapter):
                         continue
 
                     # Skip if already visited
-                    if page_url in self._visited_urls:
+                    if page_url in visited_urls:
                         continue
 
-                    self._visited_urls.add(page_url)
+                    visited_urls.add(page_url)
 
                     try:
                         content, metadata = await self._fetch_url_content(page_url)
@@ -693,13 +695,21 @@ class URLScrapeAdapter(BaseSourceAdapter):
             )
             return False
 
+    async def close(self) -> None:
+        """Close HTTP client connection.
+
+        Example:
+            >>> await adapter.close()
+        """
+        await self.client.aclose()
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        await self.close()
 
 
 # Example usage
@@ -116,6 +116,7 @@ def mock_dataforge() -> MagicMock:
     """
     mock = MagicMock(spec=DataForgeClient)
     mock.store_embeddings = AsyncMock(return_value={"status": "success", "count": 10})
+    mock.store_documents_metadata_batch = AsyncMock(return_value={"status": "success", "count": 1})
     mock.query_knowledge_base = AsyncMock(return_value={"results": []})
     return mock
 
@@ -136,6 +137,11 @@ def mock_embedding_service() -> MagicMock:
     mock.generate_embeddings = AsyncMock(
         return_value=[[0.1] * 1536 for _ in range(10)]
     )
+
+    async def generate_embeddings_streaming(texts, correlation_id, model=None):
+        yield [[0.1] * 1536 for _ in texts]
+
+    mock.generate_embeddings_streaming = generate_embeddings_streaming
     return mock
 
 
@@ -0,0 +1,301 @@
+"""Unit Tests for the Chunk Stage
+
+Tests for document segmentation and chunk assembly in ChunkStage.
+
+Run with:
+    pytest tests/unit/test_chunk_stage.py -v
+"""
+
+import pytest
+
+from models.document import CleanedDocument, DocumentSource
+from pipeline import chunk as chunk_module
+from pipeline.chunk import ChunkStage
+from pipeline.stats import StageStats
+
+
+@pytest.fixture
+def stage():
+    """Create a legacy chunk stage with small chunks."""
+    return ChunkStage(chunk_size=100, overlap=20, min_chunk_size=1)
+
+
+def make_document(content: str) -> CleanedDocument:
+    """Build a cleaned document around the given content."""
+    return CleanedDocument(
+        id="doc-test",
+        source=DocumentSource.FILE_UPLOAD,
+        content=content,
+        word_count=len(content.split()),
+        char_count=len(content),
+        tenant_id="tenant-test"
+    )
+
+
+class WhitespaceEncoder:
+    """Stand-in for a tiktoken encoding that counts whitespace-separated words."""
+
+    def encode_ordinary(self, text):
+        return text.split()
+
+
+class CharacterEncoder:
+    """Stand-in for a tiktoken encoding with one token per character, like CJK text."""
+
+    def encode_ordinary(self, text):
+        return [ord(char) for char in text]
+
+    def decode_bytes(self, tokens):
+        return "".join(map(chr, tokens)).encode("utf-8")
+
+
+class TestEstimateTokens:
+    """Tests for ChunkStage token estimation."""
+
+    def test_heuristic_fallback(self, stage, monkeypatch):
+        """Test the ~4 chars per token fallback when no encoder is available."""
+        monkeypatch.setattr(chunk_module, "_get_encoder", lambda: None)
+        assert stage._estimate_tokens("a" * 40) == 10
+        assert stage._estimate_tokens("ab") == 1
+        assert stage._estimate_tokens_batch(["a" * 40, "ab"]) == [10, 1]
+
+    def test_uses_encoder_when_available(self, stage, monkeypatch):
+        """Test that single and batched counts come from the encoder."""
+        monkeypatch.setattr(chunk_module, "_get_encoder", lambda: WhitespaceEncoder())
+        assert stage._estimate_tokens("one two three") == 3
+        assert stage._estimate_tokens_batch(["one two three", "four", ""]) == [3, 1, 1]
+
+
+class TestSplitIntoParagraphs:
+    """Tests for ChunkStage._split_into_paragraphs."""
+
+    def test_blank_line_separator(self, stage):
+        """Test splitting on plain blank lines."""
+        assert stage._split_into_paragraphs("Para 1\n\nPara 2") == ["Para 1", "Para 2"]
+
+    def test_whitespace_only_blank_lines(self, stage):
+        """Test blank lines containing spaces, tabs or CRLF."""
+        text = "One\r\n\r\nTwo\n \nThree\n\t\n\nFour"
+        assert stage._split_into_paragraphs(text) == ["One", "Two", "Three", "Four"]
+
+    def test_single_newline_is_not_a_break(self, stage):
+        """Test that a single newline keeps the paragraph together."""
+        assert stage._split_into_paragraphs("  line 1\nline 2  ") == ["line 1\nline 2"]
+
+    def test_whitespace_only_text(self, stage):
+        """Test that whitespace-only text yields no paragraphs."""
+        assert stage._split_into_paragraphs("   ") == []
+
+
+class TestCreateChunks:
+    """Tests for ChunkStage._create_chunks."""
+
+    def test_overlap_carries_trailing_sentences(self):
+        """Test that each chunk starts with the tail of the previous one."""
+        stage = ChunkStage(chunk_size=50, overlap=20, respect_paragraphs=False, min_chunk_size=1)
+        text = " ".join(f"Sentence number {i} is here." for i in range(30))
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert len(chunks) > 1
+        for previous, current in zip(chunks, chunks[1:]):
+            previous_sentences = stage._split_into_sentences(previous.content)
+            carried = [s for s in stage._split_into_sentences(current.content) if s in previous_sentences]
+            assert carried
+            assert previous_sentences[-len(carried):] == carried
+
+    def test_overlap_respects_token_budget(self):
+        """Test that the carried-over tail never exceeds the overlap budget."""
+        stage = ChunkStage(chunk_size=50, overlap=20, respect_paragraphs=False, min_chunk_size=1)
+        text = " ".join(f"Sentence number {i} is here." for i in range(30))
+
+        chunks = stage._create_chunks(make_document(text))
+
+        for previous, current in zip(chunks, chunks[1:]):
+            previous_sentences = stage._split_into_sentences(previous.content)
+            carried = [s for s in stage._split_into_sentences(current.content) if s in previous_sentences]
+            assert sum(stage._estimate_tokens_batch(carried)) <= stage.overlap
+
+    def test_no_overlap(self):
+        """Test that chunks do not share sentences when overlap is zero."""
+        stage = ChunkStage(chunk_size=50, overlap=0, respect_paragraphs=False, min_chunk_size=1)
+        text = " ".join(f"Sentence number {i} is here." for i in range(30))
+
+        chunks = stage._create_chunks(make_document(text))
+
+        sentences = [s for c in chunks for s in stage._split_into_sentences(c.content)]
+        assert len(sentences) == len(set(sentences)) == 30
+
+    def test_oversize_sentence_split_by_characters(self):
+        """Test that a sentence longer than chunk_size is not re-split by sentence."""
+        stage = ChunkStage(chunk_size=20, overlap=5, respect_paragraphs=False, min_chunk_size=1)
+        text = "Short one. " + "x" * 400 + ". Another short one."
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert len(chunks) > 2
+        assert all(chunk.token_count <= stage.chunk_size for chunk in chunks)
+
+    @pytest.mark.parametrize("respect_sentences", [True, False])
+    def test_oversize_segment_split_by_tokens(self, monkeypatch, respect_sentences):
+        """Test that split pieces of dense text stay within chunk_size tokens."""
+        monkeypatch.setattr(chunk_module, "_get_encoder", lambda: CharacterEncoder())
+        stage = ChunkStage(
+            chunk_size=100,
+            overlap=10,
+            respect_paragraphs=False,
+            respect_sentences=respect_sentences,
+            min_chunk_size=1
+        )
+        text = "日本語のテキストを分割します" * 40
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert [chunk.token_count for chunk in chunks] == [100] * 5 + [60]
+        assert "".join(chunk.content for chunk in chunks) == text
+        for chunk in chunks:
+            assert text[chunk.start_char:chunk.end_char] == chunk.content
+
+    def test_short_document_single_chunk(self, stage):
+        """Test that a document within chunk_size becomes one verbatim chunk."""
+        text = "  First paragraph.\n\nSecond paragraph.  "
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert len(chunks) == 1
+        assert chunks[0].content == text.strip()
+        assert text[chunks[0].start_char:chunks[0].end_char] == text.strip()
+
+    def test_short_document_encoded_once(self, monkeypatch):
+        """Test that a single-chunk document is tokenized exactly once."""
+        calls = []
+        encoder = WhitespaceEncoder()
+        monkeypatch.setattr(encoder, "encode_ordinary", lambda text: calls.append(text) or text.split())
+        monkeypatch.setattr(chunk_module, "_get_encoder", lambda: encoder)
+        stage = ChunkStage(chunk_size=100, overlap=20, min_chunk_size=1)
+
+        chunks = stage._create_chunks(make_document("  One short paragraph here.  "))
+
+        assert [chunk.token_count for chunk in chunks] == [4]
+        assert calls == ["One short paragraph here."]
+
+    def test_short_document_below_minimum(self):
+        """Test that a document below min_chunk_size produces no chunks."""
+        stage = ChunkStage(chunk_size=100, overlap=20, min_chunk_size=50)
+
+        assert stage._create_chunks(make_document("Too short.")) == []
+
+    def test_chunks_share_read_only_metadata(self):
+        """Test that a document's chunks reference one read-only metadata dict."""
+        stage = ChunkStage(chunk_size=20, overlap=5, respect_paragraphs=False, min_chunk_size=1)
+        text = " ".join(f"Sentence number {i} is here." for i in range(30))
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert len(chunks) > 1
+        assert all(chunk.metadata is chunks[0].metadata for chunk in chunks)
+        assert chunks[0].metadata["chunk_size_tokens"] == 20
+        with pytest.raises(TypeError):
+            chunks[0].metadata["position"] = 0
+        assert chunks[0].model_dump()["metadata"]["chunk_strategy"] == "token_based"
+
+    def test_chunk_ids_unique(self):
+        """Test that chunk IDs are unique within and across documents."""
+        stage = ChunkStage(chunk_size=20, overlap=5, respect_paragraphs=False, min_chunk_size=1)
+        text = " ".join(f"Sentence number {i} is here." for i in range(30))
+
+        first = stage._create_chunks(make_document(text))
+        second = stage._create_chunks(make_document(text))
+
+        ids = [chunk.id for chunk in first + second]
+        assert len(ids) == len(set(ids))
+        assert all(chunk_id.startswith("chunk-") for chunk_id in ids)
+
+    @pytest.mark.parametrize("respect_paragraphs,respect_sentences", [
+        (True, True),
+        (False, True),
+        (True, False),
+    ])
+    def test_offsets_point_at_source_text(self, respect_paragraphs, respect_sentences):
+        """Test that start_char/end_char slice the chunk's text out of the document."""
+        stage = ChunkStage(
+            chunk_size=50,
+            overlap=10,
+            respect_paragraphs=respect_paragraphs,
+            respect_sentences=respect_sentences,
+            min_chunk_size=1
+        )
+        long_paragraph = " ".join(f"Sentence number {i} is here." for i in range(60))
+        text = f"  Intro paragraph.\n \n{long_paragraph}\r\n\r\nShort closing paragraph.  "
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert chunks
+        for chunk in chunks:
+            source = text[chunk.start_char:chunk.end_char]
+            assert source.split() == chunk.content.split()
+
+    def test_token_counts_not_recounted(self, monkeypatch):
+        """Test that chunk token counts come from the batched segment counts."""
+        monkeypatch.setattr(chunk_module, "_get_encoder", lambda: WhitespaceEncoder())
+        stage = ChunkStage(chunk_size=20, overlap=5, respect_paragraphs=False, min_chunk_size=1)
+        monkeypatch.setattr(stage, "_estimate_tokens", lambda text: pytest.fail("chunk text re-tokenized"))
+        text = " ".join(f"Sentence number {i} is here." for i in range(30)) + " " + "x" * 400 + "."
+
+        chunks = stage._create_chunks(make_document(text))
+
+        assert len(chunks) > 2
+        assert all(chunk.token_count == len(chunk.content.split()) for chunk in chunks)
+
+
+class TestExecute:
+    """Tests for ChunkStage.execute."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_keep_document_order(self, stage):
+        """Test that concurrently chunked documents come back in input order."""
+        documents = [
+            CleanedDocument(
+                id=f"doc-{i}",
+                source=DocumentSource.FILE_UPLOAD,
+                content="\n\n".join(
+                    " ".join(f"Sentence {j} of paragraph {k}." for j in range(5))
+                    for k in range(8)
+                ),
+                word_count=200,
+                char_count=1000
+            )
+            for i in range(5)
+        ]
+
+        chunks = await stage.execute(documents, correlation_id="trace-test", job_id="job-test")
+
+        document_ids = [chunk.document_id for chunk in chunks]
+        assert document_ids == sorted(document_ids)
+        assert set(document_ids) == {doc.id for doc in documents}
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_execute(self):
+        """Test that execute_stream yields the same chunks as execute, in order."""
+        stage = ChunkStage(chunk_size=100, overlap=20, min_chunk_size=1, max_concurrency=2)
+        documents = [
+            make_document(" ".join(f"Sentence {j} of document {i}." for j in range(10 * (i + 1))))
+            for i in range(5)
+        ]
+
+        streamed = [chunk async for chunk in stage.execute_stream(documents, correlation_id="trace-test")]
+        collected = await stage.execute(documents, correlation_id="trace-test")
+
+        assert [c.content for c in streamed] == [c.content for c in collected]
+
+    @pytest.mark.asyncio
+    async def test_fills_stats(self, stage):
+        """Test that the chunk count, token total and duration are reported through stats."""
+        documents = [make_document(" ".join(f"Sentence {j} here." for j in range(60)))]
+        stats = StageStats()
+
+        chunks = await stage.execute(documents, correlation_id="trace-test", stats=stats)
+
+        assert stats.items == len(chunks)
+        assert stats.total_tokens == sum(chunk.token_count for chunk in chunks)
+        assert stats.duration_ms > 0
@@ -0,0 +1,129 @@
+"""Unit Tests for the Clean Stage
+
+Tests for text normalization and cleaning in CleanStage.
+
+Run with:
+    pytest tests/unit/test_clean_stage.py -v
+"""
+
+import pytest
+
+from models.document import RawDocument
+from pipeline.clean import CleanStage
+
+
+@pytest.fixture
+def stage():
+    """Create a clean stage with URL and email removal enabled."""
+    return CleanStage(remove_urls=True, remove_emails=True)
+
+
+class TestCleanText:
+    """Tests for CleanStage._clean_text."""
+
+    def test_collapses_whitespace(self, stage):
+        """Test that space runs, blank-line runs and line padding are collapsed."""
+        text = "  Hello    World  \r\n\r\n\r\n\n   Test  "
+        assert stage._clean_text(text) == "Hello World\n\nTest"
+
+    def test_whitespace_only_lines_collapse(self, stage):
+        """Test that blank lines holding only whitespace count as one break."""
+        text = "One\n \n\t\n  \nTwo \t  three\rFour"
+        assert stage._clean_text(text) == "One\n\nTwo \t three\nFour"
+
+    @pytest.mark.parametrize("padding", [" ", "   ", "\t", " \u00a0 "])
+    def test_strips_line_padding(self, stage, padding):
+        """Test that both whitespace paths strip padding around line breaks."""
+        text = f"first{padding}\n{padding}second{padding}\n\n{padding}third"
+        assert stage._clean_text(text) == "first\nsecond\n\nthird"
+
+    def test_whitespace_normalization_disabled(self):
+        """Test that only line endings and newline runs change without normalization."""
+        stage = CleanStage(normalize_whitespace=False)
+        text = "One  \r\n\r\n\r\nTwo"
+        assert stage._clean_text(text) == "One  \n\nTwo"
+
+    def test_normalizes_unicode(self, stage):
+        """Test NFKC normalization of non-ASCII text."""
+        assert stage._clean_text("\ufb01ne \u2460\u00a0caf\u00e9") == "fine 1 caf\u00e9"
+
+    @pytest.mark.parametrize("text", [
+        "  plain   ascii words\n\n\nacross  lines  ",
+        "tabs\tand\r\ncarriage returns",
+        "caf\u00e9 na\u00efve \u2003 words",
+    ])
+    def test_word_count_matches_cleaned_text(self, stage, text):
+        """Test that the folded word count matches counting the cleaned text."""
+        cleaned, word_count = stage._clean_and_count_words(text)
+        assert cleaned == stage._clean_text(text)
+        assert word_count == len(cleaned.split())
+
+    def test_removes_urls(self, stage):
+        """Test URL removal, including parentheses inside the URL."""
+        text = "See https://example.com/wiki/Foo_(bar) for more."
+        assert stage._clean_text(text) == "See for more."
+
+    def test_removes_emails(self, stage):
+        """Test email address removal."""
+        assert stage._clean_text("Contact test@example.com today") == "Contact today"
+
+    def test_flags_disabled(self):
+        """Test that URLs and emails are kept when removal is disabled."""
+        stage = CleanStage()
+        text = "Visit https://example.com or mail a@b.org"
+        assert stage._clean_text(text) == text
+
+    def test_cache_reuses_results(self):
+        """Test that repeated texts are served from the memo cache."""
+        stage = CleanStage(cache_size=8, cache_max_chars=50)
+        short, long = "Repeated   text", "Long  text " * 10
+
+        assert stage._clean_and_count_words(short) == ("Repeated text", 2)
+        assert stage._clean_and_count_words(short) == ("Repeated text", 2)
+        stage._clean_and_count_words(long)
+
+        info = stage._clean_cached.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_cache_disabled_by_default(self, stage):
+        """Test that no cache is kept unless a cache_size is given."""
+        assert stage._clean_cached is None
+
+
+class TestExecute:
+    """Tests for CleanStage.execute."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parallel_threshold", [0, 100])
+    async def test_cleans_documents_in_order(self, parallel_threshold):
+        """Test that threaded and inline cleaning return documents in input order."""
+        stage = CleanStage(parallel_threshold=parallel_threshold)
+        documents = [
+            RawDocument(id=f"doc-{i}", source="file_upload", content=f"  Document   {i}\n\n\n\nbody  ")
+            for i in range(20)
+        ]
+
+        cleaned = await stage.execute(documents, correlation_id="trace-test", job_id="job-test")
+
+        assert [doc.id for doc in cleaned] == [doc.id for doc in documents]
+        assert cleaned[3].content == "Document 3\n\nbody"
+        assert cleaned[3].word_count == 3
+        assert cleaned[3].metadata["original_length"] == len(documents[3].content)
+
+    @pytest.mark.asyncio
+    async def test_pre_normalized_documents_skip_nfkc(self):
+        """Test that documents flagged pre_normalized keep their unicode as-is."""
+        stage = CleanStage()
+        documents = [
+            RawDocument(id="doc-raw", source="file_upload", content="\ufb01le one"),
+            RawDocument(
+                id="doc-pre",
+                source="file_upload",
+                content="\ufb01le one",
+                metadata={"pre_normalized": True}
+            ),
+        ]
+
+        cleaned = await stage.execute(documents, correlation_id="trace-test", job_id="job-test")
+
+        assert [doc.content for doc in cleaned] == ["file one", "\ufb01le one"]
@@ -0,0 +1,48 @@
+"""Unit Tests for Concurrency Utilities
+
+Tests for the SharedSemaphore concurrency limit.
+
+Run with:
+    pytest tests/unit/test_concurrency.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from utils.concurrency import SharedSemaphore
+
+
+class TestSharedSemaphore:
+    """Tests for SharedSemaphore."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_holders(self):
+        """Test that no more than limit holders run at once."""
+        limit = SharedSemaphore(2)
+        active = peak = 0
+
+        async def work():
+            nonlocal active, peak
+            async with limit:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+
+    def test_separate_semaphore_per_loop(self):
+        """Test that the limit can be used from successive event loops."""
+        limit = SharedSemaphore(1)
+
+        async def contend():
+            async def hold():
+                async with limit:
+                    await asyncio.sleep(0)
+            await asyncio.gather(hold(), hold())
+
+        asyncio.run(contend())
+        asyncio.run(contend())
@@ -0,0 +1,70 @@
+"""Unit Tests for the Job Context
+
+Tests for job_context binding and the ContextFilter logging filter.
+
+Run with:
+    pytest tests/unit/test_context.py -v
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from pipeline.context import ContextFilter, job_context, job_id_var
+
+
+def make_record(**extra):
+    """Build a log record with optional extra attributes."""
+    record = logging.LogRecord("pipeline.test", logging.INFO, __file__, 1, "message", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestContextFilter:
+    """Tests for ContextFilter."""
+
+    def test_copies_bound_ids(self):
+        """Test that records logged inside a job carry its identifiers."""
+        record = make_record()
+
+        with job_context("trace-test", "job-test", "tenant-test"):
+            assert ContextFilter().filter(record)
+
+        assert (record.correlation_id, record.job_id, record.tenant_id) == (
+            "trace-test", "job-test", "tenant-test"
+        )
+
+    def test_explicit_extra_wins(self):
+        """Test that identifiers passed through extra are kept."""
+        record = make_record(job_id="job-explicit")
+
+        with job_context("trace-test", "job-test"):
+            ContextFilter().filter(record)
+
+        assert record.job_id == "job-explicit"
+
+    def test_unbound_after_block(self):
+        """Test that identifiers are reset when the block exits."""
+        with job_context("trace-test", "job-test"):
+            pass
+
+        record = make_record()
+        ContextFilter().filter(record)
+
+        assert record.job_id is None
+
+
+class TestJobContext:
+    """Tests for job_context."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_context(self):
+        """Test that tasks created inside a job see its identifiers."""
+        async def read_job_id():
+            return job_id_var.get()
+
+        with job_context("trace-test", "job-test"):
+            task = asyncio.create_task(read_job_id())
+
+        assert await task == "job-test"
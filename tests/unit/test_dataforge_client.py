@@ -0,0 +1,84 @@
+"""Unit Tests for the DataForge Client
+
+Tests for DataForgeClient request payloads, using an httpx mock
+transport that records the requests it receives.
+
+Run with:
+    pytest tests/unit/test_dataforge_client.py -v
+"""
+
+import base64
+import json
+import struct
+from typing import List
+
+import httpx
+import pytest
+
+from models.document import Embedding
+from services.dataforge_client import DataForgeClient, _encode_batch_json, _encode_json
+
+
+def make_client(requests: List[httpx.Request], packed_vectors: bool) -> DataForgeClient:
+    """Build a client whose requests are recorded and answered with 200."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"count": 2})
+
+    client = DataForgeClient(base_url="http://dataforge.test", packed_vectors=packed_vectors)
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def make_embeddings() -> List[Embedding]:
+    """Build two embeddings with distinct vectors."""
+    return [
+        Embedding(chunk_id=f"chunk-{i}", vector=[i + 0.5] * 1536, tenant_id="tenant-test")
+        for i in range(2)
+    ]
+
+
+class TestEncodeBatchJson:
+    """Tests for _encode_batch_json."""
+
+    @pytest.mark.asyncio
+    async def test_matches_single_encode(self):
+        """Test that slice-wise encoding gives the same body as one dumps call."""
+        records = [{"id": f"emb-{i}", "vector": [i / 3, -1.5], "metadata": {"title": "Café"}} for i in range(40)]
+
+        body = await _encode_batch_json("embeddings", records, {"tenant_id": None})
+
+        assert body == _encode_json({"embeddings": records, "tenant_id": None})
+        assert await _encode_batch_json("embeddings", [], {}) == b'{"embeddings":[]}'
+
+
+class TestStoreEmbeddings:
+    """Tests for DataForgeClient.store_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_json_vectors_by_default(self):
+        """Test that each record carries its vector as a float list."""
+        requests: List[httpx.Request] = []
+        client = make_client(requests, packed_vectors=False)
+
+        await client.store_embeddings(make_embeddings(), correlation_id="trace-test")
+
+        payload = json.loads(requests[0].content)
+        assert [record["vector"][0] for record in payload["embeddings"]] == [0.5, 1.5]
+        assert "vectors" not in payload
+
+    @pytest.mark.asyncio
+    async def test_packed_vectors(self):
+        """Test that vectors are sent once as a row-major float32 buffer."""
+        requests: List[httpx.Request] = []
+        client = make_client(requests, packed_vectors=True)
+        embeddings = make_embeddings()
+
+        await client.store_embeddings(embeddings, correlation_id="trace-test")
+
+        payload = json.loads(requests[0].content)
+        assert payload["vector_encoding"] == "float32-base64"
+        assert payload["dimensions"] == 1536
+        assert all("vector" not in record for record in payload["embeddings"])
+        values = struct.unpack("<3072f", base64.b64decode(payload["vectors"]))
+        assert [list(values[:1536]), list(values[1536:])] == [emb.vector for emb in embeddings]
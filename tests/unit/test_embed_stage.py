@@ -0,0 +1,130 @@
+"""Unit Tests for the Embed Stage
+
+Tests for embedding generation in EmbedStage, using a fake embedding
+service in place of the OpenAI client.
+
+Run with:
+    pytest tests/unit/test_embed_stage.py -v
+"""
+
+from typing import AsyncIterator, List, Optional
+
+import pytest
+
+from models.document import Chunk
+from pipeline.embed import EmbedStage, EmbedStageError
+
+DIMENSIONS = 1536
+
+
+class FakeEmbeddingService:
+    """Embedding service stand-in that records the texts it was asked to embed."""
+
+    model = "text-embedding-3-small"
+
+    def __init__(self, batch_size: int = 2, dimensions: int = DIMENSIONS):
+        self.batch_size = batch_size
+        self.dimensions = dimensions
+        self.calls: List[List[str]] = []
+
+    async def generate_embeddings_streaming(
+        self,
+        texts: List[str],
+        correlation_id: str,
+        model: Optional[str] = None
+    ) -> AsyncIterator[List[List[float]]]:
+        for i in range(0, len(texts), self.batch_size):
+            batch = texts[i:i + self.batch_size]
+            self.calls.append(list(batch))
+            yield [[float(len(text))] * self.dimensions for text in batch]
+
+    async def close(self) -> None:
+        pass
+
+
+def make_chunk(position: int, content: str) -> Chunk:
+    """Build a chunk of a test document."""
+    return Chunk(
+        id=f"chunk-{position}",
+        document_id="doc-test",
+        content=content,
+        position=position,
+        token_count=len(content.split()),
+        start_char=0,
+        end_char=len(content),
+        metadata={"chunk_strategy": "token_based"},
+        tenant_id="tenant-test"
+    )
+
+
+@pytest.fixture
+def service():
+    """Create a fake embedding service."""
+    return FakeEmbeddingService()
+
+
+class TestExecute:
+    """Tests for EmbedStage.execute."""
+
+    @pytest.mark.asyncio
+    async def test_one_embedding_per_chunk(self, service):
+        """Test that every chunk gets an embedding carrying its metadata."""
+        stage = EmbedStage(embedding_service=service)
+        chunks = [make_chunk(i, "x" * (i + 1)) for i in range(3)]
+
+        embeddings = await stage.execute(chunks, correlation_id="trace-test", job_id="job-test")
+
+        assert [e.chunk_id for e in embeddings] == [c.id for c in chunks]
+        assert [e.vector[0] for e in embeddings] == [1.0, 2.0, 3.0]
+        assert embeddings[2].model == service.model
+        assert embeddings[2].metadata["chunk_position"] == 2
+        assert embeddings[2].metadata["embedding_dimension"] == DIMENSIONS
+        assert embeddings[2].metadata["chunk_strategy"] == "token_based"
+        assert embeddings[2].id.startswith("emb-")
+        assert embeddings[2].tenant_id == "tenant-test"
+
+    @pytest.mark.asyncio
+    async def test_no_chunks(self, service):
+        """Test that an empty chunk list skips the embedding service."""
+        stage = EmbedStage(embedding_service=service)
+
+        assert await stage.execute([], correlation_id="trace-test") == []
+        assert service.calls == []
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_one_list_per_batch(self, service):
+        """Test that execute_stream yields each API batch before requesting the next."""
+        stage = EmbedStage(embedding_service=service)
+        chunks = [make_chunk(i, "x" * (i + 1)) for i in range(5)]
+
+        batches = []
+        async for batch in stage.execute_stream(chunks, correlation_id="trace-test"):
+            batches.append([e.chunk_id for e in batch])
+            assert len(service.calls) == len(batches)
+
+        assert batches == [["chunk-0", "chunk-1"], ["chunk-2", "chunk-3"], ["chunk-4"]]
+
+    @pytest.mark.asyncio
+    async def test_rejects_wrong_dimension(self):
+        """Test that vectors of the wrong dimension fail the stage."""
+        stage = EmbedStage(embedding_service=FakeEmbeddingService(dimensions=3))
+
+        with pytest.raises(EmbedStageError):
+            await stage.execute([make_chunk(0, "text")], correlation_id="trace-test")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self, service):
+        """Test that repeated chunk texts are sent once and fanned back out."""
+        stage = EmbedStage(embedding_service=service)
+        contents = ["a", "bb", "a", "ccc", "bb", "dddd", "a"]
+        chunks = [make_chunk(i, content) for i, content in enumerate(contents)]
+
+        batches = [
+            batch async for batch in stage.execute_stream(chunks, correlation_id="trace-test")
+        ]
+
+        assert service.calls == [["a", "bb"], ["ccc", "dddd"]]
+        embeddings = [e for batch in batches for e in batch]
+        assert [e.chunk_id for e in embeddings] == [c.id for c in chunks]
+        assert [e.vector[0] for e in embeddings] == [float(len(c)) for c in contents]
+        assert len({e.id for e in embeddings}) == len(chunks)
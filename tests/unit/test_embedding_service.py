@@ -0,0 +1,81 @@
+"""Unit Tests for the Embedding Service
+
+Tests for batching and response decoding in EmbeddingService, using a
+fake OpenAI client.
+
+Run with:
+    pytest tests/unit/test_embedding_service.py -v
+"""
+
+import base64
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from services.embedding_service import EmbeddingService, _decode_embedding
+
+
+def encode_vector(values):
+    """Encode floats the way the API does for encoding_format="base64"."""
+    return base64.b64encode(struct.pack(f"<{len(values)}f", *values)).decode("ascii")
+
+
+class FakeEmbeddings:
+    """Stand-in for client.embeddings that records each create() call."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, input, model, encoding_format=None):
+        self.calls.append({"input": list(input), "encoding_format": encoding_format})
+        return SimpleNamespace(data=[
+            SimpleNamespace(embedding=encode_vector([float(len(text)), 0.5]))
+            for text in input
+        ])
+
+
+@pytest.fixture
+def service():
+    """Create an embedding service backed by a fake client."""
+    service = EmbeddingService(api_key="test-key", model="text-embedding-3-small", batch_size=2)
+    service._client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return service
+
+
+class TestDecodeEmbedding:
+    """Tests for _decode_embedding."""
+
+    def test_decodes_base64_float32(self):
+        """Test decoding of a little-endian float32 payload."""
+        assert _decode_embedding(encode_vector([1.0, -2.5, 0.25])) == [1.0, -2.5, 0.25]
+
+    def test_passes_float_lists_through(self):
+        """Test that already-decoded vectors are returned unchanged."""
+        vector = [0.1, 0.2]
+        assert _decode_embedding(vector) is vector
+
+
+class TestGenerateEmbeddings:
+    """Tests for EmbeddingService.generate_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_decodes(self, service):
+        """Test that texts are sent in batches as base64 and decoded in order."""
+        vectors = await service.generate_embeddings(["a", "bb", "ccc"], correlation_id="trace-test")
+
+        calls = service._client.embeddings.calls
+        assert [call["input"] for call in calls] == [["a", "bb"], ["ccc"]]
+        assert all(call["encoding_format"] == "base64" for call in calls)
+        assert vectors == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5]]
+
+    @pytest.mark.asyncio
+    async def test_streaming_yields_per_batch(self, service):
+        """Test that the streaming variant yields one list per API batch."""
+        batches = [
+            batch async for batch in service.generate_embeddings_streaming(
+                ["a", "bb", "ccc"], correlation_id="trace-test"
+            )
+        ]
+
+        assert [len(batch) for batch in batches] == [2, 1]
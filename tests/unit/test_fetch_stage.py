@@ -0,0 +1,300 @@
+"""Unit Tests for the Fetch Stage
+
+Tests for adapter management in FetchStage.
+
+Run with:
+    pytest tests/unit/test_fetch_stage.py -v
+"""
+
+import asyncio
+import sys
+from typing import List
+
+import httpx
+import pytest
+
+from config import settings
+from models.document import DocumentSource, RawDocument
+from pipeline.fetch import FetchStage, FetchStageError
+from pipeline.stats import StageStats
+from sources.base import BaseSourceAdapter, FetchError, ValidationError
+
+
+class RecordingAdapter(BaseSourceAdapter):
+    """Source adapter stand-in that returns one document and records close()."""
+
+    def __init__(self, tenant_id=None):
+        super().__init__(source_type=DocumentSource.FILE_UPLOAD, tenant_id=tenant_id)
+        self.closed = False
+
+    async def fetch(self, **kwargs) -> List[RawDocument]:
+        return [self._create_raw_document(content="Fetched content")]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def stage():
+    """Create a fetch stage whose file_upload source uses the recording adapter."""
+    stage = FetchStage()
+    stage.adapters[DocumentSource.FILE_UPLOAD.value] = RecordingAdapter
+    return stage
+
+
+class TestAdapterCache:
+    """Tests for FetchStage adapter reuse."""
+
+    def test_reuses_adapter_per_source_and_tenant(self, stage):
+        """Test that adapters are cached per (source, tenant_id)."""
+        first = stage._get_adapter("file_upload", "tenant-a")
+
+        assert stage._get_adapter("file_upload", "tenant-a") is first
+        assert stage._get_adapter("file_upload", "tenant-b") is not first
+
+    @pytest.mark.asyncio
+    async def test_execute_uses_cached_adapter(self, stage):
+        """Test that repeated fetches go through one adapter instance."""
+        for _ in range(2):
+            documents = await stage.execute(
+                source="file_upload",
+                correlation_id="trace-test",
+                tenant_id="tenant-a"
+            )
+            assert documents[0].content == "Fetched content"
+
+        assert len(stage._adapter_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_closes_cached_adapters(self, stage):
+        """Test that close() releases every cached adapter."""
+        adapters = [stage._get_adapter("file_upload", tenant) for tenant in ("tenant-a", "tenant-b")]
+
+        await stage.close()
+
+        assert all(adapter.closed for adapter in adapters)
+        assert stage._adapter_cache == {}
+
+    def test_adapter_module_imported_on_first_use(self, monkeypatch):
+        """Test that adapter modules are imported when first needed."""
+        monkeypatch.delitem(sys.modules, "sources.url_scrape", raising=False)
+
+        stage = FetchStage()
+        assert "sources.url_scrape" not in sys.modules
+
+        adapter = stage._get_adapter("url_scrape", "tenant-a")
+        assert type(adapter).__name__ == "URLScrapeAdapter"
+        assert adapter.tenant_id == "tenant-a"
+
+    def test_sec_edgar_binds_configured_settings(self, monkeypatch):
+        """Test that the SEC EDGAR factory carries the configured user agent."""
+        monkeypatch.setattr(settings, "SEC_EDGAR_USER_AGENT", "Rake/1.0 admin@example.com")
+        stage = FetchStage()
+
+        adapter = stage._get_adapter("sec_edgar", "tenant-a")
+
+        assert adapter.user_agent == "Rake/1.0 admin@example.com"
+        assert adapter.rate_limit_delay == settings.SEC_EDGAR_RATE_LIMIT
+        assert adapter.tenant_id == "tenant-a"
+
+    def test_sec_edgar_requires_user_agent(self, monkeypatch):
+        """Test that SEC EDGAR fails with FetchStageError when no user agent is set."""
+        monkeypatch.setattr(settings, "SEC_EDGAR_USER_AGENT", "")
+        stage = FetchStage()
+
+        with pytest.raises(FetchStageError):
+            stage._get_adapter("sec_edgar", "tenant-a")
+
+
+class TestSharedTransport:
+    """Tests for the HTTP connection pool shared by FetchStage adapters."""
+
+    @pytest.mark.asyncio
+    async def test_adapters_share_pool_that_outlives_them(self):
+        """Test that HTTP adapters use one pool, and closing one leaves it open."""
+        stage = FetchStage()
+        stage._http_transport._transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        first = stage._get_adapter("url_scrape", "tenant-a")
+        second = stage._get_adapter("url_scrape", "tenant-b")
+
+        assert first.client._transport is second.client._transport is stage._http_transport
+
+        await first.close()
+        response = await second.client.get("https://example.com")
+
+        assert response.status_code == 200
+        await stage.close()
+
+
+class BatchAdapter(RecordingAdapter):
+    """Source adapter stand-in that returns several documents."""
+
+    async def fetch(self, **kwargs) -> List[RawDocument]:
+        return [self._create_raw_document(content=f"Document {i}") for i in range(3)]
+
+
+class TestExecute:
+    """Tests for FetchStage.execute."""
+
+    @pytest.mark.asyncio
+    async def test_fills_stats(self, stage):
+        """Test that execute returns every document and reports totals."""
+        stage.adapters["file_upload"] = BatchAdapter
+        stats = StageStats()
+
+        documents = await stage.execute(source="file_upload", correlation_id="trace-test", stats=stats)
+
+        assert [doc.content for doc in documents] == ["Document 0", "Document 1", "Document 2"]
+        assert stats.items == 3
+        assert stats.total_chars == sum(len(doc.content) for doc in documents)
+
+
+class SlowAdapter(RecordingAdapter):
+    """Source adapter stand-in whose health probe never finishes in time."""
+
+    async def health_check(self) -> bool:
+        await asyncio.sleep(10)
+        return True
+
+
+class CancelledAdapter(RecordingAdapter):
+    """Source adapter stand-in whose health probe is cancelled."""
+
+    async def health_check(self) -> bool:
+        raise asyncio.CancelledError()
+
+
+class TestHealthCheck:
+    """Tests for FetchStage.health_check."""
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_times_out(self, stage, monkeypatch):
+        """Test that a hanging probe is reported unhealthy without blocking the rest."""
+        monkeypatch.setattr(settings, "HEALTHCHECK_TIMEOUT", 0.05)
+        stage.adapters = {"healthy": RecordingAdapter, "slow": SlowAdapter}
+
+        health = await asyncio.wait_for(stage.health_check(), timeout=1)
+
+        assert health == {"healthy": True, "slow": False}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_unhealthy(self, stage, monkeypatch):
+        """Test that a cancelled probe is cached and reported as False."""
+        monkeypatch.setattr(settings, "HEALTHCHECK_TTL_SEC", 60.0)
+        stage.adapters = {"healthy": RecordingAdapter, "cancelled": CancelledAdapter}
+
+        assert await stage.health_check() == {"healthy": True, "cancelled": False}
+        assert await stage.health_check() == {"healthy": True, "cancelled": False}
+
+    @pytest.mark.asyncio
+    async def test_results_reused_within_ttl(self, stage, monkeypatch):
+        """Test that probes run again only after HEALTHCHECK_TTL_SEC."""
+        probes = []
+
+        def factory(tenant_id=None):
+            probes.append(tenant_id)
+            return RecordingAdapter(tenant_id=tenant_id)
+
+        stage.adapters = {"file_upload": factory}
+        monkeypatch.setattr(settings, "HEALTHCHECK_TTL_SEC", 60.0)
+
+        assert await stage.health_check() == {"file_upload": True}
+        assert await stage.health_check() == {"file_upload": True}
+        assert len(probes) == 1
+
+        monkeypatch.setattr(settings, "HEALTHCHECK_TTL_SEC", 0.0)
+        await stage.health_check()
+        assert len(probes) == 2
+
+
+class FlakyAdapter(RecordingAdapter):
+    """Source adapter stand-in that raises queued errors before succeeding."""
+
+    def __init__(self, errors, tenant_id=None):
+        super().__init__(tenant_id=tenant_id)
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def fetch(self, **kwargs) -> List[RawDocument]:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return await super().fetch(**kwargs)
+
+
+class TestFetchWithRetry:
+    """Tests for BaseSourceAdapter.fetch_with_retry."""
+
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        """Record backoff sleeps instead of waiting."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("sources.base.asyncio.sleep", fake_sleep)
+        return sleeps
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_with_jittered_backoff(self, sleeps):
+        """Test that 503s are retried with sleeps bounded by the capped ceiling."""
+        adapter = FlakyAdapter([
+            FetchError("HTTP 503", source="file_upload", status_code=503),
+            FetchError("HTTP 503", source="file_upload", status_code=503),
+        ])
+
+        documents = await adapter.fetch_with_retry(max_attempts=3, backoff_base=1.0, backoff_max=1.5)
+
+        assert len(documents) == 1
+        assert adapter.calls == 3
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 1.5
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        ValidationError("Invalid URL format", source="file_upload"),
+        FetchError("HTTP 404", source="file_upload", status_code=404),
+    ])
+    async def test_permanent_errors_are_not_retried(self, sleeps, error):
+        """Test that validation errors and 4xx responses fail on the first attempt."""
+        adapter = FlakyAdapter([error])
+
+        with pytest.raises(FetchError) as exc_info:
+            await adapter.fetch_with_retry(max_attempts=3)
+
+        assert adapter.calls == 1
+        assert sleeps == []
+        assert exc_info.value.__cause__ is error
+
+
+class FailingAdapter(RecordingAdapter):
+    """Source adapter stand-in whose fetch fails with a contextual FetchError."""
+
+    async def fetch_with_retry(self, *args, **kwargs) -> List[RawDocument]:
+        raise FetchError("HTTP 404", source="file_upload", status_code=404, error="not found")
+
+
+class TestExecuteErrors:
+    """Tests for FetchStage.execute error wrapping."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_context_is_kept(self, stage):
+        """Test that adapter error context survives wrapping, even an 'error' key."""
+        stage.adapters["file_upload"] = FailingAdapter
+
+        with pytest.raises(FetchStageError) as exc_info:
+            await stage.execute(source="file_upload", correlation_id="trace-test")
+
+        assert exc_info.value.message.startswith("Fetch failed:")
+        assert exc_info.value.context["status_code"] == 404
+        assert exc_info.value.context["source"] == "file_upload"
+
+    @pytest.mark.asyncio
+    async def test_unknown_source_is_unexpected_error(self, stage):
+        """Test that non-adapter failures are wrapped as unexpected errors."""
+        with pytest.raises(FetchStageError) as exc_info:
+            await stage.execute(source="carrier_pigeon", correlation_id="trace-test")
+
+        assert exc_info.value.message.startswith("Unexpected error:")
+        assert isinstance(exc_info.value.__cause__, FetchStageError)
@@ -0,0 +1,50 @@
+"""Unit Tests for ID Utilities
+
+Tests for the UUIDPool random ID source.
+
+Run with:
+    pytest tests/unit/test_ids.py -v
+"""
+
+import re
+import threading
+import uuid
+
+from utils.ids import UUIDPool
+
+
+class TestUUIDPool:
+    """Tests for UUIDPool."""
+
+    def test_hex12_format_and_uniqueness(self):
+        """Test that IDs are 12 hex characters and unique across refills."""
+        pool = UUIDPool(batch=4)
+        ids = [pool.next_hex12() for _ in range(50)]
+
+        assert all(re.fullmatch(r"[0-9a-f]{12}", value) for value in ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_next_uuid_is_version_4(self):
+        """Test that full IDs parse as version 4 UUIDs."""
+        pool = UUIDPool(batch=2)
+        values = [uuid.UUID(pool.next_uuid()) for _ in range(5)]
+
+        assert all(value.version == 4 for value in values)
+        assert len(set(values)) == len(values)
+
+    def test_threads_draw_separate_ids(self):
+        """Test that concurrent threads never hand out the same ID."""
+        pool = UUIDPool(batch=8)
+        results = [[] for _ in range(4)]
+
+        def draw(out):
+            out.extend(pool.next_hex12() for _ in range(100))
+
+        threads = [threading.Thread(target=draw, args=(out,)) for out in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [value for out in results for value in out]
+        assert len(set(ids)) == len(ids) == 400
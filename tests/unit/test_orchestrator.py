@@ -0,0 +1,183 @@
+"""Unit Tests for the Pipeline Orchestrator
+
+Tests for stage sequencing in PipelineOrchestrator, using fake fetch,
+embedding and DataForge services around the real stages.
+
+Run with:
+    pytest tests/unit/test_orchestrator.py -v
+"""
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+import pytest
+
+from models.document import ProcessingStatus, RawDocument, StoredDocument
+from pipeline.chunk import ChunkStage
+from pipeline.clean import CleanStage
+from pipeline.embed import EmbedStage
+from pipeline.orchestrator import PipelineError, PipelineOrchestrator
+from pipeline.store import StoreStage, StoreStageError
+from services.dataforge_client import DataForgeError
+
+
+class FakeFetchStage:
+    """Fetch stage stand-in that returns fixed documents."""
+
+    def __init__(self, documents: List[RawDocument]):
+        self.documents = documents
+
+    async def execute(self, source, correlation_id, job_id=None, tenant_id=None, stats=None, **source_params):
+        return self.documents
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeEmbeddingService:
+    """Embedding service stand-in that logs each batch it generates."""
+
+    model = "text-embedding-3-small"
+
+    def __init__(self, events: List[str], batch_size: int = 2, fail: bool = False, pause: bool = False):
+        self.events = events
+        self.batch_size = batch_size
+        self.fail = fail
+        self.pause = pause
+
+    async def generate_embeddings_streaming(
+        self,
+        texts: List[str],
+        correlation_id: str,
+        model: Optional[str] = None
+    ) -> AsyncIterator[List[List[float]]]:
+        for i in range(0, len(texts), self.batch_size):
+            if self.pause:
+                # Let other tasks run, as a provider request would
+                await asyncio.sleep(0)
+            if self.fail and i:
+                raise RuntimeError("embedding provider unavailable")
+            batch = texts[i:i + self.batch_size]
+            self.events.append(f"embed {len(batch)}")
+            yield [[0.1] * 1536 for _ in batch]
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeDataForgeClient:
+    """DataForge client stand-in that logs each write."""
+
+    def __init__(self, events: List[str], fail: bool = False):
+        self.events = events
+        self.fail = fail
+        self.documents: List[StoredDocument] = []
+
+    async def store_embeddings(self, embeddings, correlation_id, tenant_id=None):
+        if self.fail:
+            raise DataForgeError("DataForge API error: HTTP 503")
+        self.events.append(f"store {len(embeddings)}")
+        return {"count": len(embeddings)}
+
+    async def store_documents_metadata_batch(self, documents, correlation_id):
+        self.documents.extend(documents)
+        return {"count": len(documents)}
+
+    async def close(self) -> None:
+        pass
+
+
+def make_orchestrator(events, embed_fail=False, store_fail=False, batch_size=2, embed_pause=False):
+    """Build an orchestrator around two short documents."""
+    documents = [
+        RawDocument(
+            id=f"doc-{i}",
+            source="file_upload",
+            content=" ".join(f"Sentence {j} of document {i}." for j in range(40))
+        )
+        for i in range(2)
+    ]
+    dataforge = FakeDataForgeClient(events, fail=store_fail)
+    orchestrator = PipelineOrchestrator(
+        fetch_stage=FakeFetchStage(documents),
+        clean_stage=CleanStage(),
+        chunk_stage=ChunkStage(chunk_size=100, overlap=0, min_chunk_size=1),
+        embed_stage=EmbedStage(embedding_service=FakeEmbeddingService(events, batch_size=batch_size, fail=embed_fail, pause=embed_pause)),
+        store_stage=StoreStage(dataforge_client=dataforge),
+        queue_size=1
+    )
+    return orchestrator, dataforge
+
+
+class TestRun:
+    """Tests for PipelineOrchestrator.run."""
+
+    @pytest.mark.asyncio
+    async def test_stores_batches_as_they_are_embedded(self):
+        """Test that storing starts before the last batch is embedded."""
+        events: List[str] = []
+        orchestrator, dataforge = make_orchestrator(events)
+
+        result = await orchestrator.run(source="file_upload", tenant_id="tenant-test")
+
+        assert result["status"] == "completed"
+        assert result["stages_completed"] == ["fetch", "clean", "chunk", "embed", "store"]
+        assert result["embeddings_generated"] == result["chunks_created"] > 2
+        assert result["documents_stored"] == 2
+        assert events.index("store 2") < max(i for i, e in enumerate(events) if e.startswith("embed"))
+        assert sum(doc.embedding_count for doc in dataforge.documents) == result["chunks_created"]
+
+    @pytest.mark.asyncio
+    async def test_single_batch_job_stores_inline(self):
+        """Test that a job fitting one embedding batch embeds then stores once."""
+        events: List[str] = []
+        orchestrator, dataforge = make_orchestrator(events, batch_size=100)
+
+        result = await orchestrator.run(source="file_upload", tenant_id="tenant-test")
+
+        assert result["status"] == "completed"
+        assert result["stages_completed"] == ["fetch", "clean", "chunk", "embed", "store"]
+        assert events == [f"embed {result['chunks_created']}", f"store {result['chunks_created']}"]
+        assert result["documents_stored"] == 2
+
+    @pytest.mark.asyncio
+    async def test_embed_failure_stops_store(self):
+        """Test that batches still queued when embedding fails are not stored."""
+        events: List[str] = []
+        orchestrator, dataforge = make_orchestrator(events, embed_fail=True)
+
+        with pytest.raises(PipelineError) as exc_info:
+            await orchestrator.run(source="file_upload", tenant_id="tenant-test")
+
+        assert exc_info.value.context["failed_stage"] == 4
+        assert not any(event.startswith("store") for event in events)
+        assert dataforge.documents == []
+
+    @pytest.mark.asyncio
+    async def test_embed_failure_marks_stored_documents_failed(self):
+        """Test that documents with stored embeddings are recorded as failed."""
+        events: List[str] = []
+        orchestrator, dataforge = make_orchestrator(events, embed_fail=True, embed_pause=True)
+
+        with pytest.raises(PipelineError) as exc_info:
+            await orchestrator.run(source="file_upload", tenant_id="tenant-test")
+
+        assert exc_info.value.context["failed_stage"] == 4
+        assert events == ["embed 2", "store 2"]
+        assert [doc.id for doc in dataforge.documents] == ["doc-0"]
+        assert dataforge.documents[0].status == ProcessingStatus.FAILED
+        assert dataforge.documents[0].embedding_count == 2
+        assert "embedding provider unavailable" in dataforge.documents[0].error_message
+
+    @pytest.mark.asyncio
+    async def test_store_failure_stops_embedding(self):
+        """Test that a storage failure ends the job at stage 5."""
+        events: List[str] = []
+        orchestrator, dataforge = make_orchestrator(events, store_fail=True)
+
+        with pytest.raises(PipelineError) as exc_info:
+            await orchestrator.run(source="file_upload", tenant_id="tenant-test")
+
+        assert exc_info.value.context["failed_stage"] == 5
+        assert isinstance(exc_info.value.__cause__, StoreStageError)
+        assert dataforge.documents == []
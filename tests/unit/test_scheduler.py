@@ -0,0 +1,29 @@
+"""Unit Tests for the Scheduler
+
+Tests for cron trigger parsing in the Rake scheduler.
+
+Run with:
+    pytest tests/unit/test_scheduler.py -v
+"""
+
+import pytest
+
+from scheduler import _parse_cron_trigger
+
+
+class TestParseCronTrigger:
+    """Tests for _parse_cron_trigger."""
+
+    def test_repeated_expression_reuses_trigger(self):
+        """Test that the same expression returns the same parsed trigger."""
+        trigger = _parse_cron_trigger("0 2 * * *")
+
+        assert _parse_cron_trigger("0 2 * * *") is trigger
+        assert _parse_cron_trigger("30 2 * * *") is not trigger
+        assert str(trigger.fields[5]) == "2"
+
+    def test_invalid_expression_raises(self):
+        """Test that invalid expressions fail on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _parse_cron_trigger("not a cron")
@@ -0,0 +1,204 @@
+"""Unit Tests for the Semantic Chunker
+
+Tests for SemanticChunker, using a byte-level tiktoken encoding (one token
+per UTF-8 byte, so token windows regularly split multibyte characters) and
+a deterministic stand-in for the sentence transformer.
+
+Run with:
+    pytest tests/unit/test_semantic_chunker.py -v
+"""
+
+import hashlib
+from typing import List
+
+import numpy as np
+import pytest
+import tiktoken
+
+pytest.importorskip("sentence_transformers")
+
+from models.document import CleanedDocument, DocumentSource
+from pipeline import semantic_chunker
+from pipeline.semantic_chunker import ChunkingStrategy, SemanticChunker
+
+BYTE_ENCODING = tiktoken.Encoding(
+    name="bytes",
+    pat_str=r"\S+|\s+",
+    mergeable_ranks={bytes([i]): i for i in range(256)},
+    special_tokens={}
+)
+
+
+class StubEmbeddingModel:
+    """Sentence transformer stand-in with fixed per-sentence unit vectors."""
+
+    def __init__(self):
+        self.encoded: List[str] = []
+        self.batch_sizes: List[int] = []
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.encoded.extend(sentences)
+        self.batch_sizes.append(len(sentences))
+        vectors = np.stack([
+            np.random.default_rng(int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")).random(8)
+            for s in sentences
+        ]).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Patch the tokenizer and embedding model loaders with stubs."""
+    stub = StubEmbeddingModel()
+    monkeypatch.setattr(semantic_chunker, "_get_tokenizer", lambda name: BYTE_ENCODING)
+    monkeypatch.setattr(semantic_chunker, "_get_embedding_model", lambda name: stub)
+    return stub
+
+
+def make_document(content: str, doc_id: str = "doc-test") -> CleanedDocument:
+    """Build a cleaned document around the given content (which may be empty)."""
+    build = CleanedDocument if content else CleanedDocument.model_construct
+    return build(
+        id=doc_id,
+        source=DocumentSource.FILE_UPLOAD,
+        content=content,
+        word_count=len(content.split()),
+        char_count=len(content),
+        tenant_id="tenant-test"
+    )
+
+
+class TestChunkTokenBased:
+    """Tests for SemanticChunker._chunk_token_based."""
+
+    @pytest.mark.asyncio
+    async def test_windows_snap_to_character_boundaries(self, model):
+        """Test that windows splitting a character extend to the next character start."""
+        chunker = SemanticChunker(chunk_size=7, overlap=3, strategy=ChunkingStrategy.TOKEN_BASED)
+        document = make_document("Ünïcode façade — 日本語のテキスト, naïve café. " * 6)
+        data = document.content.encode("utf-8")
+        ids = BYTE_ENCODING.encode_ordinary(document.content)
+
+        chunks = await chunker.chunk_document(document)
+
+        starts = range(0, len(ids) - 3, 4)
+        assert len(chunks) == len(starts)
+        for chunk, start in zip(chunks, starts):
+            window = ids[start:start + 7]
+            first = semantic_chunker._char_boundary(data, start)
+            last = semantic_chunker._char_boundary(data, start + len(window))
+            assert chunk.content == data[first:last].decode("utf-8")
+            assert document.content[chunk.start_char:chunk.end_char] == chunk.content
+            assert chunk.token_count == len(window)
+        assert chunks[0].start_char == 0
+        assert chunks[-1].end_char == len(document.content)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("overlap", [5, 8])
+    async def test_overlap_not_below_chunk_size(self, model, overlap):
+        """Test that overlap >= chunk_size advances one token per window."""
+        chunker = SemanticChunker(chunk_size=5, overlap=overlap, strategy=ChunkingStrategy.TOKEN_BASED)
+        text = "abcdefghijkl"
+
+        chunks = await chunker.chunk_document(make_document(text))
+
+        assert [chunk.content for chunk in chunks] == [text[i:i + 5] for i in range(len(text) - 4)]
+        assert all(chunk.token_count == 5 for chunk in chunks)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", list(ChunkingStrategy))
+    @pytest.mark.parametrize("text", ["", "  \n\t "])
+    async def test_empty_document(self, model, strategy, text):
+        """Test that empty and blank documents produce no chunks."""
+        chunker = SemanticChunker(chunk_size=50, overlap=5, strategy=strategy)
+
+        assert await chunker.chunk_document(make_document(text)) == []
+        assert await chunker.chunk_documents([make_document(text)]) == [[]]
+        assert model.encoded == []
+
+
+def chunk_key(chunk):
+    """Fields that must match between chunking paths (IDs are random)."""
+    return (chunk.content, chunk.start_char, chunk.end_char, chunk.position, chunk.token_count, chunk.metadata)
+
+
+class TestDetectSemanticBoundaries:
+    """Tests for SemanticChunker._detect_semantic_boundaries."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("smoothing_window", [0, 2])
+    async def test_windows_match_full_matrix(self, model, smoothing_window):
+        """Test that overlapping 512-sentence windows give the full-matrix boundaries."""
+        chunker = SemanticChunker(
+            chunk_size=50,
+            strategy=ChunkingStrategy.SEMANTIC,
+            embedding_cache_size=0,
+            smoothing_window=smoothing_window
+        )
+        sentences = [f"Sentence {i} is about {'cats' if i % 3 else 'qubits'}." for i in range(1100)]
+
+        windowed = await chunker._detect_semantic_boundaries(sentences)
+        full = chunker._boundaries_from_embeddings(await chunker._embed_sentences(sentences))
+
+        assert model.batch_sizes[:3] == [512, 512, 78]
+        assert [b.position for b in windowed] == [b.position for b in full] == list(range(1099))
+        assert [b.is_boundary for b in windowed] == [b.is_boundary for b in full]
+        np.testing.assert_allclose(
+            [b.similarity_score for b in windowed],
+            [b.similarity_score for b in full],
+            rtol=1e-6
+        )
+
+
+class TestChunkDocuments:
+    """Tests for SemanticChunker.chunk_documents and chunk_many."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", list(ChunkingStrategy))
+    async def test_match_chunk_document(self, model, strategy):
+        """Test that batched and concurrent chunking give chunk_document's chunks."""
+        chunker = SemanticChunker(chunk_size=40, overlap=5, strategy=strategy, similarity_threshold=0.9)
+        documents = [
+            make_document(
+                " ".join(f"Line {i} is on {'cats' if (i + k) % 4 else 'qubits and lasers'}." for i in range(k * 7)) or "Short.",
+                doc_id=f"doc-{k}"
+            )
+            for k in range(6)
+        ]
+
+        single = [[chunk_key(c) for c in await chunker.chunk_document(doc)] for doc in documents]
+        batched = [[chunk_key(c) for c in chunks] for chunks in await chunker.chunk_documents(documents)]
+        concurrent = [[chunk_key(c) for c in chunks] for chunks in await chunker.chunk_many(documents, concurrency=2)]
+
+        assert [len(chunks) for chunks in single][-1] > 1
+        assert batched == single
+        assert concurrent == single
+
+
+class TestEmbedSentences:
+    """Tests for the SemanticChunker sentence embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted(self, model):
+        """Test that the cache keeps only the most recently used embeddings."""
+        chunker = SemanticChunker(chunk_size=50, strategy=ChunkingStrategy.SEMANTIC, embedding_cache_size=3)
+
+        first = await chunker._embed_sentences(["a.", "b.", "c.", "d."])
+        again = await chunker._embed_sentences(["a.", "d."])
+        await chunker._embed_sentences(["b."])
+
+        assert model.encoded == ["a.", "b.", "c.", "d.", "a.", "b."]
+        assert len(chunker._embed_cache) == 3
+        np.testing.assert_array_equal(again, first[[0, 3]])
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, model):
+        """Test that a cache size of zero keeps nothing and re-encodes repeats."""
+        chunker = SemanticChunker(chunk_size=50, strategy=ChunkingStrategy.SEMANTIC, embedding_cache_size=0)
+
+        embeddings = await chunker._embed_sentences(["a.", "b.", "a."])
+        await chunker._embed_sentences(["a."])
+
+        assert model.encoded == ["a.", "b.", "a."]
+        assert len(chunker._embed_cache) == 0
+        np.testing.assert_array_equal(embeddings[0], embeddings[2])
@@ -0,0 +1,174 @@
+"""Unit Tests for the Store Stage
+
+Tests for StoreStage, using a fake DataForge client that records the
+requests it receives.
+
+Run with:
+    pytest tests/unit/test_store_stage.py -v
+"""
+
+from typing import List
+
+import pytest
+
+from models.document import DocumentSource, Embedding, StoredDocument
+from pipeline.store import StoreStage, StoreStageError, _resolve_source
+from services.dataforge_client import DataForgeError
+
+
+class FakeDataForgeClient:
+    """DataForge client stand-in that records every call."""
+
+    def __init__(self, fail_metadata: bool = False, batch_status: int = 0):
+        self.fail_metadata = fail_metadata
+        self.batch_status = batch_status
+        self.calls: List[str] = []
+        self.documents: List[StoredDocument] = []
+
+    async def store_embeddings(self, embeddings, correlation_id, tenant_id=None):
+        self.calls.append(f"embeddings {len(embeddings)}")
+        return {"count": len(embeddings)}
+
+    async def store_documents_metadata_batch(self, documents, correlation_id):
+        if self.batch_status:
+            raise DataForgeError(f"DataForge API error: HTTP {self.batch_status}", status_code=self.batch_status)
+        if self.fail_metadata:
+            raise DataForgeError("DataForge API error: HTTP 503", status_code=503)
+        self.calls.append(f"documents {len(documents)}")
+        self.documents.extend(documents)
+        return {"count": len(documents)}
+
+    async def store_document_metadata(self, document, correlation_id):
+        self.calls.append("document 1")
+        self.documents.append(document)
+        return {"id": document.id}
+
+    async def close(self) -> None:
+        pass
+
+
+def make_embedding(chunk_id: str, document_id: str) -> Embedding:
+    """Build an embedding of a chunk of the given document."""
+    return Embedding(
+        chunk_id=chunk_id,
+        vector=[0.1] * 1536,
+        metadata={"document_id": document_id},
+        tenant_id="tenant-test"
+    )
+
+
+class TestBuildStoredDocuments:
+    """Tests for StoreStage._group_embeddings and _build_stored_documents."""
+
+    def test_counts_distinct_chunks(self):
+        """Test that repeated chunk IDs count once but every embedding is counted."""
+        stage = StoreStage(dataforge_client=FakeDataForgeClient())
+        embeddings = [
+            make_embedding("chunk-1", "doc-1"),
+            make_embedding("chunk-1", "doc-1"),
+            make_embedding("chunk-2", "doc-2"),
+        ]
+
+        groups = {}
+        StoreStage._group_embeddings(groups, embeddings[:2])
+        StoreStage._group_embeddings(groups, embeddings[2:])
+        docs = stage._build_stored_documents(groups, source=DocumentSource.API_FETCH, url="https://example.com")
+
+        assert [(doc.id, doc.chunk_count, doc.embedding_count) for doc in docs] == [("doc-1", 1, 2), ("doc-2", 1, 1)]
+        assert all(doc.source == DocumentSource.API_FETCH for doc in docs)
+        assert docs[0].tenant_id == "tenant-test"
+        assert docs[0].metadata == {"document_id": "doc-1"}
+
+    def test_single_document_batches(self):
+        """Test that batches of one document accumulate into the same group."""
+        stage = StoreStage(dataforge_client=FakeDataForgeClient())
+        groups = {}
+
+        StoreStage._group_embeddings(groups, [make_embedding("chunk-1", "doc-1"), make_embedding("chunk-2", "doc-1")])
+        StoreStage._group_embeddings(groups, [make_embedding("chunk-2", "doc-1"), make_embedding("chunk-3", "doc-1")])
+        StoreStage._group_embeddings(groups, [])
+        docs = stage._build_stored_documents(groups)
+
+        assert [(doc.id, doc.chunk_count, doc.embedding_count) for doc in docs] == [("doc-1", 3, 4)]
+
+
+class TestResolveSource:
+    """Tests for _resolve_source."""
+
+    def test_known_and_unknown_sources(self):
+        """Test that unknown source names fall back to file upload."""
+        assert _resolve_source("url_scrape") == DocumentSource.URL_SCRAPE
+        assert _resolve_source("unknown") == DocumentSource.FILE_UPLOAD
+
+
+class TestClient:
+    """Tests for StoreStage's DataForge client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_default_client_is_shared(self):
+        """Test that stages without a client share one that close() leaves open."""
+        first, second = StoreStage(), StoreStage()
+        client = first.dataforge_client
+        await client._get_client()
+
+        await first.close()
+
+        assert second.dataforge_client is client
+        assert client._client is not None
+        await client.close()
+
+
+class TestExecute:
+    """Tests for StoreStage.execute."""
+
+    @pytest.mark.asyncio
+    async def test_metadata_written_in_one_batch(self):
+        """Test that every document's metadata goes out in a single request."""
+        client = FakeDataForgeClient()
+        stage = StoreStage(dataforge_client=client)
+        embeddings = [
+            make_embedding("chunk-1", "doc-1"),
+            make_embedding("chunk-2", "doc-1"),
+            make_embedding("chunk-3", "doc-2"),
+        ]
+
+        stored = await stage.execute(embeddings, correlation_id="trace-test", source="url_scrape")
+
+        assert client.calls == ["embeddings 3", "documents 2"]
+        assert [doc.id for doc in stored] == ["doc-1", "doc-2"]
+        assert [doc.chunk_count for doc in stored] == [2, 1]
+        assert stored[0].source == DocumentSource.URL_SCRAPE
+        assert client.documents == stored
+
+    @pytest.mark.asyncio
+    async def test_no_embeddings(self):
+        """Test that an empty batch writes nothing."""
+        client = FakeDataForgeClient()
+        stage = StoreStage(dataforge_client=client)
+
+        assert await stage.execute([], correlation_id="trace-test") == []
+        assert client.calls == []
+
+    @pytest.mark.asyncio
+    async def test_metadata_failure_raises(self):
+        """Test that a failed metadata batch fails the stage with its context."""
+        stage = StoreStage(dataforge_client=FakeDataForgeClient(fail_metadata=True))
+
+        with pytest.raises(StoreStageError) as exc_info:
+            await stage.execute([make_embedding("chunk-1", "doc-1")], correlation_id="trace-test")
+
+        assert exc_info.value.context["status_code"] == 503
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_batch_endpoint(self):
+        """Test that documents are written one by one if the batch endpoint is missing."""
+        client = FakeDataForgeClient(batch_status=404)
+        stage = StoreStage(dataforge_client=client)
+        embeddings = [make_embedding(f"chunk-{i}", f"doc-{i}") for i in range(3)]
+
+        stored = await stage.execute(embeddings, correlation_id="trace-test")
+        await stage.execute(embeddings, correlation_id="trace-test")
+
+        assert client.calls == ["embeddings 3", "document 1", "document 1", "document 1"] * 2
+        assert client.documents[:3] == stored
+        assert stage._batch_metadata_supported is False
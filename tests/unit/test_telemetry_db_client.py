@@ -0,0 +1,84 @@
+"""Unit Tests for the Database Telemetry Client
+
+Tests for direct and queued event writes in TelemetryDatabaseClient,
+against a temporary SQLite database.
+
+Run with:
+    pytest tests/unit/test_telemetry_db_client.py -v
+"""
+
+import sqlite3
+
+import pytest
+
+from services.telemetry_db_client import TelemetryDatabaseClient
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create a telemetry client backed by an empty events table."""
+    db_path = tmp_path / "dataforge.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE events (
+            event_id TEXT PRIMARY KEY,
+            timestamp TEXT,
+            service TEXT,
+            event_type TEXT,
+            severity TEXT,
+            correlation_id TEXT,
+            metadata TEXT,
+            metrics TEXT
+        )
+    """)
+    conn.commit()
+    conn.close()
+    return TelemetryDatabaseClient(db_path=str(db_path), flush_interval=60)
+
+
+def event_types(client):
+    """Read back the event types written so far."""
+    conn = sqlite3.connect(client.db_path)
+    rows = conn.execute("SELECT event_type FROM events ORDER BY rowid").fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+class TestEmit:
+    """Tests for TelemetryDatabaseClient event emission."""
+
+    @pytest.mark.asyncio
+    async def test_wait_writes_immediately(self, client):
+        """Test that the default emit writes before returning."""
+        assert await client.emit_job_started(job_id="job-1", source="file_upload", correlation_id="trace-test")
+        assert event_types(client) == ["job_started"]
+
+    @pytest.mark.asyncio
+    async def test_nowait_queues_until_flush(self, client):
+        """Test that wait=False events are written together on flush."""
+        await client.emit_job_started(
+            job_id="job-1", source="file_upload", correlation_id="trace-test", wait=False
+        )
+        await client.emit_phase_completed(
+            job_id="job-1", phase="fetch", phase_number=1, correlation_id="trace-test",
+            duration_ms=1.0, wait=False
+        )
+
+        assert event_types(client) == []
+
+        await client.close()
+
+        assert event_types(client) == ["job_started", "phase_completed"]
+        assert client._pending == []
+
+    @pytest.mark.asyncio
+    async def test_background_writer_drains_queue(self, client):
+        """Test that queued events are written without an explicit flush."""
+        client.flush_interval = 0
+
+        await client.emit_job_started(
+            job_id="job-1", source="file_upload", correlation_id="trace-test", wait=False
+        )
+        await client._flusher
+
+        assert event_types(client) == ["job_started"]
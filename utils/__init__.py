@@ -3,6 +3,12 @@
 Provides common utilities for retry logic, text processing, and more.
 """
 
+from utils.concurrency import SharedSemaphore
+
+from utils.http import SharedTransport
+
+from utils.ids import UUIDPool, id_pool
+
 from utils.retry import (
     retry_with_backoff,
     retry_sync_with_backoff,
@@ -22,6 +28,16 @@ from utils.text_processing import (
 )
 
 __all__ = [
+    # Concurrency utilities
+    "SharedSemaphore",
+
+    # HTTP utilities
+    "SharedTransport",
+
+    # ID utilities
+    "UUIDPool",
+    "id_pool",
+
     # Retry utilities
     "retry_with_backoff",
     "retry_sync_with_backoff",
@@ -0,0 +1,60 @@
+"""Concurrency Utilities for Rake Service
+
+Provides concurrency limits that are shared across object instances.
+
+Example:
+    >>> from utils.concurrency import SharedSemaphore
+    >>>
+    >>> class Fetcher:
+    ...     _limit = SharedSemaphore(8)
+    ...
+    ...     async def fetch(self):
+    ...         async with self._limit:
+    ...             return await api_call()
+"""
+
+import asyncio
+import weakref
+
+
+class SharedSemaphore:
+    """Async context manager that bounds concurrency across instances.
+
+    Intended as a class attribute, so every instance of the owning class
+    draws from the same pool of slots. asyncio.Semaphore binds to the
+    event loop it is first used on, so one semaphore is created lazily
+    per running loop rather than at import time.
+
+    Attributes:
+        limit: Maximum number of concurrent holders per event loop
+
+    Example:
+        >>> limit = SharedSemaphore(4)
+        >>> async with limit:
+        ...     await do_work()
+    """
+
+    def __init__(self, limit: int):
+        """Initialize shared semaphore.
+
+        Args:
+            limit: Maximum number of concurrent holders per event loop
+        """
+        self.limit = limit
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get(self) -> asyncio.Semaphore:
+        """Get the semaphore for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+    async def __aenter__(self) -> None:
+        await self._get().acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._get().release()
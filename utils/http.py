@@ -0,0 +1,65 @@
+"""HTTP Utilities for Rake Service
+
+Provides a connection pool that several httpx clients can share, so
+adapters with different headers and timeouts still reuse keep-alive
+connections (and their TLS sessions) to the same hosts.
+
+Example:
+    >>> from utils.http import SharedTransport
+    >>>
+    >>> transport = SharedTransport(max_connections=100)
+    >>> client = httpx.AsyncClient(transport=transport, headers={"User-Agent": "Rake/1.0"})
+    >>> await client.aclose()     # leaves the pool open
+    >>> await transport.close()   # owner closes the pool
+"""
+
+import httpx
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that lends one connection pool to many clients.
+
+    httpx.AsyncClient.aclose() closes its transport, which would tear the
+    pool down under every other client using it. Here aclose() is a no-op
+    and the owner of the pool calls close() once at shutdown.
+
+    TLS verification is a transport setting, so clients that need
+    different certificate handling must not share this transport.
+
+    Example:
+        >>> transport = SharedTransport(max_connections=50, keepalive_expiry=30.0)
+        >>> async with httpx.AsyncClient(transport=transport) as client:
+        ...     response = await client.get("https://example.com")
+        >>> await transport.close()
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0
+    ):
+        """Initialize shared transport.
+
+        Args:
+            max_connections: Maximum open connections across all hosts
+            max_keepalive_connections: Maximum idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+        """
+        self._transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Ignore close requests from the clients borrowing the pool."""
+
+    async def close(self) -> None:
+        """Close the pool and all of its connections."""
+        await self._transport.aclose()